@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Benchmark support cutting on a support-heavy synthetic board.
+
+Builds a resolution SoA where three in four units support and the rest move
+into a supporter's territory, then times cut_supports against the previous
+scan over every move for each support order.
+"""
+
+import argparse
+import timeit
+
+from diplomacy_cli.core.logic.schema import (
+    OrderType,
+    OutcomeType,
+    ResolutionSoA,
+    UnitType,
+)
+from diplomacy_cli.core.logic.validator.resolution import (
+    cut_supports,
+    make_resolution_maps,
+)
+
+
+def scan_cut_supports(
+    soa: ResolutionSoA, move_by_origin: dict[str, int]
+) -> list[bool]:
+    n = len(soa.order_type)
+    support_cut = [False] * n
+    for i in range(n):
+        order_type = soa.order_type[i]
+        if order_type not in (OrderType.SUPPORT_MOVE, OrderType.SUPPORT_HOLD):
+            continue
+
+        supporter_territory = soa.orig_territory[i]
+        support_target = soa.support_destination[i]
+
+        for move_origin, move_idx in move_by_origin.items():
+            if soa.new_territory[move_idx] != supporter_territory:
+                continue
+            if soa.outcome[move_idx] == OutcomeType.MOVE_NO_CONVOY:
+                continue
+            if move_origin == support_target:
+                continue
+
+            support_cut[i] = True
+            break
+
+    return support_cut
+
+
+def support_board(units: int) -> ResolutionSoA:
+    orig_territory = [f"t{i}" for i in range(units)]
+    order_type = []
+    move_destination: list[str | None] = []
+    support_origin: list[str | None] = []
+    support_destination: list[str | None] = []
+    for i in range(units):
+        neighbor = orig_territory[(i + 1) % units]
+        if i % 4 == 0:
+            order_type.append(OrderType.MOVE)
+            move_destination.append(neighbor)
+            support_origin.append(None)
+            support_destination.append(None)
+        elif i % 4 == 3:
+            order_type.append(OrderType.SUPPORT_HOLD)
+            move_destination.append(None)
+            support_origin.append(neighbor)
+            support_destination.append(None)
+        else:
+            order_type.append(OrderType.SUPPORT_MOVE)
+            move_destination.append(None)
+            support_origin.append(orig_territory[i - i % 4])
+            support_destination.append(orig_territory[i - i % 4 + 1])
+    return ResolutionSoA(
+        unit_id=[f"u{i}" for i in range(units)],
+        owner_id=[f"p{i % 7}" for i in range(units)],
+        unit_type=[UnitType.ARMY] * units,
+        orig_territory=orig_territory,
+        order_type=order_type,
+        move_destination=move_destination,
+        support_origin=support_origin,
+        support_destination=support_destination,
+        convoy_origin=[None] * units,
+        convoy_destination=[None] * units,
+        new_territory=[
+            dest or orig for dest, orig in zip(move_destination, orig_territory)
+        ],
+        strength=[1] * units,
+        dislodged=[False] * units,
+        dislodged_by=[-1] * units,
+        support_cut=[False] * units,
+        convoy_path_flat=[],
+        convoy_path_start=[-1] * units,
+        convoy_path_len=[0] * units,
+        outcome=[None] * units,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--units", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    soa = support_board(args.units)
+    maps = make_resolution_maps(soa)
+    assert cut_supports(soa, maps) == scan_cut_supports(
+        soa, maps.move_by_origin
+    )
+
+    print(f"units: {args.units}  supports: {len(maps.support_idxs)}")
+    before = (
+        timeit.timeit(
+            lambda: scan_cut_supports(soa, maps.move_by_origin),
+            number=args.repeat,
+        )
+        / args.repeat
+    )
+    after = (
+        timeit.timeit(lambda: cut_supports(soa, maps), number=args.repeat)
+        / args.repeat
+    )
+    print(f"move scan:        {before * 1e3:8.3f} ms per pass")
+    print(f"indexed:          {after * 1e3:8.3f} ms per pass")
+    print(f"speedup:          {before / after:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
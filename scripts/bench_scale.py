@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Benchmark rules loading, semantic validation and move resolution on
+generated variants of increasing size.
+
+Each size is generated into a temporary variant root, loaded with the disk
+cache disabled, populated with one unit per supply center and run through a
+full movement-phase order set. Loading is timed once; validation and
+resolution run once to warm up and report the best of --repeat runs.
+"""
+
+import argparse
+import tempfile
+import time
+import timeit
+from pathlib import Path
+
+from diplomacy_cli.core.logic.map_generator import (
+    generate_variant,
+    write_variant,
+)
+from diplomacy_cli.core.logic.rules_loader import load_rules
+from diplomacy_cli.core.logic.schema import (
+    GameState,
+    LoadedState,
+    ResolutionBackend,
+    Rules,
+    UnitType,
+)
+from diplomacy_cli.core.logic.state import (
+    build_counters,
+    build_territory_to_unit,
+)
+from diplomacy_cli.core.logic.turn_code import Phase
+from diplomacy_cli.core.logic.validator.orchestrator import make_semantic_map
+from diplomacy_cli.core.logic.validator.resolution import resolve_move_phase
+from diplomacy_cli.core.logic.validator.semantic import (
+    build_validation_context,
+    validate_semantic,
+)
+from diplomacy_cli.core.logic.validator.syntax import parse_syntax
+from diplomacy_cli.core.logic.variants import add_variant_root
+
+
+def populate(rules: Rules, variant: str) -> tuple[LoadedState, list]:
+    owners = sorted(rules.nation_display_names)
+    units = {}
+    for i, tid in enumerate(sorted(rules.supply_centers)):
+        fleet = tid in rules.fleet_adjacency and i % 2
+        unit_type = UnitType.FLEET if fleet else UnitType.ARMY
+        owner = owners[i % len(owners)]
+        units[f"{owner}_{unit_type.value}_{i}"] = {
+            "owner_id": owner,
+            "unit_type": unit_type,
+            "territory_id": tid,
+        }
+    game = GameState(
+        players={o: {"nation_id": o, "status": "active"} for o in owners},
+        units=units,
+        territory_state={},
+        raw_orders={},
+        game_meta={"game_id": "bench", "variant": variant},
+    )
+    territory_to_unit = build_territory_to_unit(units)
+    state = LoadedState(game, territory_to_unit, build_counters(units))
+
+    holding = {
+        unit["territory_id"]
+        for i, unit in enumerate(units.values())
+        if i % 3 == 2
+    }
+    orders = []
+    for i, unit in enumerate(units.values()):
+        origin = unit["territory_id"]
+        if unit["unit_type"] == UnitType.ARMY:
+            reachable = rules.army_adjacency.get(origin, frozenset())
+        else:
+            reachable = rules.fleet_adjacency.get(origin, frozenset())
+        supportable = sorted(reachable & holding)
+        if i % 3 == 0 and supportable:
+            raw = f"{origin} s {supportable[0]}"
+        elif i % 3 == 1 and reachable:
+            raw = f"{origin} - {min(reachable)}"
+        else:
+            raw = f"{origin} hold"
+        player = unit["owner_id"]
+        orders.append((player, parse_syntax(player, raw, Phase.MOVEMENT)))
+    return state, orders
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[100, 1000, 10000]
+    )
+    parser.add_argument("--nations", type=int, default=7)
+    parser.add_argument("--coast-density", type=float, default=0.05)
+    parser.add_argument("--sea-fraction", type=float, default=0.3)
+    parser.add_argument("--sea-regions", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--backend",
+        type=ResolutionBackend,
+        choices=list(ResolutionBackend),
+        default=ResolutionBackend.PYTHON,
+    )
+    args = parser.parse_args()
+
+    root = Path(tempfile.mkdtemp(prefix="dcli-variants-"))
+    add_variant_root(root)
+    print(
+        f"{'size':>6} {'units':>6} {'load':>9} {'semantic':>9} {'resolve':>9}"
+    )
+    for size in args.sizes:
+        variant = f"synthetic_{size}"
+        files = generate_variant(
+            size,
+            args.nations,
+            args.coast_density,
+            args.sea_fraction,
+            args.sea_regions,
+            seed=args.seed,
+        )
+        write_variant(files, root, variant)
+
+        start = time.perf_counter()
+        rules = load_rules(variant, cache_dir=None)
+        loaded = time.perf_counter()
+
+        state, orders = populate(rules, variant)
+
+        def semantic():
+            ctx = build_validation_context(state)
+            return [
+                validate_semantic(player, syntax, rules, state, ctx)
+                for player, syntax in orders
+            ]
+
+        validated = semantic()
+        sem_by_unit, _ = make_semantic_map(
+            state, [v for v in validated if v.valid]
+        )
+
+        def resolve():
+            resolve_move_phase(sem_by_unit, state, rules, backend=args.backend)
+
+        resolve()
+        semantic_time, resolve_time = (
+            min(timeit.repeat(run, number=1, repeat=args.repeat))
+            for run in (semantic, resolve)
+        )
+        print(
+            f"{size:>6} {len(state.game.units):>6} "
+            f"{(loaded - start) * 1e3:>7.1f}ms "
+            f"{semantic_time * 1e3:>7.1f}ms "
+            f"{resolve_time * 1e3:>7.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
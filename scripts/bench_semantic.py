@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark semantic validation of a full 34-unit order set on the classic map.
+
+Runs the order set through validate_semantic with the precomputed per-unit-type
+adjacency, then again with the previous edge-scanning adjacency check patched
+in, and prints both timings.
+"""
+
+import argparse
+import timeit
+from unittest import mock
+
+from diplomacy_cli.core.logic.rules_loader import load_rules
+from diplomacy_cli.core.logic.schema import (
+    GameState,
+    LoadedState,
+    Rules,
+    UnitType,
+)
+from diplomacy_cli.core.logic.state import (
+    build_counters,
+    build_territory_to_unit,
+)
+from diplomacy_cli.core.logic.turn_code import Phase
+from diplomacy_cli.core.logic.validator import semantic
+from diplomacy_cli.core.logic.validator.syntax import parse_syntax
+
+
+def edge_scan_adjacency_issue(origin, target, rules, ctx, allow_convoy=False):
+    issue = semantic._territory_issue(rules.territory_ids, origin, target)
+    if issue:
+        return issue
+    unit_type = ctx.unit_type_by_territory[origin]
+
+    for a, b, edge_type in rules.edges:
+        if {a, b} == {origin, target}:
+            if unit_type == UnitType.ARMY and edge_type in ("land", "both"):
+                return None
+            if unit_type == UnitType.FLEET and edge_type in ("sea", "both"):
+                return None
+
+    if allow_convoy and unit_type == UnitType.ARMY:
+        if semantic._has_sea_path(origin, target, rules):
+            return None
+        return semantic.SemanticIssue(
+            semantic.SemanticErrorCode.NO_CONVOY_ROUTE, (origin, target)
+        )
+    return semantic._unreachable(unit_type, origin, target)
+
+
+def full_board(rules: Rules) -> tuple[LoadedState, list[tuple[str, str]]]:
+    owners = sorted(rules.nation_display_names)
+    units = {}
+    for i, tid in enumerate(sorted(rules.supply_centers)):
+        unit_type = (
+            UnitType.FLEET
+            if tid in rules.has_coast and i % 2
+            else UnitType.ARMY
+        )
+        owner = owners[i % len(owners)]
+        units[f"{owner}_{unit_type.value}_{i}"] = {
+            "owner_id": owner,
+            "unit_type": unit_type,
+            "territory_id": tid,
+        }
+    game = GameState(
+        players={o: {"nation_id": o, "status": "active"} for o in owners},
+        units=units,
+        territory_state={},
+        raw_orders={},
+        game_meta={"game_id": "bench", "variant": "classic"},
+    )
+    territory_to_unit = build_territory_to_unit(units)
+    state = LoadedState(game, territory_to_unit, build_counters(units))
+
+    orders = []
+    for i, unit in enumerate(units.values()):
+        origin = unit["territory_id"]
+        if unit["unit_type"] == UnitType.ARMY:
+            reachable = rules.army_adjacency.get(origin, frozenset())
+        else:
+            reachable = rules.fleet_adjacency.get(origin, frozenset())
+        occupied = sorted(t for t in reachable if t in territory_to_unit)
+        if i % 3 == 0 and occupied:
+            orders.append((unit["owner_id"], f"{origin} s {occupied[0]}"))
+        elif reachable:
+            orders.append((unit["owner_id"], f"{origin} - {min(reachable)}"))
+        else:
+            orders.append((unit["owner_id"], f"{origin} hold"))
+    return state, orders
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    rules = load_rules("classic")
+    state, orders = full_board(rules)
+    syntax = [
+        (player, parse_syntax(player, raw, Phase.MOVEMENT))
+        for player, raw in orders
+    ]
+
+    def run() -> None:
+        ctx = semantic.build_validation_context(state)
+        for player, parsed in syntax:
+            semantic.validate_semantic(player, parsed, rules, state, ctx)
+
+    print(f"units: {len(state.game.units)}  orders: {len(syntax)}")
+    after = timeit.timeit(run, number=args.repeat) / args.repeat
+    with mock.patch.object(
+        semantic, "_adjacency_issue", edge_scan_adjacency_issue
+    ):
+        before = timeit.timeit(run, number=args.repeat) / args.repeat
+    print(f"edge scan:        {before * 1e3:8.3f} ms per order set")
+    print(f"unit adjacency:   {after * 1e3:8.3f} ms per order set")
+    print(f"speedup:          {before / after:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
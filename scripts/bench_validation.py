@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark serial and process-sharded order validation on generated variants.
+
+Each size is populated as in bench_scale.py and its movement orders are
+validated serially, then across a pool from validation_executor() whose
+workers received the rules once at start-up, and finally across the same pool
+with the rules pickled into every shard as before. The pool is warmed up
+before timing and each column reports the best of --repeat runs. The caller
+column is the CPU time the sharded path spends in this process, which bounds
+its wall time once there are enough cores for the workers.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import timeit
+from collections import defaultdict
+from pathlib import Path
+
+from bench_scale import populate
+
+from diplomacy_cli.core.logic.map_generator import (
+    generate_variant,
+    write_variant,
+)
+from diplomacy_cli.core.logic.rules_loader import load_rules
+from diplomacy_cli.core.logic.turn_code import Phase
+from diplomacy_cli.core.logic.validator.orchestrator import (
+    _validate_shard,
+    shard_player_orders,
+    validate_phase_orders,
+    validation_executor,
+    validation_snapshot,
+)
+from diplomacy_cli.core.logic.validator.semantic import (
+    build_validation_context,
+)
+from diplomacy_cli.core.logic.variants import add_variant_root
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--nations", type=int, default=7)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    root = Path(tempfile.mkdtemp(prefix="dcli-variants-"))
+    add_variant_root(root)
+    print(f"workers: {args.workers}")
+    print(
+        f"{'size':>6} {'orders':>6} {'serial':>9} {'sharded':>9} "
+        f"{'caller':>9} {'pickled':>9}"
+    )
+    for size in args.sizes:
+        variant = f"synthetic_{size}"
+        files = generate_variant(size, args.nations, seed=args.seed)
+        write_variant(files, root, variant)
+        rules = load_rules(variant, cache_dir=None)
+        state, orders = populate(rules, variant)
+        raw_orders = defaultdict(list)
+        for player, syntax in orders:
+            raw_orders[player].append(syntax.raw)
+        state.game.raw_orders.update(raw_orders)
+
+        def serial():
+            validate_phase_orders(state, rules, Phase.MOVEMENT)
+
+        with validation_executor(rules, args.workers) as executor:
+
+            def sharded():
+                validate_phase_orders(
+                    state, rules, Phase.MOVEMENT, executor, args.workers
+                )
+
+            def pickled():
+                state_ctx = (
+                    validation_snapshot(state),
+                    build_validation_context(state),
+                )
+                futures = [
+                    executor.submit(
+                        _validate_shard, rules, state_ctx, shard, Phase.MOVEMENT
+                    )
+                    for shard in shard_player_orders(
+                        state.game.raw_orders, args.workers
+                    )
+                ]
+                for future in futures:
+                    future.result()
+
+            sharded()
+            times = [
+                min(timeit.repeat(run, number=1, repeat=args.repeat))
+                for run in (serial, sharded, pickled)
+            ]
+            times.insert(
+                2,
+                min(
+                    timeit.repeat(
+                        sharded,
+                        timer=time.process_time,
+                        number=1,
+                        repeat=args.repeat,
+                    )
+                ),
+            )
+        print(
+            f"{size:>6} {len(orders):>6} "
+            + " ".join(f"{t * 1e3:>7.1f}ms" for t in times)
+        )
+
+
+if __name__ == "__main__":
+    main()
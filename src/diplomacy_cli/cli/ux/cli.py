@@ -1,4 +1,15 @@
-from diplomacy_cli.core.logic.schema import LoadedState
+try:
+    import readline
+except ImportError:
+    readline = None
+
+from diplomacy_cli.core.logic.completion import (
+    build_completion_index,
+    complete_token,
+)
+from diplomacy_cli.core.logic.order_import import import_orders
+from diplomacy_cli.core.logic.rules_loader import load_rules
+from diplomacy_cli.core.logic.schema import CompletionIndex, LoadedState
 from diplomacy_cli.core.logic.state import (
     load_state,
     process_turn,
@@ -79,6 +90,7 @@ def manage_save(game_id):
         print("2. Manage orders")
         print("3. Process turn")
         print("4. Delete game")
+        print("5. Import orders")
         print("0. Back to menu")
         print("--------------------")
         choice = input("Choose an option: ").strip()
@@ -100,12 +112,34 @@ def manage_save(game_id):
                 return
             else:
                 print("Input did not match")
+        elif choice == "5":
+            import_orders_file(game_id)
         elif choice == "0":
             return
         else:
             print("Invalid choice")
 
 
+def import_orders_file(game_id):
+    path = input("Orders file (- for stdin): ").strip()
+    if not path:
+        print("Path cannot be blank")
+        return
+    state = load_state(game_id)
+    rules = load_rules(state.game.game_meta["variant"])
+    try:
+        report = import_orders(path, game_id, state, rules)
+    except FileNotFoundError:
+        print(f"No such file: {path}")
+        return
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"Could not import {path}: {e}")
+        return
+    print(f"Imported {report.accepted} orders, rejected {report.rejected}")
+    for line_no, error in report.errors:
+        print(f"  line {line_no}: {error}")
+
+
 def choose_player(loaded_state: LoadedState):
     while True:
         print(f"\n--- {loaded_state.game.game_meta['turn_code']} ---")
@@ -121,6 +155,33 @@ def choose_player(loaded_state: LoadedState):
             print("Invalid choice")
 
 
+def order_completer(index: CompletionIndex):
+    matches: list[str] = []
+
+    def completer(text: str, state: int) -> str | None:
+        nonlocal matches
+        if state == 0:
+            matches = complete_token(index, text)
+        return matches[state] if state < len(matches) else None
+
+    return completer
+
+
+def input_order(prompt: str, index: CompletionIndex) -> str:
+    if readline is None:
+        return input(prompt)
+    previous = readline.get_completer()
+    delims = readline.get_completer_delims()
+    readline.set_completer(order_completer(index))
+    readline.set_completer_delims("")
+    readline.parse_and_bind("tab: complete")
+    try:
+        return input(prompt)
+    finally:
+        readline.set_completer(previous)
+        readline.set_completer_delims(delims)
+
+
 def manage_orders(loaded_state: LoadedState, player: str):
     players = loaded_state.game.players
     if player not in players.keys():
@@ -135,6 +196,8 @@ def manage_orders(loaded_state: LoadedState, player: str):
     if player not in loaded_state.game.raw_orders:
         loaded_state.game.raw_orders[player] = []
     player_orders = loaded_state.game.raw_orders[player]
+    rules = load_rules(loaded_state.game.game_meta["variant"])
+    completion_index = build_completion_index(player, loaded_state, rules)
 
     while True:
         print(format_orders(player_orders, player))
@@ -144,7 +207,7 @@ def manage_orders(loaded_state: LoadedState, player: str):
         print("0. Go back")
         choice = input("Choose an option: ").strip()
         if choice == "1":
-            new_order = input("Add a new order: ")
+            new_order = input_order("Add a new order: ", completion_index)
             player_orders.append(new_order)
             dirty = True
             continue
@@ -0,0 +1,83 @@
+import hashlib
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
+
+from .schema import AliasTrie
+from .validator.syntax import normalize_order_string
+
+COAST_NAMES = {
+    "nc": "north coast",
+    "sc": "south coast",
+    "ec": "east coast",
+    "wc": "west coast",
+}
+
+
+def territory_aliases(
+    territory_display_names: dict[str, str],
+    coast_to_parent: dict[str, str],
+    extra_aliases: dict[str, list[str]],
+) -> dict[str, set[str]]:
+    aliases: dict[str, set[str]] = defaultdict(set)
+    for tid, display_name in territory_display_names.items():
+        aliases[tid].add(tid)
+        aliases[tid].add(normalize_order_string(display_name))
+        parent = coast_to_parent.get(tid)
+        if parent is None:
+            continue
+        coast = tid[len(parent) + 1 :]
+        parent_name = normalize_order_string(
+            territory_display_names.get(parent, parent)
+        )
+        for base in (parent, parent_name):
+            aliases[tid].add(f"{base} {coast}")
+            if coast in COAST_NAMES:
+                aliases[tid].add(f"{base} {COAST_NAMES[coast]}")
+    for tid, extra in extra_aliases.items():
+        for alias in extra:
+            aliases[tid].add(normalize_order_string(alias))
+    return dict(aliases)
+
+
+def build_alias_trie(
+    aliases: Mapping[str, Iterable[str]], coast_to_parent: dict[str, str]
+) -> AliasTrie:
+    children: list[dict[str, int]] = [{}]
+    exact: list[set[str]] = [set()]
+    reachable: list[set[str]] = [set()]
+    digest = hashlib.sha256()
+    pairs = sorted((a, tid) for tid, names in aliases.items() for a in names)
+    for alias, tid in pairs:
+        if not alias:
+            continue
+        digest.update(f"{alias}\0{tid}\n".encode())
+        node = 0
+        for ch in alias:
+            nxt = children[node].get(ch)
+            if nxt is None:
+                nxt = len(children)
+                children[node][ch] = nxt
+                children.append({})
+                exact.append(set())
+                reachable.append(set())
+            node = nxt
+            reachable[node].add(tid)
+        exact[node].add(tid)
+
+    terminal: list[str | None] = []
+    for alias_ids in exact:
+        terminal.append(next(iter(alias_ids)) if len(alias_ids) == 1 else None)
+    unique: list[str | None] = []
+    for ids in reachable:
+        if len(ids) <= 1:
+            unique.append(next(iter(ids), None))
+            continue
+        parents = {coast_to_parent.get(tid, tid) for tid in ids}
+        parent = next(iter(parents))
+        unique.append(parent if len(parents) == 1 and parent in ids else None)
+    return AliasTrie(
+        digest=digest.hexdigest(),
+        children=children,
+        terminal=terminal,
+        unique=unique,
+    )
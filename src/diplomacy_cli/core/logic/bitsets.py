@@ -0,0 +1,54 @@
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import Any
+
+from .schema import TerritoryIndex
+
+
+def territory_mask(index: TerritoryIndex, territory_ids: Iterable[str]) -> int:
+    ordinal = index.ordinal
+    mask = 0
+    for tid in territory_ids:
+        if tid in ordinal:
+            mask |= 1 << ordinal[tid]
+    return mask
+
+
+def mask_territories(index: TerritoryIndex, mask: int) -> list[str]:
+    names = index.names
+    result = []
+    while mask:
+        low = mask & -mask
+        result.append(names[low.bit_length() - 1])
+        mask ^= low
+    return result
+
+
+def popcount(mask: int) -> int:
+    return mask.bit_count()
+
+
+def ownership_masks(
+    index: TerritoryIndex, territory_state: dict[str, Any]
+) -> dict[str, int]:
+    ordinal = index.ordinal
+    masks: dict[str, int] = defaultdict(int)
+    for tid, data in territory_state.items():
+        owner_id = data.get("owner_id")
+        if owner_id is None or tid not in ordinal:
+            continue
+        masks[owner_id] |= 1 << ordinal[tid]
+    return dict(masks)
+
+
+def occupancy_masks(
+    index: TerritoryIndex, units: dict[str, Any]
+) -> dict[str, int]:
+    ordinal = index.ordinal
+    masks: dict[str, int] = defaultdict(int)
+    for unit in units.values():
+        tid = unit["territory_id"]
+        if tid not in ordinal:
+            continue
+        masks[unit["owner_id"]] |= 1 << ordinal[tid]
+    return dict(masks)
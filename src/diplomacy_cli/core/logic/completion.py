@@ -0,0 +1,66 @@
+from bisect import bisect_left
+
+from .legal_orders import (
+    format_order,
+    legal_builds,
+    legal_orders_by_unit,
+)
+from .schema import (
+    CompletionIndex,
+    LegalOrderCache,
+    LoadedState,
+    Phase,
+    Rules,
+)
+from .turn_code import parse_turn_code
+
+PREFIX_END = "\uffff"
+
+
+def build_completion_index(
+    player_id: str,
+    state: LoadedState,
+    rules: Rules,
+    cache: LegalOrderCache | None = None,
+) -> CompletionIndex:
+    _, _, phase = parse_turn_code(state.game.game_meta["turn_code"])
+    legal = legal_orders_by_unit(state, rules, phase, cache)
+    orders = {
+        format_order(order)
+        for unit_id, unit_orders in legal.items()
+        if state.game.units[unit_id]["owner_id"] == player_id
+        for order in unit_orders
+    }
+    if phase == Phase.ADJUSTMENT:
+        orders.update(
+            format_order(order)
+            for order in legal_builds(player_id, state, rules)
+        )
+    return CompletionIndex(player_id=player_id, orders=sorted(orders))
+
+
+def normalize_prefix(prefix: str) -> str:
+    trailing = " " if prefix.endswith(" ") else ""
+    return " ".join(prefix.lower().split()) + trailing
+
+
+def _matching(index: CompletionIndex, prefix: str) -> list[str]:
+    orders = index.orders
+    lo = bisect_left(orders, prefix)
+    hi = bisect_left(orders, prefix + PREFIX_END, lo)
+    return orders[lo:hi]
+
+
+def complete_order(index: CompletionIndex, prefix: str) -> list[str]:
+    return _matching(index, normalize_prefix(prefix))
+
+
+def complete_token(index: CompletionIndex, prefix: str) -> list[str]:
+    prefix = normalize_prefix(prefix)
+    start = len(prefix)
+    candidates: dict[str, None] = {}
+    for order in _matching(index, prefix):
+        skip = order[start : start + 1] == " "
+        end = order.find(" ", start + skip)
+        candidates[order if end < 0 else order[: end + 1]] = None
+    return list(candidates)
@@ -0,0 +1,95 @@
+from collections import deque
+from typing import Any
+
+from .schema import ConvoyReachability, Rules
+from .territory_index import FLEET_MODES
+
+
+def build_convoy_reachability(
+    territory_type: dict[str, str],
+    adjacency_map: dict[str, list[tuple[str, str]]],
+) -> ConvoyReachability:
+    def is_water(tid: str) -> bool:
+        return territory_type.get(tid) != "land"
+
+    component: dict[str, int] = {}
+    count = 0
+    for start in adjacency_map:
+        if start in component or not is_water(start):
+            continue
+        component[start] = count
+        queue = deque([start])
+        while queue:
+            cur = queue.popleft()
+            for neighbor, mode in adjacency_map.get(cur, []):
+                if mode not in FLEET_MODES or neighbor in component:
+                    continue
+                if not is_water(neighbor):
+                    continue
+                component[neighbor] = count
+                queue.append(neighbor)
+        count += 1
+
+    touching: dict[str, frozenset[int]] = {}
+    endpoints: list[set[str]] = [set() for _ in range(count)]
+    for tid, adjacent in adjacency_map.items():
+        comps = {
+            component[neighbor]
+            for neighbor, mode in adjacent
+            if mode in FLEET_MODES and neighbor in component
+        }
+        if tid in component:
+            comps.add(component[tid])
+        if not comps:
+            continue
+        touching[tid] = frozenset(comps)
+        if territory_type.get(tid) != "sea":
+            for comp in comps:
+                endpoints[comp].add(tid)
+
+    return ConvoyReachability(
+        component=component,
+        touching=touching,
+        endpoints=[frozenset(e) for e in endpoints],
+    )
+
+
+def has_sea_route(origin: str, target: str, rules: Rules) -> bool:
+    table = rules.convoy_reachability
+    no_components: frozenset[int] = frozenset()
+    origin_coasts = rules.parent_to_coast.get(origin, [origin])
+    target_coasts = rules.parent_to_coast.get(target, [target])
+
+    for src in origin_coasts:
+        if src in target_coasts:
+            return True
+        reachable = rules.fleet_adjacency.get(src, frozenset())
+        src_components = table.touching.get(src, no_components)
+        for dst in target_coasts:
+            if dst in reachable:
+                return True
+            if not src_components.isdisjoint(
+                table.touching.get(dst, no_components)
+            ):
+                return True
+    return False
+
+
+def convoy_reachability_to_dict(table: ConvoyReachability) -> dict[str, Any]:
+    return {
+        "component": table.component,
+        "touching": {
+            tid: sorted(comps) for tid, comps in table.touching.items()
+        },
+        "endpoints": [sorted(e) for e in table.endpoints],
+    }
+
+
+def convoy_reachability_from_dict(d: dict[str, Any]) -> ConvoyReachability:
+    return ConvoyReachability(
+        component=dict(d["component"]),
+        touching={
+            tid: frozenset(comps) for tid, comps in d["touching"].items()
+        },
+        endpoints=[frozenset(e) for e in d["endpoints"]],
+    )
@@ -0,0 +1,223 @@
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+
+from .schema import (
+    ConvoyReachability,
+    DistanceRows,
+    DistanceTables,
+    Rules,
+    TerritoryIndex,
+    UnitType,
+)
+from .territory_index import ARMY_MODES, FLEET_MODES, neighbors
+
+UNREACHABLE = 255
+DISTANCE_TABLE_LIMIT = 2048
+FALLBACK_RULES_LIMIT = 6
+FALLBACK_ROW_LIMIT = 1024
+
+_fallback_lock = threading.Lock()
+_fallback: OrderedDict[tuple[int, UnitType, bool], DistanceRows] = OrderedDict()
+
+
+def bfs_row(adjacent: list[list[int]], source: int) -> array:
+    row = array("B", [UNREACHABLE]) * len(adjacent)
+    row[source] = 0
+    frontier = [source]
+    depth = 0
+    while frontier and depth < UNREACHABLE - 1:
+        depth += 1
+        next_frontier = []
+        for cur in frontier:
+            for neighbor in adjacent[cur]:
+                if row[neighbor] == UNREACHABLE:
+                    row[neighbor] = depth
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+    return row
+
+
+def cached_bfs_row(cache: DistanceRows, source: int) -> array:
+    with _fallback_lock:
+        row = cache.rows.get(source)
+        if row is not None:
+            cache.rows.move_to_end(source)
+            return row
+    row = bfs_row(cache.adjacent, source)
+    with _fallback_lock:
+        cache.rows[source] = row
+        while len(cache.rows) > FALLBACK_ROW_LIMIT:
+            cache.rows.popitem(last=False)
+    return row
+
+
+def all_pairs(adjacent: list[list[int]]) -> array:
+    table = array("B")
+    for source in range(len(adjacent)):
+        table.extend(bfs_row(adjacent, source))
+    return table
+
+
+def convoy_adjacency(
+    index: TerritoryIndex,
+    army_adjacent: list[list[int]],
+    territory_type: dict[str, str],
+    parent_to_coast: Mapping[str, Iterable[str]],
+    coast_to_parent: dict[str, str],
+    convoy_reachability: ConvoyReachability,
+) -> list[list[int]]:
+    ordinal = index.ordinal
+    adjacent = [list(targets) for targets in army_adjacent]
+    for tid, src in ordinal.items():
+        if territory_type.get(tid) != "land":
+            continue
+        components: set[int] = set()
+        for position in parent_to_coast.get(tid, [tid]):
+            components |= convoy_reachability.touching.get(position, set())
+        reachable = set(adjacent[src])
+        for comp in sorted(components):
+            for endpoint in sorted(convoy_reachability.endpoints[comp]):
+                dst_id = coast_to_parent.get(endpoint, endpoint)
+                if territory_type.get(dst_id) != "land" or dst_id == tid:
+                    continue
+                dst = ordinal[dst_id]
+                if dst not in reachable:
+                    reachable.add(dst)
+                    adjacent[src].append(dst)
+    return adjacent
+
+
+def build_distance_tables(
+    index: TerritoryIndex,
+    territory_type: dict[str, str],
+    parent_to_coast: Mapping[str, Iterable[str]],
+    coast_to_parent: dict[str, str],
+    convoy_reachability: ConvoyReachability,
+) -> DistanceTables:
+    n = len(index.names)
+    if n > DISTANCE_TABLE_LIMIT:
+        return DistanceTables(
+            size=0, army=array("B"), fleet=array("B"), army_convoy=array("B")
+        )
+    army_adjacent = [neighbors(index, i, ARMY_MODES) for i in range(n)]
+    fleet_adjacent = [neighbors(index, i, FLEET_MODES) for i in range(n)]
+    army_convoy_adjacent = convoy_adjacency(
+        index,
+        army_adjacent,
+        territory_type,
+        parent_to_coast,
+        coast_to_parent,
+        convoy_reachability,
+    )
+    return DistanceTables(
+        size=n,
+        army=all_pairs(army_adjacent),
+        fleet=all_pairs(fleet_adjacent),
+        army_convoy=all_pairs(army_convoy_adjacent),
+    )
+
+
+def unit_adjacent(
+    rules: Rules, unit_type: UnitType, via_convoy: bool
+) -> list[list[int]]:
+    index = rules.index
+    modes = FLEET_MODES if unit_type == UnitType.FLEET else ARMY_MODES
+    adjacent = [neighbors(index, i, modes) for i in range(len(index.names))]
+    if unit_type == UnitType.ARMY and via_convoy:
+        adjacent = convoy_adjacency(
+            index,
+            adjacent,
+            rules.territory_type,
+            rules.parent_to_coast,
+            rules.coast_to_parent,
+            rules.convoy_reachability,
+        )
+    return adjacent
+
+
+def fallback_rows(
+    rules: Rules, unit_type: UnitType, via_convoy: bool
+) -> DistanceRows:
+    convoy = via_convoy and unit_type == UnitType.ARMY
+    key = (id(rules), unit_type, convoy)
+    with _fallback_lock:
+        cache = _fallback.get(key)
+        if cache is not None:
+            _fallback.move_to_end(key)
+            return cache
+    cache = DistanceRows(rules, unit_adjacent(rules, unit_type, convoy))
+    with _fallback_lock:
+        cache = _fallback.setdefault(key, cache)
+        while len(_fallback) > FALLBACK_RULES_LIMIT:
+            _fallback.popitem(last=False)
+    return cache
+
+
+def clear_distance_cache() -> None:
+    with _fallback_lock:
+        _fallback.clear()
+
+
+def unit_table(rules: Rules, unit_type: UnitType, via_convoy: bool) -> array:
+    if unit_type == UnitType.FLEET:
+        return rules.distances.fleet
+    if via_convoy:
+        return rules.distances.army_convoy
+    return rules.distances.army
+
+
+def distance_rows(
+    rules: Rules, unit_type: UnitType, via_convoy: bool, sources: list[int]
+) -> list[array]:
+    n = rules.distances.size
+    if not n:
+        cache = fallback_rows(rules, unit_type, via_convoy)
+        return [cached_bfs_row(cache, src) for src in sources]
+    table = unit_table(rules, unit_type, via_convoy)
+    return [table[src * n : (src + 1) * n] for src in sources]
+
+
+def unit_positions(rules: Rules, unit_type: UnitType, tid: str) -> list[int]:
+    ordinal = rules.index.ordinal
+    if unit_type == UnitType.FLEET:
+        positions = rules.parent_to_coast.get(tid, [tid])
+    else:
+        positions = [rules.coast_to_parent.get(tid, tid)]
+    return [ordinal[p] for p in positions if p in ordinal]
+
+
+def move_distance(
+    rules: Rules,
+    unit_type: UnitType,
+    origin: str,
+    target: str,
+    via_convoy: bool = False,
+) -> int | None:
+    sources = unit_positions(rules, unit_type, origin)
+    targets = unit_positions(rules, unit_type, target)
+    if not sources or not targets:
+        return None
+    rows = distance_rows(rules, unit_type, via_convoy, sources)
+    best = min(row[dst] for row in rows for dst in targets)
+    return None if best == UNREACHABLE else best
+
+
+def distances_from(
+    rules: Rules,
+    unit_type: UnitType,
+    origin: str,
+    via_convoy: bool = False,
+) -> dict[str, int]:
+    names = rules.index.names
+    sources = unit_positions(rules, unit_type, origin)
+    result: dict[str, int] = {}
+    for row in distance_rows(rules, unit_type, via_convoy, sources):
+        for dst, dist in enumerate(row):
+            if dist == UNREACHABLE:
+                continue
+            tid = names[dst]
+            if dist < result.get(tid, UNREACHABLE):
+                result[tid] = dist
+    return result
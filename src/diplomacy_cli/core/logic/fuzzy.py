@@ -0,0 +1,86 @@
+import heapq
+from array import array
+from collections import defaultdict
+
+from .schema import FuzzyIndex
+from .validator.syntax import normalize_order_string
+
+CANDIDATE_POOL = 8
+COMMON_POSTINGS = 256
+DEFAULT_SUGGESTIONS = 3
+
+
+def trigrams(text: str) -> set[str]:
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def levenshtein(a: str, b: str) -> int:
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (ca != cb),
+                )
+            )
+        previous = current
+    return previous[-1]
+
+
+def build_fuzzy_index(territory_display_names: dict[str, str]) -> FuzzyIndex:
+    keys: list[str] = []
+    key_ids: list[str] = []
+    for tid, display_name in territory_display_names.items():
+        for key in dict.fromkeys((tid, normalize_order_string(display_name))):
+            keys.append(key)
+            key_ids.append(tid)
+    buckets: dict[str, list[int]] = defaultdict(list)
+    for i, key in enumerate(keys):
+        for gram in trigrams(key):
+            buckets[gram].append(i)
+    return FuzzyIndex(
+        keys=keys,
+        key_ids=key_ids,
+        postings={gram: array("I", idxs) for gram, idxs in buckets.items()},
+    )
+
+
+def suggest_territories(
+    index: FuzzyIndex, query: str, k: int = DEFAULT_SUGGESTIONS
+) -> list[str]:
+    query = normalize_order_string(query)
+    postings = sorted(
+        (
+            index.postings[gram]
+            for gram in trigrams(query)
+            if gram in index.postings
+        ),
+        key=len,
+    )
+    selective = [p for p in postings if len(p) <= COMMON_POSTINGS]
+    if not selective and postings:
+        selective = [postings[0][:COMMON_POSTINGS]]
+    shared: dict[int, int] = defaultdict(int)
+    for posting in selective:
+        for i in posting:
+            shared[i] += 1
+    if not shared:
+        return []
+    pool = heapq.nlargest(CANDIDATE_POOL, shared.items(), key=lambda x: x[1])
+    ranked = sorted(
+        (levenshtein(query, index.keys[i]), -count, index.key_ids[i])
+        for i, count in pool
+    )
+    suggestions: list[str] = []
+    for _, _, tid in ranked:
+        if tid not in suggestions:
+            suggestions.append(tid)
+            if len(suggestions) == k:
+                break
+    return suggestions
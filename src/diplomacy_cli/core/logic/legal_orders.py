@@ -0,0 +1,318 @@
+from .schema import (
+    LegalOrderCache,
+    LoadedState,
+    Neighbourhood,
+    Order,
+    OrderType,
+    OutcomeType,
+    Phase,
+    Rules,
+    UnitType,
+)
+from .territory_index import support_origins, support_targets
+from .turn_code import parse_turn_code
+
+
+def format_order(order: Order) -> str:
+    match order.order_type:
+        case OrderType.HOLD:
+            return f"{order.origin} hold"
+        case OrderType.MOVE | OrderType.RETREAT:
+            return f"{order.origin} - {order.destination}"
+        case OrderType.SUPPORT_HOLD:
+            return f"{order.origin} s {order.support_origin}"
+        case OrderType.SUPPORT_MOVE:
+            return (
+                f"{order.origin} s {order.support_origin}"
+                f" - {order.support_destination}"
+            )
+        case OrderType.CONVOY:
+            return (
+                f"{order.origin} c {order.convoy_origin}"
+                f" - {order.convoy_destination}"
+            )
+        case OrderType.BUILD | OrderType.DISBAND:
+            assert order.unit_type is not None
+            return (
+                f"{order.order_type.value} {order.unit_type.value} "
+                f"{order.origin}"
+            )
+    raise ValueError(f"Unknown order type: {order.order_type}")
+
+
+def _army_province(rules: Rules, tid: str) -> bool:
+    return (
+        tid not in rules.coast_to_parent
+        and rules.territory_type.get(tid) != "sea"
+    )
+
+
+def _convoy_endpoints(rules: Rules, component: int) -> set[str]:
+    endpoints = set()
+    for tid in rules.convoy_reachability.endpoints[component]:
+        province = rules.coast_to_parent.get(tid, tid)
+        if _army_province(rules, province):
+            endpoints.add(province)
+    return endpoints
+
+
+def _convoy_destinations(rules: Rules, origin: str) -> set[str]:
+    table = rules.convoy_reachability
+    destinations: set[str] = set()
+    for src in rules.parent_to_coast.get(origin, [origin]):
+        for dst in rules.fleet_adjacency.get(src, frozenset()):
+            destinations.add(rules.coast_to_parent.get(dst, dst))
+        for component in table.touching.get(src, frozenset()):
+            destinations |= _convoy_endpoints(rules, component)
+    destinations.discard(origin)
+    return {tid for tid in destinations if _army_province(rules, tid)}
+
+
+def _unit_type_at(state: LoadedState, tid: str) -> UnitType | None:
+    unit_id = state.territory_to_unit.get(tid)
+    if unit_id is None:
+        return None
+    return UnitType(state.game.units[unit_id]["unit_type"])
+
+
+def _movement_orders(
+    unit_type: UnitType, origin: str, state: LoadedState, rules: Rules
+) -> list[Order]:
+    orders = [Order(origin=origin, order_type=OrderType.HOLD)]
+    if unit_type == UnitType.ARMY:
+        reachable = set(rules.army_adjacency.get(origin, frozenset()))
+        reachable |= _convoy_destinations(rules, origin)
+    else:
+        reachable = set(rules.fleet_adjacency.get(origin, frozenset()))
+    for destination in sorted(reachable):
+        orders.append(
+            Order(
+                origin=origin,
+                order_type=OrderType.MOVE,
+                destination=destination,
+            )
+        )
+
+    support_moves = []
+    for target in support_targets(rules, unit_type, origin):
+        if _unit_type_at(state, target) is not None:
+            orders.append(
+                Order(
+                    origin=origin,
+                    order_type=OrderType.SUPPORT_HOLD,
+                    support_origin=target,
+                )
+            )
+        if target in rules.coast_to_parent:
+            continue
+        for supported_type in UnitType:
+            for supported in support_origins(rules, supported_type, target):
+                if supported == origin:
+                    continue
+                if _unit_type_at(state, supported) != supported_type:
+                    continue
+                support_moves.append(
+                    Order(
+                        origin=origin,
+                        order_type=OrderType.SUPPORT_MOVE,
+                        support_origin=supported,
+                        support_destination=target,
+                    )
+                )
+    orders.extend(
+        sorted(
+            support_moves,
+            key=lambda o: (o.support_origin, o.support_destination),
+        )
+    )
+
+    component = rules.convoy_reachability.component.get(origin)
+    if (
+        unit_type == UnitType.FLEET
+        and component is not None
+        and rules.territory_type.get(origin) == "sea"
+    ):
+        endpoints = sorted(_convoy_endpoints(rules, component))
+        for army_origin in endpoints:
+            if _unit_type_at(state, army_origin) != UnitType.ARMY:
+                continue
+            for destination in endpoints:
+                if destination == army_origin:
+                    continue
+                orders.append(
+                    Order(
+                        origin=origin,
+                        order_type=OrderType.CONVOY,
+                        convoy_origin=army_origin,
+                        convoy_destination=destination,
+                    )
+                )
+    return orders
+
+
+def _retreat_orders(
+    unit_type: UnitType, origin: str, state: LoadedState, rules: Rules
+) -> list[Order]:
+    if unit_type == UnitType.ARMY:
+        reachable = rules.army_adjacency.get(origin, frozenset())
+    else:
+        reachable = rules.fleet_adjacency.get(origin, frozenset())
+    return [
+        Order(origin=origin, order_type=OrderType.RETREAT, destination=dest)
+        for dest in sorted(reachable)
+        if dest not in state.territory_to_unit
+    ]
+
+
+def _dislodged_origins(state: LoadedState) -> set[str]:
+    if state.pending_move is None:
+        return set()
+    return {
+        result.origin_territory
+        for result in state.pending_move.resolution_results
+        if result.outcome == OutcomeType.DISLODGED
+    }
+
+
+def _current_phase(state: LoadedState) -> Phase:
+    _, _, phase = parse_turn_code(state.game.game_meta["turn_code"])
+    return phase
+
+
+def _watched_territories(
+    phase: Phase, unit_type: UnitType, origin: str, rules: Rules
+) -> tuple[str, ...]:
+    if phase != Phase.MOVEMENT:
+        if unit_type == UnitType.ARMY:
+            return tuple(rules.army_adjacency.get(origin, frozenset()))
+        return tuple(rules.fleet_adjacency.get(origin, frozenset()))
+    watched: dict[str, None] = {}
+    for target in support_targets(rules, unit_type, origin):
+        watched[target] = None
+        if target in rules.coast_to_parent:
+            continue
+        for supported_type in UnitType:
+            watched.update(
+                dict.fromkeys(support_origins(rules, supported_type, target))
+            )
+    component = rules.convoy_reachability.component.get(origin)
+    if (
+        unit_type == UnitType.FLEET
+        and component is not None
+        and rules.territory_type.get(origin) == "sea"
+    ):
+        watched.update(dict.fromkeys(_convoy_endpoints(rules, component)))
+    watched.pop(origin, None)
+    return tuple(watched)
+
+
+def _neighbourhood(
+    watched: tuple[str, ...], state: LoadedState
+) -> Neighbourhood:
+    return tuple(_unit_type_at(state, tid) for tid in watched)
+
+
+def _cached_orders(
+    cache: LegalOrderCache,
+    phase: Phase,
+    unit_type: UnitType,
+    origin: str,
+    state: LoadedState,
+    rules: Rules,
+) -> tuple[Order, ...]:
+    if cache.rules is not rules:
+        cache.rules = rules
+        cache.watched.clear()
+        cache.orders.clear()
+    key = (phase, unit_type, origin)
+    watched = cache.watched.get(key)
+    if watched is None:
+        watched = _watched_territories(phase, unit_type, origin, rules)
+        cache.watched[key] = watched
+    neighbourhood = _neighbourhood(watched, state)
+    entry = cache.orders.get(key)
+    if entry is not None and entry[0] == neighbourhood:
+        return entry[1]
+    if phase == Phase.MOVEMENT:
+        built = _movement_orders(unit_type, origin, state, rules)
+    else:
+        built = _retreat_orders(unit_type, origin, state, rules)
+    orders = tuple(built)
+    cache.orders[key] = (neighbourhood, orders)
+    return orders
+
+
+def legal_orders_by_unit(
+    state: LoadedState,
+    rules: Rules,
+    phase: Phase | None = None,
+    cache: LegalOrderCache | None = None,
+) -> dict[str, tuple[Order, ...]]:
+    phase = _current_phase(state) if phase is None else phase
+    cache = LegalOrderCache() if cache is None else cache
+    dislodged = _dislodged_origins(state) if phase == Phase.RETREAT else set()
+    result: dict[str, tuple[Order, ...]] = {}
+    for unit_id, unit in state.game.units.items():
+        origin = unit["territory_id"]
+        unit_type = UnitType(unit["unit_type"])
+        if phase == Phase.ADJUSTMENT:
+            result[unit_id] = (
+                Order(
+                    origin=origin,
+                    order_type=OrderType.DISBAND,
+                    unit_type=unit_type,
+                ),
+            )
+        elif phase == Phase.RETREAT and origin not in dislodged:
+            result[unit_id] = ()
+        else:
+            result[unit_id] = _cached_orders(
+                cache, phase, unit_type, origin, state, rules
+            )
+    return result
+
+
+def legal_orders(
+    unit_id: str,
+    state: LoadedState,
+    rules: Rules,
+    phase: Phase | None = None,
+    cache: LegalOrderCache | None = None,
+) -> tuple[Order, ...]:
+    phase = _current_phase(state) if phase is None else phase
+    unit = state.game.units[unit_id]
+    origin = unit["territory_id"]
+    unit_type = UnitType(unit["unit_type"])
+    if phase == Phase.ADJUSTMENT:
+        return (
+            Order(
+                origin=origin,
+                order_type=OrderType.DISBAND,
+                unit_type=unit_type,
+            ),
+        )
+    if phase == Phase.RETREAT and origin not in _dislodged_origins(state):
+        return ()
+    cache = LegalOrderCache() if cache is None else cache
+    return _cached_orders(cache, phase, unit_type, origin, state, rules)
+
+
+def legal_builds(
+    player_id: str, state: LoadedState, rules: Rules
+) -> list[Order]:
+    orders = []
+    for prv in sorted(rules.home_centers.get(player_id, ())):
+        owner = state.game.territory_state.get(prv, {}).get("owner_id")
+        if owner != player_id or prv in state.territory_to_unit:
+            continue
+        for unit_type in UnitType:
+            if unit_type == UnitType.FLEET and prv not in rules.has_coast:
+                continue
+            orders.append(
+                Order(
+                    origin=prv,
+                    order_type=OrderType.BUILD,
+                    unit_type=unit_type,
+                )
+            )
+    return orders
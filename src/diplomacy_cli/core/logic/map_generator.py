@@ -0,0 +1,234 @@
+import math
+import random
+from collections import deque
+from pathlib import Path
+from typing import Any
+
+from .storage import load_variant_json, save
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+MAX_TERRITORIES = len(ALPHABET) ** 3
+COASTS = ("nc", "sc")
+HOME_CENTERS_PER_NATION = 3
+
+
+def territory_code(i: int) -> str:
+    a, rest = divmod(i, 26 * 26)
+    b, c = divmod(rest, 26)
+    return ALPHABET[a] + ALPHABET[b] + ALPHABET[c]
+
+
+def grid_neighbors(n: int) -> list[list[int]]:
+    width = math.ceil(math.sqrt(n))
+    adjacent: list[list[int]] = [[] for _ in range(n)]
+    for i in range(n):
+        x, y = i % width, i // width
+        for dx, dy in ((1, 0), (0, 1), (1, -1)):
+            nx, ny = x + dx, y + dy
+            if not (0 <= nx < width and ny >= 0):
+                continue
+            j = ny * width + nx
+            if j < n:
+                adjacent[i].append(j)
+                adjacent[j].append(i)
+    return [sorted(row) for row in adjacent]
+
+
+def grow_seas(
+    adjacent: list[list[int]],
+    sea_count: int,
+    sea_regions: int,
+    rng: random.Random,
+) -> set[int]:
+    n = len(adjacent)
+    seas: set[int] = set()
+    frontier = deque(rng.sample(range(n), min(sea_regions, n, sea_count)))
+    seas.update(frontier)
+    while frontier and len(seas) < sea_count:
+        cur = frontier.popleft()
+        for neighbor in rng.sample(adjacent[cur], len(adjacent[cur])):
+            if neighbor not in seas and len(seas) < sea_count:
+                seas.add(neighbor)
+                frontier.append(neighbor)
+    return seas
+
+
+def claim_home_centers(
+    adjacent: list[list[int]],
+    land: list[int],
+    centers: set[int],
+    nations: int,
+    rng: random.Random,
+) -> list[list[int]]:
+    if nations * HOME_CENTERS_PER_NATION > len(centers):
+        raise ValueError(
+            f"{nations} nations need {nations * HOME_CENTERS_PER_NATION} "
+            f"supply centers, only {len(centers)} available"
+        )
+    land_set = set(land)
+    claimed: set[int] = set()
+    homes: list[list[int]] = []
+    candidates = sorted(centers)
+    rng.shuffle(candidates)
+    for start in candidates:
+        if len(homes) == nations:
+            break
+        if start in claimed:
+            continue
+        home = [start]
+        seen = {start}
+        queue = deque([start])
+        while queue and len(home) < HOME_CENTERS_PER_NATION:
+            cur = queue.popleft()
+            for neighbor in adjacent[cur]:
+                if neighbor in seen or neighbor not in land_set:
+                    continue
+                seen.add(neighbor)
+                queue.append(neighbor)
+                if neighbor in centers and neighbor not in claimed:
+                    home.append(neighbor)
+                    if len(home) == HOME_CENTERS_PER_NATION:
+                        break
+        if len(home) == HOME_CENTERS_PER_NATION:
+            claimed.update(home)
+            homes.append(home)
+    if len(homes) < nations:
+        raise ValueError(f"Could not place home centers for {nations} nations")
+    return homes
+
+
+def board_schema(nation_ids: list[str]) -> dict[str, Any]:
+    schema = load_variant_json("classic", "world", "board.schema.json")
+    assert isinstance(schema, dict)
+    props = schema["patternProperties"]["^[a-z]{3}(?:/[A-Z]{2})?$"]
+    props["properties"]["home_country"] = {"enum": nation_ids}
+    return schema
+
+
+def generate_variant(
+    territories: int = 1000,
+    nations: int = 7,
+    coast_density: float = 0.05,
+    sea_fraction: float = 0.3,
+    sea_regions: int = 4,
+    supply_center_fraction: float = 0.45,
+    seed: int = 0,
+) -> dict[str, Any]:
+    if not 2 <= territories <= MAX_TERRITORIES:
+        raise ValueError(f"territories must be in 2..{MAX_TERRITORIES}")
+    if nations < 1:
+        raise ValueError("nations must be at least 1")
+    rng = random.Random(seed)
+    adjacent = grid_neighbors(territories)
+    seas = grow_seas(
+        adjacent, round(territories * sea_fraction), max(sea_regions, 1), rng
+    )
+    land = [i for i in range(territories) if i not in seas]
+    coastal = {i for i in land if any(j in seas for j in adjacent[i])}
+    split = {
+        i
+        for i in sorted(coastal)
+        if sum(j in seas for j in adjacent[i]) >= 2
+        and rng.random() < coast_density
+    }
+    centers = {i for i in land if rng.random() < supply_center_fraction}
+    nation_ids = [f"n{i:02d}" for i in range(nations)]
+    homes = claim_home_centers(adjacent, land, centers, nations, rng)
+    home_of = {t: nation_ids[k] for k, home in enumerate(homes) for t in home}
+
+    names = [territory_code(i) for i in range(territories)]
+    coast_of: dict[tuple[int, int], str] = {}
+    for i in sorted(split):
+        sea_neighbors = [j for j in adjacent[i] if j in seas]
+        half = len(sea_neighbors) // 2
+        for k, j in enumerate(sea_neighbors):
+            coast = COASTS[0] if k < half else COASTS[1]
+            coast_of[(i, j)] = f"{names[i]}_{coast}"
+
+    territory_data: dict[str, dict[str, Any]] = {}
+    for i, tid in enumerate(names):
+        data: dict[str, Any] = {
+            "display_name": f"Territory {tid.upper()}",
+            "type": "sea" if i in seas else "land",
+        }
+        if i in split:
+            data["coasts"] = list(COASTS)
+        if i in coastal:
+            data["has_coast"] = True
+        if i in centers:
+            data["is_supply_center"] = True
+        if i in home_of:
+            data["home_country"] = home_of[i]
+        territory_data[tid] = data
+
+    edges = []
+    for i in range(territories):
+        for j in adjacent[i]:
+            if j <= i:
+                continue
+            if i in seas or j in seas:
+                pairs = [
+                    (
+                        coast_of.get((i, j), names[i]),
+                        coast_of.get((j, i), names[j]),
+                    )
+                ]
+                mode = "sea"
+            else:
+                shared = [
+                    k for k in adjacent[i] if k in seas and k in adjacent[j]
+                ]
+                pairs = [(names[i], names[j])]
+                mode = "land"
+                if shared and (i in split or j in split):
+                    pairs += [
+                        (
+                            coast_of.get((i, k), names[i]),
+                            coast_of.get((j, k), names[j]),
+                        )
+                        for k in shared
+                    ]
+                elif shared:
+                    mode = "both"
+            for a, b in dict.fromkeys(pairs):
+                edge_mode = mode if (a, b) == (names[i], names[j]) else "sea"
+                edges.append({"from": a, "to": b, "mode": edge_mode})
+                edges.append({"from": b, "to": a, "mode": edge_mode})
+
+    units = []
+    ownerships = []
+    for k, home in enumerate(homes):
+        for n, t in enumerate(home):
+            ownerships.append(
+                {"territory_id": names[t], "owner_id": nation_ids[k]}
+            )
+            fleet = n == 0 and t in coastal and t not in split
+            units.append(
+                {
+                    "owner_id": nation_ids[k],
+                    "unit_type": "fleet" if fleet else "army",
+                    "location_id": names[t],
+                }
+            )
+
+    return {
+        "world/board.schema.json": board_schema(nation_ids),
+        "world/territories.json": territory_data,
+        "world/edges.json": edges,
+        "world/nations.json": [
+            {"id": nid, "display_name": f"Nation {nid.upper()}"}
+            for nid in nation_ids
+        ],
+        "start/starting_units.json": units,
+        "start/starting_ownerships.json": ownerships,
+        "start/starting_players.json": [
+            {"nation_id": nid, "status": "active"} for nid in nation_ids
+        ],
+    }
+
+
+def write_variant(files: dict[str, Any], root: Path, variant: str) -> Path:
+    variant_dir = Path(root) / variant
+    for name, data in files.items():
+        save(data, variant_dir / name)
+    return variant_dir
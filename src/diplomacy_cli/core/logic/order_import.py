@@ -0,0 +1,152 @@
+import json
+import sys
+import tempfile
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from diplomacy_cli.core.paths import DEFAULT_GAMES_DIR, GamePaths, game_dir
+
+from .schema import (
+    LoadedState,
+    OrderImportReport,
+    Phase,
+    Rules,
+    ValidationContext,
+)
+from .state import merge_spooled_orders, spool_player_orders
+from .turn_code import parse_turn_code
+from .validator.semantic import (
+    SemanticIssue,
+    build_validation_context,
+    check_semantic,
+    render_issue,
+)
+from .validator.syntax import parse_order_cached
+
+IMPORT_BATCH_SIZE = 1000
+MAX_REPORTED_ERRORS = 100
+
+
+def iter_order_lines(source: str | Path | Iterable[str]) -> Iterator[str]:
+    if isinstance(source, str | Path):
+        if str(source) == "-":
+            yield from sys.stdin
+            return
+        with Path(source).open("r", encoding="utf-8") as f:
+            yield from f
+        return
+    yield from source
+
+
+def parse_order_line(
+    line: str, default_player: str | None = None
+) -> tuple[str, list[str]]:
+    text = line.strip()
+    if text.startswith("{"):
+        record = json.loads(text)
+        if not isinstance(record, dict):
+            raise ValueError("Expected a JSON object")
+        player = record.get("player", default_player)
+        if "orders" in record:
+            orders = record["orders"]
+        elif "order" in record:
+            orders = [record["order"]]
+        else:
+            raise ValueError("Missing 'order' or 'orders'")
+        if not isinstance(orders, list) or not all(
+            isinstance(o, str) for o in orders
+        ):
+            raise ValueError("Orders must be strings")
+    else:
+        player, sep, order = text.partition(":")
+        if not sep:
+            player, order = default_player, text
+        orders = [order.strip()]
+    if not isinstance(player, str) or not player.strip():
+        raise ValueError("Missing player")
+    return player.strip(), orders
+
+
+def check_order(
+    player: str,
+    raw: str,
+    phase: Phase,
+    loaded_state: LoadedState,
+    rules: Rules,
+    ctx: ValidationContext | None = None,
+) -> SemanticIssue | tuple[str, ...] | None:
+    _, order, errors = parse_order_cached(raw, phase, rules.aliases)
+    if order is None:
+        return errors
+    return check_semantic(player, order, rules, loaded_state, ctx)
+
+
+def import_orders(
+    source: str | Path | Iterable[str],
+    game_id: str,
+    loaded_state: LoadedState,
+    rules: Rules,
+    root_dir: Path = DEFAULT_GAMES_DIR,
+    default_player: str | None = None,
+    validate: bool = True,
+    batch_size: int = IMPORT_BATCH_SIZE,
+) -> OrderImportReport:
+    _, _, phase = parse_turn_code(loaded_state.game.game_meta["turn_code"])
+    players = loaded_state.game.players
+    ctx = build_validation_context(loaded_state)
+    report = OrderImportReport()
+    pending: dict[str, list[str]] = defaultdict(list)
+    n_pending = 0
+
+    def reject(
+        line_no: int, error: str | SemanticIssue | tuple[str, ...]
+    ) -> None:
+        report.rejected += 1
+        if len(report.errors) >= MAX_REPORTED_ERRORS:
+            return
+        if isinstance(error, SemanticIssue):
+            error = "; ".join(render_issue(error, rules))
+        elif isinstance(error, tuple):
+            error = "; ".join(error)
+        report.errors.append((line_no, error))
+
+    game_path = game_dir(GamePaths(Path(root_dir), game_id))
+    with tempfile.TemporaryDirectory(prefix="import-", dir=game_path) as spool:
+        spool_dir = Path(spool)
+        for line_no, line in enumerate(iter_order_lines(source), 1):
+            text = line.strip()
+            if not text or text.startswith("#"):
+                continue
+            try:
+                player, orders = parse_order_line(text, default_player)
+            except ValueError as e:
+                reject(line_no, str(e))
+                continue
+            if player not in players:
+                reject(line_no, f"No such player: {player}")
+                continue
+            status = players[player]["status"]
+            if status != "active":
+                reject(line_no, f"Cannot import orders: {player} is {status}")
+                continue
+            for raw in orders:
+                if validate:
+                    problem = check_order(
+                        player, raw, phase, loaded_state, rules, ctx
+                    )
+                    if problem:
+                        reject(line_no, problem)
+                        continue
+                pending[player].append(raw)
+                report.accepted += 1
+                n_pending += 1
+                if n_pending >= batch_size:
+                    spool_player_orders(spool_dir, pending)
+                    pending.clear()
+                    n_pending = 0
+        if pending:
+            spool_player_orders(spool_dir, pending)
+        if report.accepted:
+            merge_spooled_orders(game_id, spool_dir, root_dir)
+    return report
@@ -0,0 +1,107 @@
+import hashlib
+import json
+import pickle
+from dataclasses import fields
+from functools import cache
+from importlib import resources
+from pathlib import Path
+from typing import Any
+
+from diplomacy_cli.core.paths import DEFAULT_CACHE_DIR, compiled_rules_dir
+
+from .schema import Rules
+from .storage import (
+    load,
+    load_variant_bytes,
+    save_atomic,
+    variant_resource,
+)
+
+CACHE_FORMAT_VERSION = 2
+WORLD_FILES = ("territories.json", "edges.json", "nations.json")
+BUILDER_MODULES = (
+    "aliases",
+    "bitsets",
+    "convoy",
+    "distances",
+    "fuzzy",
+    "rules_cache",
+    "rules_loader",
+    "schema",
+    "territory_index",
+)
+
+VariantStamp = tuple[tuple[int, int], ...] | None
+
+
+@cache
+def builder_digest() -> str:
+    digest = hashlib.sha256()
+    package = resources.files(__package__)
+    for module in BUILDER_MODULES:
+        digest.update(module.encode("utf-8"))
+        digest.update(package.joinpath(f"{module}.py").read_bytes())
+    return digest.hexdigest()
+
+
+def variant_digest(variant: str) -> str:
+    digest = hashlib.sha256(f"format-{CACHE_FORMAT_VERSION}".encode())
+    digest.update(",".join(f.name for f in fields(Rules)).encode("utf-8"))
+    digest.update(builder_digest().encode("utf-8"))
+    for filename in WORLD_FILES:
+        digest.update(filename.encode("utf-8"))
+        digest.update(load_variant_bytes(variant, "world", filename))
+    return digest.hexdigest()
+
+
+def variant_stamp(variant: str) -> VariantStamp:
+    stamp = []
+    for filename in WORLD_FILES:
+        resource = variant_resource(variant, "world", filename)
+        if not isinstance(resource, Path):
+            return None
+        stat = resource.stat()
+        stamp.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(stamp)
+
+
+def artifact_path(
+    variant: str,
+    digest: str,
+    suffix: str,
+    cache_dir: Path = DEFAULT_CACHE_DIR,
+) -> Path:
+    return compiled_rules_dir(cache_dir) / f"{variant}-{digest[:16]}{suffix}"
+
+
+def read_json_artifact(path: Path) -> dict[str, Any] | None:
+    try:
+        return load(path)
+    except (OSError, ValueError):
+        return None
+
+
+def write_json_artifact(data: dict[str, Any], path: Path) -> None:
+    try:
+        save_atomic(json.dumps(data).encode("utf-8"), path)
+    except OSError:
+        pass
+
+
+def read_rules_artifact(path: Path) -> Rules | None:
+    try:
+        rules = pickle.loads(path.read_bytes())
+    except (OSError, pickle.UnpicklingError, EOFError, ImportError):
+        return None
+    except (AttributeError, IndexError, TypeError, ValueError):
+        return None
+    if not isinstance(rules, Rules):
+        return None
+    return rules
+
+
+def write_rules_artifact(rules: Rules, path: Path) -> None:
+    try:
+        save_atomic(pickle.dumps(rules, pickle.HIGHEST_PROTOCOL), path)
+    except OSError:
+        pass
@@ -1,15 +1,104 @@
 from collections import defaultdict
+from pathlib import Path
 
-from .schema import Rules
+from diplomacy_cli.core.paths import DEFAULT_CACHE_DIR
+
+from .aliases import build_alias_trie, territory_aliases
+from .bitsets import territory_mask
+from .convoy import (
+    build_convoy_reachability,
+    convoy_reachability_from_dict,
+    convoy_reachability_to_dict,
+)
+from .distances import build_distance_tables
+from .fuzzy import build_fuzzy_index
+from .rules_cache import (
+    VariantStamp,
+    artifact_path,
+    read_json_artifact,
+    read_rules_artifact,
+    variant_digest,
+    variant_stamp,
+    write_json_artifact,
+    write_rules_artifact,
+)
+from .schema import ConvoyReachability, Rules
 from .storage import load_variant_json
+from .territory_index import (
+    ARMY_MODES,
+    FLEET_MODES,
+    build_support_reach,
+    build_territory_index,
+    build_unit_adjacency,
+)
+from .variants import validate_variant
+
+_compiled_rules: dict[
+    tuple[str, Path | None], tuple[VariantStamp, str, Rules]
+] = {}
+
+
+def load_convoy_reachability(
+    variant: str,
+    digest: str,
+    territory_type: dict[str, str],
+    adjacency_map: dict[str, list[tuple[str, str]]],
+    cache_dir: Path | None = DEFAULT_CACHE_DIR,
+) -> ConvoyReachability:
+    if cache_dir is None:
+        return build_convoy_reachability(territory_type, adjacency_map)
+    path = artifact_path(variant, digest, ".convoy.json", cache_dir)
+    cached = read_json_artifact(path)
+    if cached is not None:
+        try:
+            return convoy_reachability_from_dict(cached)
+        except (KeyError, TypeError, AttributeError):
+            pass
+    table = build_convoy_reachability(territory_type, adjacency_map)
+    write_json_artifact(convoy_reachability_to_dict(table), path)
+    return table
+
+
+def load_rules(
+    variant: str, cache_dir: Path | None = DEFAULT_CACHE_DIR
+) -> Rules:
+    key = (variant, cache_dir)
+    stamp = variant_stamp(variant)
+    memo = _compiled_rules.get(key)
+    if memo is not None and stamp is not None and memo[0] == stamp:
+        return memo[2]
+    digest = variant_digest(variant)
+    if memo is not None and memo[1] == digest:
+        _compiled_rules[key] = (stamp, digest, memo[2])
+        return memo[2]
 
+    validate_variant(variant, cache_dir)
+    rules = None
+    if cache_dir is not None:
+        path = artifact_path(variant, digest, ".rules.pickle", cache_dir)
+        rules = read_rules_artifact(path)
+        if rules is None:
+            rules = compile_rules(variant, digest, cache_dir)
+            write_rules_artifact(rules, path)
+    if rules is None:
+        rules = compile_rules(variant, digest, cache_dir)
+    _compiled_rules[key] = (stamp, digest, rules)
+    return rules
 
-def load_rules(variant) -> Rules:
+
+def clear_rules_memo() -> None:
+    _compiled_rules.clear()
+
+
+def compile_rules(
+    variant: str, digest: str, cache_dir: Path | None = DEFAULT_CACHE_DIR
+) -> Rules:
     territories_raw = load_variant_json(variant, "world", "territories.json")
     edge_data = load_variant_json(variant, "world", "edges.json")
     nation_data = load_variant_json(variant, "world", "nations.json")
     assert isinstance(territories_raw, dict)
     territory_ids = set()
+    ordered_ids = []
     supply_centers = set()
     home_centers = defaultdict(set)
 
@@ -20,10 +109,14 @@ def load_rules(variant) -> Rules:
     parent_coasts = defaultdict(list)
     parent_to_coast = {}
     coast_to_parent = {}
+    extra_aliases = {}
 
     for tid, data in territories_raw.items():
         territory_ids.add(tid)
+        ordered_ids.append(tid)
         territory_display_names[tid] = data["display_name"]
+        if data.get("aliases"):
+            extra_aliases[tid] = data["aliases"]
         territory_type[tid] = data["type"]  # "land" / "sea" / "coast"
         if data.get("is_supply_center"):
             supply_centers.add(tid)
@@ -35,6 +128,7 @@ def load_rules(variant) -> Rules:
         for coast in data.get("coasts", []):
             coast_id = f"{tid}_{coast}"
             territory_ids.add(coast_id)
+            ordered_ids.append(coast_id)
             territory_type[coast_id] = "coast"
             territory_display_names[coast_id] = (
                 f"{data['display_name']} ({coast.upper()})"
@@ -55,6 +149,13 @@ def load_rules(variant) -> Rules:
             edges.add((src, dst, mode))
             adjacency_map[src].append((dst, mode))
 
+    index = build_territory_index(ordered_ids, adjacency_map)
+    army_adjacency = build_unit_adjacency(adjacency_map, ARMY_MODES)
+    fleet_adjacency = build_unit_adjacency(adjacency_map, FLEET_MODES)
+    convoy_reachability = load_convoy_reachability(
+        variant, digest, territory_type, adjacency_map, cache_dir
+    )
+
     return Rules(
         territory_ids=territory_ids,
         supply_centers=supply_centers,
@@ -68,4 +169,34 @@ def load_rules(variant) -> Rules:
         adjacency_map=dict(adjacency_map),
         parent_to_coast=parent_to_coast,
         coast_to_parent=coast_to_parent,
+        index=index,
+        army_adjacency=army_adjacency,
+        fleet_adjacency=fleet_adjacency,
+        army_support_reach=build_support_reach(
+            army_adjacency, coast_to_parent, parent_to_coast
+        ),
+        fleet_support_reach=build_support_reach(
+            fleet_adjacency, coast_to_parent, parent_to_coast
+        ),
+        aliases=build_alias_trie(
+            territory_aliases(
+                territory_display_names, coast_to_parent, extra_aliases
+            ),
+            coast_to_parent,
+        ),
+        fuzzy_index=build_fuzzy_index(territory_display_names),
+        convoy_reachability=convoy_reachability,
+        supply_center_mask=territory_mask(index, supply_centers),
+        coast_mask=territory_mask(index, has_coast),
+        home_center_masks={
+            nation: territory_mask(index, centers)
+            for nation, centers in home_centers.items()
+        },
+        distances=build_distance_tables(
+            index,
+            territory_type,
+            parent_to_coast,
+            coast_to_parent,
+            convoy_reachability,
+        ),
     )
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from enum import Enum, IntEnum
 from typing import Any
 
@@ -53,6 +55,11 @@ class OutcomeType(str, Enum):
     DISBAND_FAILED = "disband_failed"
 
 
+class ResolutionBackend(str, Enum):
+    PYTHON = "python"
+    NUMPY = "numpy"
+
+
 class ChangeType(str, Enum):
     MOVE = "move"
     BUILD = "build"
@@ -62,6 +69,7 @@ class ChangeType(str, Enum):
 
 
 TerritoryToUnit = dict[str, str]
+Neighbourhood = tuple[UnitType | None, ...]
 Counters = dict[str, int]
 
 
@@ -82,6 +90,54 @@ class LoadedState:
     pending_move: PhaseResolutionReport | None = None
 
 
+@dataclass(frozen=True)
+class AdjacencyCSR:
+    offsets: array
+    targets: array
+
+
+@dataclass(frozen=True)
+class TerritoryIndex:
+    names: list[str]
+    ordinal: dict[str, int]
+    land: AdjacencyCSR
+    sea: AdjacencyCSR
+    both: AdjacencyCSR
+
+
+@dataclass(frozen=True)
+class ConvoyReachability:
+    component: dict[str, int]
+    touching: dict[str, frozenset[int]]
+    endpoints: list[frozenset[str]]
+
+
+@dataclass(frozen=True)
+class DistanceTables:
+    size: int
+    army: array
+    fleet: array
+    army_convoy: array
+
+
+@dataclass(frozen=True)
+class AliasTrie:
+    digest: str
+    children: list[dict[str, int]]
+    terminal: list[str | None]
+    unique: list[str | None]
+
+    def __hash__(self) -> int:
+        return hash(self.digest)
+
+
+@dataclass(frozen=True)
+class FuzzyIndex:
+    keys: list[str]
+    key_ids: list[str]
+    postings: dict[str, array]
+
+
 @dataclass(frozen=True)
 class Rules:
     territory_ids: set[str]
@@ -92,10 +148,29 @@ class Rules:
     territory_type: dict[str, str]
     has_coast: set[str]
     parent_coasts: dict[str, list[str]]
-    parent_to_coast: dict[str, dict[str, str]]
+    parent_to_coast: dict[str, list[str]]
     coast_to_parent: dict[str, str]
     edges: set[tuple[str, str, str]]
     adjacency_map: dict[str, list[tuple[str, str]]]
+    index: TerritoryIndex
+    army_adjacency: dict[str, frozenset[str]]
+    fleet_adjacency: dict[str, frozenset[str]]
+    army_support_reach: dict[str, frozenset[str]]
+    fleet_support_reach: dict[str, frozenset[str]]
+    aliases: AliasTrie
+    fuzzy_index: FuzzyIndex
+    convoy_reachability: ConvoyReachability
+    supply_center_mask: int
+    coast_mask: int
+    home_center_masks: dict[str, int]
+    distances: DistanceTables
+
+
+@dataclass
+class DistanceRows:
+    rules: Rules
+    adjacent: list[list[int]]
+    rows: OrderedDict[int, array] = field(default_factory=OrderedDict)
 
 
 @dataclass(frozen=True)
@@ -139,6 +214,37 @@ class ValidationResult:
     order: Order | None = None
 
 
+@dataclass(frozen=True)
+class ValidationContext:
+    unit_type_by_territory: dict[str, UnitType]
+    owner_by_territory: dict[str, str]
+    dislodged_origins: frozenset[str]
+
+
+@dataclass
+class LegalOrderCache:
+    rules: Rules | None = None
+    watched: dict[tuple[Phase, UnitType, str], tuple[str, ...]] = field(
+        default_factory=dict
+    )
+    orders: dict[
+        tuple[Phase, UnitType, str], tuple[Neighbourhood, tuple[Order, ...]]
+    ] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class CompletionIndex:
+    player_id: str
+    orders: list[str]
+
+
+@dataclass
+class OrderImportReport:
+    accepted: int = 0
+    rejected: int = 0
+    errors: list[tuple[int, str]] = field(default_factory=list)
+
+
 @dataclass
 class ResolutionSoA:
     unit_id: list[str]
@@ -154,6 +260,7 @@ class ResolutionSoA:
     new_territory: list[str]
     strength: list[int]
     dislodged: list[bool]
+    dislodged_by: list[int]
     support_cut: list[bool]
     convoy_path_flat: list[str]
     convoy_path_start: list[int]
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from collections.abc import Iterator
+from concurrent.futures import Executor
 import json
 from pathlib import Path
 from typing import Any
 
 from diplomacy_cli.cli.ux.pretty import format_phase_resolution_report
+from diplomacy_cli.core.logic.bitsets import ownership_masks
 from diplomacy_cli.core.logic.rules_loader import load_rules
 from diplomacy_cli.core.logic.validator.orchestrator import process_phase
+from diplomacy_cli.core.logic.variants import validate_variant
 
 from diplomacy_cli.core.logic.schema import (
     Counters,
@@ -54,6 +58,7 @@ def start_game(
     variant: str = "classic",
     root_dir: Path = DEFAULT_GAMES_DIR,
 ) -> GameState:
+    validate_variant(variant)
     base = Path(root_dir)
     paths = GamePaths(base, game_id)
     gd = game_dir(paths)
@@ -196,6 +201,54 @@ def save_player_orders(
     tmp.replace(orders_file_path)
 
 
+def spool_player_orders(
+    spool_dir: Path, orders_by_player: dict[str, list[str]]
+) -> None:
+    for player, raw_orders in orders_by_player.items():
+        path = spool_dir / f"{player}.ndjson"
+        with path.open("a", encoding="utf-8") as f:
+            f.writelines(json.dumps(raw) + "\n" for raw in raw_orders)
+
+
+def _encoded_orders(saved: list[str], spooled: Path | None) -> Iterator[str]:
+    for raw in saved:
+        yield json.dumps(raw)
+    if spooled is not None:
+        with spooled.open(encoding="utf-8") as f:
+            for line in f:
+                yield line.rstrip("\n")
+
+
+def merge_spooled_orders(
+    game_id: str, spool_dir: Path, root_dir: Path = DEFAULT_GAMES_DIR
+) -> None:
+    base = Path(root_dir)
+    paths = GamePaths(base, game_id)
+    orders_file_path = orders_path(paths)
+    try:
+        saved_orders = load(orders_file_path)
+    except FileNotFoundError:
+        saved_orders = {}
+
+    spooled = {path.stem: path for path in sorted(spool_dir.glob("*.ndjson"))}
+    players = [*saved_orders, *(p for p in spooled if p not in saved_orders)]
+    tmp = orders_file_path.with_suffix(".tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        f.write("{")
+        for i, player in enumerate(players):
+            f.write(f"{',' if i else ''}\n  {json.dumps(player)}: [")
+            orders = _encoded_orders(
+                saved_orders.get(player, []), spooled.get(player)
+            )
+            empty = True
+            for j, encoded in enumerate(orders):
+                f.write(f"{',' if j else ''}\n    {encoded}")
+                empty = False
+            f.write("]" if empty else "\n  ]")
+        f.write("\n}" if players else "}")
+    tmp.replace(orders_file_path)
+
+
 def save_phase_resolution_report(
     game_id: str,
     phase_resolution_report: PhaseResolutionReport,
@@ -317,13 +370,14 @@ def apply_state_mutations(
 def process_turn(
     game_id: str,
     root_dir: Path = DEFAULT_GAMES_DIR,
+    executor: Executor | None = None,
 ) -> LoadedState:
     base = Path(root_dir)
     paths = GamePaths(base, game_id)
 
     loaded_state = load_state(game_id, base)
     rules = load_rules(loaded_state.game.game_meta["variant"])
-    report = process_phase(loaded_state, rules)
+    report = process_phase(loaded_state, rules, executor)
     print(format_phase_resolution_report(report, rules))
 
     current_turn = loaded_state.game.game_meta["turn_code"]
@@ -346,13 +400,10 @@ def process_turn(
     game_meta = dict(loaded_state.game.game_meta)
     game_meta["turn_code"] = new_turn
 
+    owned = ownership_masks(rules.index, loaded_state.game.territory_state)
     updated_players = {}
     for pid, pdata in loaded_state.game.players.items():
-        owns_territory = any(
-            t["owner_id"] == pid
-            for t in loaded_state.game.territory_state.values()
-        )
-        if not owns_territory:
+        if not owned.get(pid, 0):
             pdata = {**pdata, "status": "eliminated"}
         updated_players[pid] = pdata
 
@@ -1,5 +1,7 @@
 import json
+import os
 from importlib import resources
+from importlib.resources.abc import Traversable
 from pathlib import Path
 from typing import Any
 
@@ -12,12 +14,21 @@ def load(path: Path) -> dict[str, Any]:
     return raw
 
 
+def variant_resource(
+    variant: str, submodule: str, filename: str
+) -> Traversable:
+    pkg = f"diplomacy_cli.data.{variant}.{submodule}"
+    return resources.files(pkg).joinpath(filename)
+
+
+def load_variant_bytes(variant: str, submodule: str, filename: str) -> bytes:
+    return variant_resource(variant, submodule, filename).read_bytes()
+
+
 def load_variant_json(
     variant: str, submodule: str, filename: str
 ) -> dict | list:
-    pkg = f"diplomacy_cli.data.{variant}.{submodule}"
-    resource = resources.files(pkg).joinpath(filename)
-    text = resource.read_text(encoding="utf-8")
+    text = load_variant_bytes(variant, submodule, filename).decode("utf-8")
     data = json.loads(text)
     return data
 
@@ -27,3 +38,11 @@ def save(data: dict | list, path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", encoding="utf-8") as f:
         json.dump(data, f, indent=2)
+
+
+def save_atomic(data: bytes, path: Path) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
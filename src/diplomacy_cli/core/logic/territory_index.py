@@ -0,0 +1,150 @@
+from array import array
+from collections import defaultdict
+from collections.abc import Iterable
+
+from .schema import AdjacencyCSR, Rules, TerritoryIndex, UnitType
+
+EDGE_MODES = ("land", "sea", "both")
+ARMY_MODES = ("land", "both")
+FLEET_MODES = ("sea", "both")
+
+
+def build_csr(buckets: list[list[int]]) -> AdjacencyCSR:
+    offsets = array("I", [0])
+    targets = array("I")
+    for bucket in buckets:
+        targets.extend(bucket)
+        offsets.append(len(targets))
+    return AdjacencyCSR(offsets=offsets, targets=targets)
+
+
+def build_territory_index(
+    territory_ids: Iterable[str],
+    adjacency_map: dict[str, list[tuple[str, str]]],
+) -> TerritoryIndex:
+    names = list(dict.fromkeys(territory_ids))
+    ordinal = {tid: i for i, tid in enumerate(names)}
+    for src, neighbors in adjacency_map.items():
+        for tid in (src, *(dst for dst, _ in neighbors)):
+            if tid not in ordinal:
+                ordinal[tid] = len(names)
+                names.append(tid)
+
+    n = len(names)
+    buckets: dict[str, list[list[int]]] = {
+        mode: [[] for _ in range(n)] for mode in EDGE_MODES
+    }
+    for src, neighbors in adjacency_map.items():
+        src_ord = ordinal[src]
+        for dst, mode in neighbors:
+            buckets[mode][src_ord].append(ordinal[dst])
+
+    return TerritoryIndex(
+        names=names,
+        ordinal=ordinal,
+        land=build_csr(buckets["land"]),
+        sea=build_csr(buckets["sea"]),
+        both=build_csr(buckets["both"]),
+    )
+
+
+def build_unit_adjacency(
+    adjacency_map: dict[str, list[tuple[str, str]]],
+    modes: Iterable[str],
+) -> dict[str, frozenset[str]]:
+    allowed = set(modes)
+    return {
+        src: frozenset(dst for dst, mode in adjacent if mode in allowed)
+        for src, adjacent in adjacency_map.items()
+    }
+
+
+def build_support_reach(
+    unit_adjacency: dict[str, frozenset[str]],
+    coast_to_parent: dict[str, str],
+    parent_to_coast: dict[str, list[str]],
+) -> dict[str, frozenset[str]]:
+    origins_by_province: dict[str, set[str]] = defaultdict(set)
+    for origin, targets in unit_adjacency.items():
+        for target in targets:
+            origins_by_province[coast_to_parent.get(target, target)].add(origin)
+    reach: dict[str, frozenset[str]] = {}
+    for province, origins in origins_by_province.items():
+        frozen = frozenset(origins)
+        reach[province] = frozen
+        for coast in parent_to_coast.get(province, []):
+            reach[coast] = frozen
+    return reach
+
+
+def support_origins(
+    rules: Rules, unit_type: UnitType, target: str
+) -> frozenset[str]:
+    if unit_type == UnitType.ARMY:
+        return rules.army_support_reach.get(target, frozenset())
+    return rules.fleet_support_reach.get(target, frozenset())
+
+
+def support_targets(
+    rules: Rules, unit_type: UnitType, origin: str
+) -> list[str]:
+    if unit_type == UnitType.ARMY:
+        reachable = rules.army_adjacency.get(origin, frozenset())
+    else:
+        reachable = rules.fleet_adjacency.get(origin, frozenset())
+    targets: dict[str, None] = {}
+    for target in sorted(reachable):
+        province = rules.coast_to_parent.get(target, target)
+        targets[province] = None
+        for coast in rules.parent_to_coast.get(province, []):
+            targets[coast] = None
+    return list(targets)
+
+
+def mode_csr(index: TerritoryIndex, mode: str) -> AdjacencyCSR:
+    match mode:
+        case "land":
+            return index.land
+        case "sea":
+            return index.sea
+        case "both":
+            return index.both
+    raise ValueError(f"Unknown edge mode: {mode}")
+
+
+def neighbors(
+    index: TerritoryIndex,
+    ordinal: int,
+    modes: Iterable[str] = EDGE_MODES,
+) -> list[int]:
+    result: list[int] = []
+    for mode in modes:
+        csr = mode_csr(index, mode)
+        result.extend(
+            csr.targets[csr.offsets[ordinal] : csr.offsets[ordinal + 1]]
+        )
+    return result
+
+
+def is_adjacent(
+    index: TerritoryIndex,
+    origin: str,
+    target: str,
+    modes: Iterable[str] = EDGE_MODES,
+) -> bool:
+    src = index.ordinal.get(origin)
+    dst = index.ordinal.get(target)
+    if src is None or dst is None:
+        return False
+    for mode in modes:
+        csr = mode_csr(index, mode)
+        if dst in csr.targets[csr.offsets[src] : csr.offsets[src + 1]]:
+            return True
+    return False
+
+
+def territory_names(
+    index: TerritoryIndex, ordinals: Iterable[int]
+) -> list[str]:
+    names = index.names
+    return [names[i] for i in ordinals]
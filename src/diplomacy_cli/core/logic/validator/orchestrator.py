@@ -1,13 +1,27 @@
+import gc
+import os
+import pickle
 from collections import defaultdict, Counter
+from concurrent.futures import Executor, ProcessPoolExecutor
 from dataclasses import replace
+from multiprocessing.context import BaseContext
+from weakref import WeakKeyDictionary
 
+from diplomacy_cli.core.logic.bitsets import (
+    occupancy_masks,
+    ownership_masks,
+    popcount,
+)
 from diplomacy_cli.core.logic.turn_code import Phase, parse_turn_code
 from diplomacy_cli.core.logic.validator.resolution import (
     get_convoy_path,
     resolve_move_phase,
 )
-from diplomacy_cli.core.logic.validator.semantic import validate_semantic
-from diplomacy_cli.core.logic.validator.syntax import parse_syntax
+from diplomacy_cli.core.logic.validator.semantic import (
+    build_validation_context,
+    validate_semantic,
+)
+from diplomacy_cli.core.logic.validator.syntax import parse_orders_bulk
 
 from ..schema import (
     LoadedState,
@@ -15,11 +29,19 @@ from ..schema import (
     OrderType,
     OutcomeType,
     PhaseResolutionReport,
+    ResolutionBackend,
     ResolutionResult,
     Rules,
     SemanticResult,
+    SyntaxResult,
+    ValidationContext,
 )
 
+ValidatedOrder = tuple[SyntaxResult, SemanticResult | None]
+
+_worker_rules: Rules | None = None
+_executor_rules: WeakKeyDictionary[Executor, Rules] = WeakKeyDictionary()
+
 
 def make_semantic_map(
     loaded_state: LoadedState,
@@ -86,8 +108,156 @@ def make_adjustment_semantic_map(
     )
 
 
+def validate_player_orders(
+    player_orders: dict[str, list[str]],
+    phase: Phase,
+    rules: Rules,
+    loaded_state: LoadedState,
+    ctx: ValidationContext | None = None,
+) -> list[ValidatedOrder]:
+    if ctx is None:
+        ctx = build_validation_context(loaded_state)
+    validated: list[ValidatedOrder] = []
+    for parsed_order in parse_orders_bulk(player_orders, phase, rules.aliases):
+        if not parsed_order.valid:
+            validated.append((parsed_order, None))
+            continue
+        validated_order = validate_semantic(
+            parsed_order.player_id, parsed_order, rules, loaded_state, ctx
+        )
+        validated.append((parsed_order, validated_order))
+    return validated
+
+
+def validation_snapshot(loaded_state: LoadedState) -> LoadedState:
+    game = replace(loaded_state.game, players={}, raw_orders={})
+    return replace(loaded_state, game=game, counters={})
+
+
+def shard_player_orders(
+    player_orders: dict[str, list[str]], shards: int
+) -> list[dict[str, list[str]]]:
+    shards = max(1, shards)
+    total = max(1, sum(len(orders) for orders in player_orders.values()))
+    result: list[dict[str, list[str]]] = [{} for _ in range(shards)]
+    seen = 0
+    for player_id, orders in player_orders.items():
+        result[min(shards - 1, seen * shards // total)][player_id] = orders
+        seen += len(orders)
+    return [shard for shard in result if shard] or [{}]
+
+
+def _init_validation_worker(rules: Rules) -> None:
+    global _worker_rules
+    _worker_rules = rules
+    gc.freeze()
+
+
+def validation_executor(
+    rules: Rules,
+    max_workers: int | None = None,
+    mp_context: BaseContext | None = None,
+) -> ProcessPoolExecutor:
+    executor = ProcessPoolExecutor(
+        max_workers,
+        mp_context,
+        initializer=_init_validation_worker,
+        initargs=(rules,),
+    )
+    _executor_rules[executor] = rules
+    return executor
+
+
+def _validate_shard(
+    rules: Rules | None,
+    state: bytes | tuple[LoadedState, ValidationContext],
+    player_orders: dict[str, list[str]],
+    phase: Phase,
+) -> dict[int, list[str]]:
+    snapshot, ctx = pickle.loads(state) if isinstance(state, bytes) else state
+    if rules is None:
+        rules = _worker_rules
+    if rules is None:
+        raise RuntimeError(
+            "Validation worker has no rules; create the pool with "
+            "validation_executor()"
+        )
+    validated = validate_player_orders(
+        player_orders, phase, rules, snapshot, ctx
+    )
+    return {
+        i: semantic.errors
+        for i, (_, semantic) in enumerate(validated)
+        if semantic is not None and semantic.errors
+    }
+
+
+def _merge_shard(
+    parsed_orders: list[SyntaxResult], errors: dict[int, list[str]]
+) -> list[ValidatedOrder]:
+    validated: list[ValidatedOrder] = []
+    for i, parsed in enumerate(parsed_orders):
+        if not parsed.valid:
+            validated.append((parsed, None))
+            continue
+        assert parsed.order is not None
+        order_errors = errors.get(i, [])
+        semantic = SemanticResult(
+            player_id=parsed.player_id,
+            raw=parsed.raw,
+            normalized=parsed.normalized,
+            order=parsed.order,
+            valid=not order_errors,
+            errors=order_errors,
+        )
+        validated.append((parsed, semantic))
+    return validated
+
+
+def validate_phase_orders(
+    loaded_state: LoadedState,
+    rules: Rules,
+    phase: Phase,
+    executor: Executor | None = None,
+    shards: int | None = None,
+) -> list[ValidatedOrder]:
+    raw_orders = loaded_state.game.raw_orders
+    ctx = build_validation_context(loaded_state)
+    if executor is None:
+        return validate_player_orders(
+            raw_orders, phase, rules, loaded_state, ctx
+        )
+    shard_rules: Rules | None = rules
+    state: bytes | tuple[LoadedState, ValidationContext]
+    state = (validation_snapshot(loaded_state), ctx)
+    if isinstance(executor, ProcessPoolExecutor):
+        if _executor_rules.get(executor) is not rules:
+            raise ValueError(
+                "Process pools must be created with validation_executor() "
+                "for the same rules"
+            )
+        shard_rules = None
+        state = pickle.dumps(state, pickle.HIGHEST_PROTOCOL)
+    if shards is None:
+        shards = min(len(raw_orders), os.cpu_count() or 1)
+    sharded = shard_player_orders(raw_orders, shards)
+    futures = [
+        executor.submit(_validate_shard, shard_rules, state, shard, phase)
+        for shard in sharded
+    ]
+    validated: list[ValidatedOrder] = []
+    for shard, future in zip(sharded, futures):
+        parsed_orders = parse_orders_bulk(shard, phase, rules.aliases)
+        validated.extend(_merge_shard(parsed_orders, future.result()))
+    return validated
+
+
 def process_phase(
-    loaded_state: LoadedState, rules: Rules
+    loaded_state: LoadedState,
+    rules: Rules,
+    executor: Executor | None = None,
+    shards: int | None = None,
+    backend: ResolutionBackend = ResolutionBackend.PYTHON,
 ) -> PhaseResolutionReport:
     year, season, phase = parse_turn_code(
         loaded_state.game.game_meta["turn_code"]
@@ -98,21 +268,18 @@ def process_phase(
     syntax_errors = []
     semantic_errors = []
     resolution_results = []
-    for player, orders in loaded_state.game.raw_orders.items():
-        for order in orders:
-            parsed_order = parse_syntax(player, order, phase)
-            if not parsed_order.valid:
-                syntax_errors.append(parsed_order)
-                continue
-            valid_syntax.append(parsed_order)
-            validated_order = validate_semantic(
-                player, parsed_order, rules, loaded_state
-            )
-            if not validated_order.valid:
-                semantic_errors.append(validated_order)
-                continue
-            valid_semantics.append(validated_order)
-            validated_orders.append(validated_order)
+    for parsed_order, validated_order in validate_phase_orders(
+        loaded_state, rules, phase, executor, shards
+    ):
+        if validated_order is None:
+            syntax_errors.append(parsed_order)
+            continue
+        valid_syntax.append(parsed_order)
+        if not validated_order.valid:
+            semantic_errors.append(validated_order)
+            continue
+        valid_semantics.append(validated_order)
+        validated_orders.append(validated_order)
     if phase in {Phase.MOVEMENT, Phase.RETREAT}:
         sem_by_unit, duplicated_orders_by_unit = make_semantic_map(
             loaded_state, validated_orders
@@ -120,7 +287,7 @@ def process_phase(
     match phase:
         case Phase.MOVEMENT:
             resolution_soa = resolve_move_phase(
-                sem_by_unit, loaded_state, rules
+                sem_by_unit, loaded_state, rules, backend=backend
             )
             n = len(resolution_soa.unit_id)
             for i in range(n):
@@ -131,11 +298,9 @@ def process_phase(
                 dislodged_by_id = None
                 supported_unit_id = None
                 assert outcome is not None
-                if outcome == OutcomeType.DISLODGED:
-                    for j in range(n):
-                        if resolution_soa.new_territory[j] == origin_territory:
-                            dislodged_by_id = resolution_soa.unit_id[j]
-                            break
+                dislodger = resolution_soa.dislodged_by[i]
+                if outcome == OutcomeType.DISLODGED and dislodger >= 0:
+                    dislodged_by_id = resolution_soa.unit_id[dislodger]
                 convoy_path = get_convoy_path(resolution_soa, i)
                 if resolution_soa.order_type[i] in (
                     OrderType.SUPPORT_MOVE,
@@ -233,19 +398,18 @@ def process_phase(
                 build_by_territory,
                 duplicate_build_by_territory,
             ) = make_adjustment_semantic_map(loaded_state, validated_orders)
+            owned = ownership_masks(
+                rules.index, loaded_state.game.territory_state
+            )
+            occupied = occupancy_masks(rules.index, loaded_state.game.units)
             unit_count = {}
             supply_center_count = {}
             resolution_results = []
             for player in loaded_state.game.players.values():
                 nation = player["nation_id"]
-                unit_count[nation] = 0
-                for unit in loaded_state.game.units.values():
-                    if unit["owner_id"] == nation:
-                        unit_count[nation] += 1
-                supply_center_count[nation] = sum(
-                    1
-                    for prv in loaded_state.game.territory_state.values()
-                    if prv.get("owner_id") == nation
+                unit_count[nation] = popcount(occupied.get(nation, 0))
+                supply_center_count[nation] = popcount(
+                    owned.get(nation, 0) & rules.supply_center_mask
                 )
 
             for unit_id, disband in disband_by_id.items():
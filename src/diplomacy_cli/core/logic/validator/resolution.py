@@ -1,15 +1,26 @@
+import threading
 from collections import defaultdict, deque
-from dataclasses import dataclass, replace
+from dataclasses import dataclass, field, replace
+from importlib.util import find_spec
 
 from diplomacy_cli.core.logic.schema import (
     LoadedState,
     OrderType,
     OutcomeType,
+    ResolutionBackend,
     ResolutionSoA,
     Rules,
     SemanticResult,
     UnitType,
 )
+from diplomacy_cli.core.logic.territory_index import (
+    FLEET_MODES,
+    neighbors,
+    territory_names,
+)
+from diplomacy_cli.core.logic.territory_index import (
+    is_adjacent as territory_is_adjacent,
+)
 
 
 @dataclass(frozen=True)
@@ -24,6 +35,30 @@ class ResolutionMaps:
     convoys_by_army_origin: dict[str, list[int]]
     convoys_by_army_dest: dict[str, list[int]]
     hold_by_origin: dict[str, int]
+    support_idxs: list[int]
+
+
+@dataclass
+class ResolutionScratch:
+    occupants: defaultdict[str, list[int]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+    standoffs: deque[str] = field(default_factory=deque)
+    queued: set[str] = field(default_factory=set)
+    arrivals: dict[str, int] = field(default_factory=dict)
+    convoys_by_move: defaultdict[int, list[str]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+
+
+_local = threading.local()
+
+
+def default_scratch() -> ResolutionScratch:
+    scratch = getattr(_local, "scratch", None)
+    if scratch is None:
+        scratch = _local.scratch = ResolutionScratch()
+    return scratch
 
 
 def make_resolution_maps(soa: ResolutionSoA) -> ResolutionMaps:
@@ -37,6 +72,7 @@ def make_resolution_maps(soa: ResolutionSoA) -> ResolutionMaps:
     convoys_by_army_origin = defaultdict(list)
     convoys_by_army_dest = defaultdict(list)
     hold_by_origin = {}
+    support_idxs = []
     for idx, ot in enumerate(soa.order_type):
         match ot:
             case OrderType.MOVE:
@@ -44,6 +80,7 @@ def make_resolution_maps(soa: ResolutionSoA) -> ResolutionMaps:
                 moves_by_dest[soa.move_destination[idx]].append(idx)
             case OrderType.SUPPORT_MOVE:
                 support_by_origin[soa.orig_territory[idx]] = idx
+                support_idxs.append(idx)
                 support_moves_by_supported_dest[
                     soa.support_destination[idx]
                 ].append(idx)
@@ -52,6 +89,7 @@ def make_resolution_maps(soa: ResolutionSoA) -> ResolutionMaps:
                 ].append(idx)
             case OrderType.SUPPORT_HOLD:
                 support_by_origin[soa.orig_territory[idx]] = idx
+                support_idxs.append(idx)
                 hold_by_origin[soa.orig_territory[idx]] = idx
                 support_holds_by_supported_origin[
                     soa.support_origin[idx]
@@ -74,54 +112,34 @@ def make_resolution_maps(soa: ResolutionSoA) -> ResolutionMaps:
         convoys_by_army_origin=convoys_by_army_origin,
         convoys_by_army_dest=convoys_by_army_dest,
         hold_by_origin=hold_by_origin,
+        support_idxs=support_idxs,
     )
 
 
 def move_phase_soa(
     loaded_state: LoadedState, sem_by_unit: dict[str, SemanticResult]
 ) -> ResolutionSoA:
-    unit_id = []
-    owner_id = []
-    unit_type = []
-    orig_territory = []
-    order_type = []
-    move_destination = []
-    support_origin = []
-    support_destination = []
-    convoy_origin = []
-    convoy_destination = []
-
-    for uid, u_data in loaded_state.game.units.items():
-        sem = sem_by_unit[uid]
-
-        unit_id.append(uid)
-        owner_id.append(u_data["owner_id"])
-        unit_type.append(u_data["unit_type"])
-        orig_territory.append(u_data["territory_id"])
-
-        o = sem.order
-        order_type.append(o.order_type)
-        move_destination.append(o.destination)
-        support_origin.append(o.support_origin)
-        support_destination.append(o.support_destination)
-        convoy_origin.append(o.convoy_origin)
-        convoy_destination.append(o.convoy_destination)
-
+    units = loaded_state.game.units
+    unit_id = list(units)
+    unit_data = list(units.values())
+    orders = [sem_by_unit[uid].order for uid in unit_id]
+    orig_territory = [u["territory_id"] for u in unit_data]
     n = len(unit_id)
-    soa = ResolutionSoA(
+    return ResolutionSoA(
         unit_id=unit_id,
-        owner_id=owner_id,
-        unit_type=unit_type,
+        owner_id=[u["owner_id"] for u in unit_data],
+        unit_type=[u["unit_type"] for u in unit_data],
         orig_territory=orig_territory,
-        order_type=order_type,
-        move_destination=move_destination,
-        support_origin=support_origin,
-        support_destination=support_destination,
-        convoy_origin=convoy_origin,
-        convoy_destination=convoy_destination,
+        order_type=[o.order_type for o in orders],
+        move_destination=[o.destination for o in orders],
+        support_origin=[o.support_origin for o in orders],
+        support_destination=[o.support_destination for o in orders],
+        convoy_origin=[o.convoy_origin for o in orders],
+        convoy_destination=[o.convoy_destination for o in orders],
         new_territory=orig_territory.copy(),
         strength=[1] * n,
         dislodged=[False] * n,
+        dislodged_by=[-1] * n,
         support_cut=[False] * n,
         convoy_path_flat=[],
         convoy_path_len=[0] * n,
@@ -129,8 +147,6 @@ def move_phase_soa(
         outcome=[None] * n,
     )
 
-    return soa
-
 
 def validate_convoy(
     soa: ResolutionSoA, maps: ResolutionMaps, idx: int
@@ -195,34 +211,48 @@ def find_convoy_path(
     convoy_fleet_territories: list[str],
     rules: Rules,
 ) -> list[str] | None:
+    index = rules.index
+    ordinal = index.ordinal
     origin_coasts = rules.parent_to_coast.get(origin, {origin})
     destination_coasts = rules.parent_to_coast.get(destination, {destination})
 
-    visited = set(origin_coasts)
-    queue = deque(origin_coasts)
-    previous: dict[str, str] = {}
+    for cur in origin_coasts:
+        if cur in destination_coasts:
+            return [cur]
+
+    n = len(index.names)
+    passable = bytearray(n)
+    is_destination = bytearray(n)
+    for tid in convoy_fleet_territories:
+        if tid in ordinal:
+            passable[ordinal[tid]] = 1
+    for tid in destination_coasts:
+        if tid in ordinal:
+            passable[ordinal[tid]] = 1
+            is_destination[ordinal[tid]] = 1
+
+    visited = bytearray(n)
+    queue: deque[int] = deque()
+    for tid in origin_coasts:
+        if tid in ordinal:
+            visited[ordinal[tid]] = 1
+            queue.append(ordinal[tid])
+    previous: dict[int, int] = {}
 
     while queue:
         cur = queue.popleft()
-        if cur in destination_coasts:
+        if is_destination[cur]:
             path = [cur]
             while cur in previous:
                 cur = previous[cur]
                 path.append(cur)
-            return list(reversed(path))
+            return territory_names(index, reversed(path))
 
-        for neighbor, mode in rules.adjacency_map.get(cur, []):
-            if mode not in ("sea", "both"):
-                continue
-            if (
-                neighbor not in convoy_fleet_territories
-                and neighbor not in destination_coasts
-            ):
-                continue
-            if neighbor in visited:
+        for neighbor in neighbors(index, cur, FLEET_MODES):
+            if not passable[neighbor] or visited[neighbor]:
                 continue
 
-            visited.add(neighbor)
+            visited[neighbor] = 1
             previous[neighbor] = cur
             queue.append(neighbor)
 
@@ -242,12 +272,24 @@ def process_convoys(
     rules: Rules,
     origin_to_move: dict,
     origin_to_convoy: dict,
+    path_start: list[int] | None = None,
+    path_len: list[int] | None = None,
+    scratch: ResolutionScratch | None = None,
 ) -> tuple[list[int], list[int], list[str]]:
     n = len(soa.order_type)
-    path_start = [-1] * n
-    path_len = [0] * n
+    if path_start is None or path_len is None:
+        path_start = [-1] * n
+        path_len = [0] * n
+    else:
+        for move_idx in origin_to_move.values():
+            path_start[move_idx] = -1
+            path_len[move_idx] = 0
     path_flat = []
-    convoy_support_map: dict[int, list[str]] = defaultdict(list)
+    if scratch is None:
+        convoy_support_map: dict[int, list[str]] = defaultdict(list)
+    else:
+        convoy_support_map = scratch.convoys_by_move
+        convoy_support_map.clear()
     for idx in origin_to_convoy.values():
         if soa.dislodged[idx] or soa.outcome[idx] == OutcomeType.INVALID_CONVOY:
             continue
@@ -277,17 +319,21 @@ def process_convoys(
 
 
 def process_moves(
-    soa: ResolutionSoA, move_by_origin: dict[str, int], rules: Rules
+    soa: ResolutionSoA,
+    move_by_origin: dict[str, int],
+    rules: Rules,
+    new_territory: list[str] | None = None,
+    outcome: list[OutcomeType | None] | None = None,
 ) -> tuple[list[str], list[OutcomeType | None]]:
-    new_territory: list[str] = soa.new_territory.copy()
-    outcome: list[OutcomeType | None] = soa.outcome.copy()
+    if new_territory is None:
+        new_territory = soa.new_territory.copy()
+    if outcome is None:
+        outcome = soa.outcome.copy()
     for origin, move_idx in move_by_origin.items():
         destination = soa.move_destination[move_idx]
         assert destination is not None
         unit_type = soa.unit_type[move_idx]
-        is_adjacent = any(
-            adj == destination for adj, _ in rules.adjacency_map[origin]
-        )
+        is_adjacent = territory_is_adjacent(rules.index, origin, destination)
 
         if unit_type == UnitType.ARMY:
             has_convoy = soa.convoy_path_len[move_idx] > 0
@@ -302,24 +348,23 @@ def process_moves(
 
 
 def cut_supports(
-    soa: ResolutionSoA, move_by_origin: dict[str, int]
+    soa: ResolutionSoA,
+    maps: ResolutionMaps,
+    support_cut: list[bool] | None = None,
 ) -> list[bool]:
-    n = len(soa.order_type)
-    support_cut = [False] * n
-    for i in range(n):
-        order_type = soa.order_type[i]
-        if order_type not in (OrderType.SUPPORT_MOVE, OrderType.SUPPORT_HOLD):
-            continue
-
+    if support_cut is None:
+        support_cut = [False] * len(soa.order_type)
+    for i in maps.support_idxs:
         supporter_territory = soa.orig_territory[i]
         support_target = soa.support_destination[i]
+        support_cut[i] = False
 
-        for move_origin, move_idx in move_by_origin.items():
+        for move_idx in maps.moves_by_dest.get(supporter_territory, ()):
             if soa.new_territory[move_idx] != supporter_territory:
                 continue
             if soa.outcome[move_idx] == OutcomeType.MOVE_NO_CONVOY:
                 continue
-            if move_origin == support_target:
+            if soa.orig_territory[move_idx] == support_target:
                 continue
 
             support_cut[i] = True
@@ -328,83 +373,124 @@ def cut_supports(
     return support_cut
 
 
-def calculate_strength(soa: ResolutionSoA, maps: ResolutionMaps) -> list[int]:
-    strength = [1] * len(soa.order_type)
-    for (
-        supported_origin,
-        support_idxs,
-    ) in maps.support_moves_by_supported_origin.items():
-        for support_idx in support_idxs:
-            if soa.support_cut[support_idx]:
-                continue
-            supported_idx = maps.move_by_origin[supported_origin]
-            strength[supported_idx] += 1
-    for (
-        supported_origin,
-        support_idxs,
-    ) in maps.support_holds_by_supported_origin.items():
-        for support_idx in support_idxs:
-            if soa.support_cut[support_idx]:
-                continue
-            supported_idx = maps.hold_by_origin[supported_origin]
-            strength[supported_idx] += 1
+def calculate_strength(
+    soa: ResolutionSoA,
+    maps: ResolutionMaps,
+    strength: list[int] | None = None,
+) -> list[int]:
+    supported = [
+        (maps.move_by_origin, maps.support_moves_by_supported_origin),
+        (maps.hold_by_origin, maps.support_holds_by_supported_origin),
+    ]
+    if strength is None:
+        strength = [1] * len(soa.order_type)
+    else:
+        for by_origin, supports in supported:
+            for supported_origin in supports:
+                supported_idx = by_origin.get(supported_origin)
+                if supported_idx is not None:
+                    strength[supported_idx] = 1
+    for by_origin, supports in supported:
+        for supported_origin, support_idxs in supports.items():
+            for support_idx in support_idxs:
+                if soa.support_cut[support_idx]:
+                    continue
+                supported_idx = by_origin[supported_origin]
+                strength[supported_idx] += 1
     return strength
 
 
-def resolve_conflict(soa: ResolutionSoA) -> list[str]:
-    new_territory = soa.new_territory.copy()
+def resolve_conflict(
+    soa: ResolutionSoA,
+    new_territory: list[str] | None = None,
+    scratch: ResolutionScratch | None = None,
+) -> list[str]:
+    if new_territory is None:
+        new_territory = soa.new_territory.copy()
+    elif new_territory is not soa.new_territory:
+        new_territory[:] = soa.new_territory
+    orig_territory = soa.orig_territory
     strength = soa.strength
-
-    changed = True
-    while changed:
-        changed = False
-        contested = defaultdict(list)
-
-        for i, dest in enumerate(new_territory):
-            contested[dest].append(i)
-
-        for indices in contested.values():
-            if len(indices) == 1:
+    scratch = ResolutionScratch() if scratch is None else scratch
+
+    occupants = scratch.occupants
+    occupants.clear()
+    for i, dest in enumerate(new_territory):
+        occupants[dest].append(i)
+    standoffs = scratch.standoffs
+    queued = scratch.queued
+    standoffs.clear()
+    queued.clear()
+    for territory, idxs in occupants.items():
+        if len(idxs) > 1:
+            standoffs.append(territory)
+            queued.add(territory)
+
+    while standoffs:
+        territory = standoffs.popleft()
+        queued.discard(territory)
+        indices = occupants[territory]
+        max_s = max(strength[i] for i in indices)
+        winner = -1
+        for i in indices:
+            if strength[i] == max_s:
+                winner = i if winner == -1 else -2
+
+        kept = 0
+        for i in indices:
+            origin = orig_territory[i]
+            if i == winner or origin == territory:
+                indices[kept] = i
+                kept += 1
                 continue
-            s = [strength[i] for i in indices]
-            max_s = max(s)
-            winners = [i for i in indices if strength[i] == max_s]
-
-            if len(winners) > 1:
-                for i in indices:
-                    if new_territory[i] != soa.orig_territory[i]:
-                        new_territory[i] = soa.orig_territory[i]
-                        changed = True
-            else:
-                winner = winners[0]
-                for i in indices:
-                    if (
-                        i != winner
-                        and new_territory[i] != soa.orig_territory[i]
-                    ):
-                        new_territory[i] = soa.orig_territory[i]
-                        changed = True
+            new_territory[i] = origin
+            bounced_to = occupants[origin]
+            bounced_to.append(i)
+            if len(bounced_to) > 1 and origin not in queued:
+                standoffs.append(origin)
+                queued.add(origin)
+        del indices[kept:]
 
     return new_territory
 
 
-def detect_dislodged(soa: ResolutionSoA) -> list[bool]:
+def find_dislodgers(
+    soa: ResolutionSoA,
+    dislodged: list[bool] | None = None,
+    dislodged_by: list[int] | None = None,
+    scratch: ResolutionScratch | None = None,
+) -> tuple[list[bool], list[int]]:
     n = len(soa.unit_type)
-    dislodged = [False] * n
-    for i in range(n):
-        if soa.new_territory[i] == soa.orig_territory[i]:
-            for j in range(n):
-                if j == i:
-                    continue
-                if soa.new_territory[j] == soa.orig_territory[i]:
-                    if soa.owner_id[j] != soa.owner_id[i]:
-                        dislodged[i] = True
-                        break
-    return dislodged
+    if dislodged is None or dislodged_by is None:
+        dislodged = [False] * n
+        dislodged_by = [-1] * n
+    arrivals = {} if scratch is None else scratch.arrivals
+    arrivals.clear()
+    for j, (orig, new) in enumerate(zip(soa.orig_territory, soa.new_territory)):
+        if new != orig:
+            arrivals.setdefault(new, j)
+    for i, orig in enumerate(soa.orig_territory):
+        j = arrivals.get(orig) if soa.new_territory[i] == orig else None
+        if j is not None and soa.owner_id[j] != soa.owner_id[i]:
+            dislodged[i] = True
+            dislodged_by[i] = j
+        else:
+            dislodged[i] = False
+            dislodged_by[i] = -1
+    return dislodged, dislodged_by
+
+
+def detect_dislodged(soa: ResolutionSoA) -> list[bool]:
+    return find_dislodgers(soa)[0]
 
 
-def assign_move_outcomes(soa: ResolutionSoA) -> list[OutcomeType | None]:
-    outcome = soa.outcome.copy()
+def assign_move_outcomes(
+    soa: ResolutionSoA, outcome: list[OutcomeType | None] | None = None
+) -> list[OutcomeType | None]:
+    if outcome is None:
+        outcome = soa.outcome.copy()
+    elif outcome is not soa.outcome:
+        outcome[:] = soa.outcome
     n = len(soa.unit_id)
 
     for i in range(n):
@@ -449,37 +535,57 @@ def copy_soa(soa: ResolutionSoA) -> ResolutionSoA:
     )
 
 
+def run_resolution_pass(
+    soa: ResolutionSoA,
+    maps: ResolutionMaps,
+    rules: Rules,
+    scratch: ResolutionScratch,
+) -> None:
+    _, _, soa.convoy_path_flat = process_convoys(
+        soa,
+        rules,
+        maps.move_by_origin,
+        maps.convoy_by_origin,
+        soa.convoy_path_start,
+        soa.convoy_path_len,
+        scratch,
+    )
+    process_moves(
+        soa, maps.move_by_origin, rules, soa.new_territory, soa.outcome
+    )
+    cut_supports(soa, maps, soa.support_cut)
+    calculate_strength(soa, maps, soa.strength)
+    resolve_conflict(soa, soa.new_territory, scratch)
+    find_dislodgers(soa, soa.dislodged, soa.dislodged_by, scratch)
+
+
 def move_resolution_pass(
     soa: ResolutionSoA, maps: ResolutionMaps, rules: Rules
 ) -> ResolutionSoA:
     new_soa = copy_soa(soa)
-    (
-        new_soa.convoy_path_start,
-        new_soa.convoy_path_len,
-        new_soa.convoy_path_flat,
-    ) = process_convoys(
-        new_soa, rules, maps.move_by_origin, maps.convoy_by_origin
-    )
-    new_soa.new_territory, new_soa.outcome = process_moves(
-        new_soa, maps.move_by_origin, rules
-    )
-    new_soa.support_cut = cut_supports(new_soa, maps.move_by_origin)
-    new_soa.strength = calculate_strength(new_soa, maps)
-    new_soa.new_territory = resolve_conflict(new_soa)
-    new_soa.dislodged = detect_dislodged(new_soa)
+    run_resolution_pass(new_soa, maps, rules, ResolutionScratch())
     return new_soa
 
 
 def resolve_move_phase(
-    sem_by_unit: dict[str, SemanticResult], state: LoadedState, rules: Rules
+    sem_by_unit: dict[str, SemanticResult],
+    state: LoadedState,
+    rules: Rules,
+    scratch: ResolutionScratch | None = None,
+    backend: ResolutionBackend = ResolutionBackend.PYTHON,
 ) -> ResolutionSoA:
+    if backend == ResolutionBackend.NUMPY and find_spec("numpy") is not None:
+        from .resolution_np import resolve_move_phase_np
+
+        return resolve_move_phase_np(sem_by_unit, state, rules)
+    scratch = default_scratch() if scratch is None else scratch
     soa = move_phase_soa(state, sem_by_unit)
     maps = make_resolution_maps(soa)
     soa.outcome = flag_support_convoy_mismatches(soa, maps)
     while True:
         prev_convoy_path_flat = soa.convoy_path_flat
-        soa = move_resolution_pass(soa, maps, rules)
+        run_resolution_pass(soa, maps, rules, scratch)
         if soa.convoy_path_flat == prev_convoy_path_flat:
             break
-    soa.outcome = assign_move_outcomes(soa)
+    assign_move_outcomes(soa, soa.outcome)
     return soa
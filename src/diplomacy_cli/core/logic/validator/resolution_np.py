@@ -0,0 +1,390 @@
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from itertools import repeat
+from typing import Any
+
+import numpy as np
+
+from diplomacy_cli.core.logic.schema import (
+    LoadedState,
+    OrderType,
+    OutcomeType,
+    ResolutionSoA,
+    Rules,
+    SemanticResult,
+    TerritoryIndex,
+    UnitType,
+)
+from diplomacy_cli.core.logic.territory_index import EDGE_MODES, mode_csr
+
+from .resolution import find_convoy_path, move_phase_soa
+
+ORDER_TYPES = list(OrderType)
+OUTCOMES = list(OutcomeType)
+ORDER_CODE = {ot: code for code, ot in enumerate(ORDER_TYPES)}
+OUTCOME_CODE: dict[OutcomeType | None, int] = {
+    outcome: code for code, outcome in enumerate(OUTCOMES)
+}
+NO_OUTCOME = -1
+OUTCOME_VALUES = np.array([*OUTCOMES, None], dtype=object)
+IS_ARMY = {unit_type: unit_type == UnitType.ARMY for unit_type in UnitType}
+
+
+@dataclass
+class ResolutionArrays:
+    territories: list[str | None]
+    orig: np.ndarray
+    new: np.ndarray
+    dest: np.ndarray
+    support_origin: np.ndarray
+    support_dest: np.ndarray
+    convoy_origin: np.ndarray
+    convoy_dest: np.ndarray
+    owner: np.ndarray
+    is_army: np.ndarray
+    order: np.ndarray
+    outcome: np.ndarray
+    adjacent: np.ndarray
+    unit_at: np.ndarray
+    move_at: np.ndarray
+    strength: np.ndarray
+    support_cut: np.ndarray
+    dislodged: np.ndarray
+    dislodged_by: np.ndarray
+    path_start: np.ndarray
+    path_len: np.ndarray
+    path_flat: list[str]
+
+
+def _encode_column(
+    column: Sequence[str | None],
+    ordinal: Mapping[Any, int],
+    extra: dict[str, int],
+) -> np.ndarray:
+    n = len(column)
+    codes = np.fromiter(map(ordinal.get, column, repeat(-1)), np.int64, n)
+    missing = np.flatnonzero(codes < 0)
+    if len(missing) > column.count(None):
+        for i in missing.tolist():
+            tid = column[i]
+            if tid is not None:
+                codes[i] = extra.setdefault(tid, len(ordinal) + len(extra))
+    return codes
+
+
+def _adjacent(
+    index: TerritoryIndex, orig: np.ndarray, dest: np.ndarray
+) -> np.ndarray:
+    adjacent = np.zeros(len(orig), bool)
+    known = np.flatnonzero(
+        (orig < len(index.names)) & (dest >= 0) & (dest < len(index.names))
+    )
+    src, dst = orig[known], dest[known]
+    for mode in EDGE_MODES:
+        csr = mode_csr(index, mode)
+        offsets = np.frombuffer(csr.offsets, np.uint32)
+        targets = np.frombuffer(csr.targets, np.uint32)
+        start = offsets[src].astype(np.int64)
+        count = offsets[src + 1] - start
+        row = np.repeat(np.arange(len(src)), count)
+        first = np.repeat(start - (count.cumsum() - count), count)
+        hit = targets[first + np.arange(len(row))] == dst[row]
+        adjacent[known[row[hit]]] = True
+    return adjacent
+
+
+def encode_soa(soa: ResolutionSoA, rules: Rules) -> ResolutionArrays:
+    ordinal = rules.index.ordinal
+    extra: dict[str, int] = {}
+    orig, dest, support_origin, support_dest, convoy_origin, convoy_dest = [
+        _encode_column(column, ordinal, extra)
+        for column in (
+            soa.orig_territory,
+            soa.move_destination,
+            soa.support_origin,
+            soa.support_destination,
+            soa.convoy_origin,
+            soa.convoy_destination,
+        )
+    ]
+    if soa.new_territory == soa.orig_territory:
+        new = orig.copy()
+    else:
+        new = _encode_column(soa.new_territory, ordinal, extra)
+    territories: list[str | None] = [*rules.index.names, *extra, None]
+    n = len(soa.unit_id)
+    order = np.fromiter(
+        map(ORDER_CODE.__getitem__, soa.order_type), np.int64, n
+    )
+    owners = {owner: i for i, owner in enumerate(dict.fromkeys(soa.owner_id))}
+    unit_at = np.full(len(territories), -1, np.int64)
+    unit_at[orig] = np.arange(n)
+    moves = np.flatnonzero(order == ORDER_CODE[OrderType.MOVE])
+    move_at = np.full(len(territories), -1, np.int64)
+    move_at[orig[moves]] = moves
+    adjacent = np.zeros(n, bool)
+    adjacent[moves] = _adjacent(rules.index, orig[moves], dest[moves])
+    return ResolutionArrays(
+        territories=territories,
+        orig=orig,
+        new=new,
+        dest=dest,
+        support_origin=support_origin,
+        support_dest=support_dest,
+        convoy_origin=convoy_origin,
+        convoy_dest=convoy_dest,
+        owner=np.fromiter(map(owners.__getitem__, soa.owner_id), np.int64, n),
+        is_army=np.fromiter(map(IS_ARMY.__getitem__, soa.unit_type), bool, n),
+        order=order,
+        outcome=np.fromiter(
+            map(OUTCOME_CODE.get, soa.outcome, repeat(NO_OUTCOME)),
+            np.int64,
+            n,
+        ),
+        adjacent=adjacent,
+        unit_at=unit_at,
+        move_at=move_at,
+        strength=np.array(soa.strength, np.int64),
+        support_cut=np.array(soa.support_cut, bool),
+        dislodged=np.array(soa.dislodged, bool),
+        dislodged_by=np.array(soa.dislodged_by, np.int64),
+        path_start=np.array(soa.convoy_path_start, np.int64),
+        path_len=np.array(soa.convoy_path_len, np.int64),
+        path_flat=list(soa.convoy_path_flat),
+    )
+
+
+def decode_into(arr: ResolutionArrays, soa: ResolutionSoA) -> None:
+    territories = arr.territories
+    new_territory = soa.orig_territory.copy()
+    moved = np.flatnonzero(arr.new != arr.orig)
+    for i, code in zip(moved.tolist(), arr.new[moved].tolist()):
+        new_territory[i] = territories[code]
+    soa.new_territory = new_territory
+    soa.outcome = OUTCOME_VALUES[arr.outcome].tolist()
+    soa.strength = arr.strength.tolist()
+    soa.support_cut = arr.support_cut.tolist()
+    soa.dislodged = arr.dislodged.tolist()
+    soa.dislodged_by = arr.dislodged_by.tolist()
+    soa.convoy_path_start = arr.path_start.tolist()
+    soa.convoy_path_len = arr.path_len.tolist()
+    soa.convoy_path_flat = arr.path_flat
+
+
+def _is(arr: ResolutionArrays, *order_types: OrderType) -> np.ndarray:
+    mask = np.zeros(len(arr.order), bool)
+    for ot in order_types:
+        mask |= arr.order == ORDER_CODE[ot]
+    return mask
+
+
+def flag_support_convoy_mismatches_np(arr: ResolutionArrays) -> None:
+    arr.outcome.fill(NO_OUTCOME)
+    for order_type, origin, target, outcome in (
+        (
+            OrderType.CONVOY,
+            arr.convoy_origin,
+            arr.convoy_dest,
+            OutcomeType.INVALID_CONVOY,
+        ),
+        (
+            OrderType.SUPPORT_MOVE,
+            arr.support_origin,
+            arr.support_dest,
+            OutcomeType.INVALID_SUPPORT,
+        ),
+    ):
+        idxs = np.flatnonzero(_is(arr, order_type))
+        move = arr.move_at[origin[idxs]]
+        invalid = (move < 0) | (arr.dest[move] != target[idxs])
+        arr.outcome[idxs[invalid]] = OUTCOME_CODE[outcome]
+    idxs = np.flatnonzero(_is(arr, OrderType.SUPPORT_HOLD))
+    held = arr.unit_at[arr.support_origin[idxs]]
+    invalid = (held < 0) | (arr.order[held] != ORDER_CODE[OrderType.HOLD])
+    arr.outcome[idxs[invalid]] = OUTCOME_CODE[OutcomeType.INVALID_SUPPORT]
+
+
+def process_convoys_np(arr: ResolutionArrays, rules: Rules) -> None:
+    arr.path_start.fill(-1)
+    arr.path_len.fill(0)
+    path_flat: list[str] = []
+    territories = arr.territories
+    convoys = np.flatnonzero(
+        _is(arr, OrderType.CONVOY)
+        & ~arr.dislodged
+        & (arr.outcome != OUTCOME_CODE[OutcomeType.INVALID_CONVOY])
+    )
+    convoys_by_move: dict[int, list[str]] = {}
+    for fleet, move_idx in zip(
+        arr.orig[convoys].tolist(),
+        arr.move_at[arr.convoy_origin[convoys]].tolist(),
+    ):
+        fleet_territory = territories[fleet]
+        assert fleet_territory is not None
+        convoys_by_move.setdefault(move_idx, []).append(fleet_territory)
+    for move_idx, fleets in convoys_by_move.items():
+        origin = territories[arr.orig[move_idx]]
+        destination = territories[arr.dest[move_idx]]
+        assert origin is not None and destination is not None
+        path = find_convoy_path(origin, destination, fleets, rules)
+        if path is not None:
+            arr.path_start[move_idx] = len(path_flat)
+            arr.path_len[move_idx] = len(path)
+            path_flat.extend(path)
+    arr.path_flat = path_flat
+
+
+def process_moves_np(arr: ResolutionArrays) -> None:
+    is_move = _is(arr, OrderType.MOVE)
+    has_convoy = arr.path_len > 0
+    army = is_move & arr.is_army
+    fleet = is_move & ~arr.is_army
+    moving = (army & (arr.adjacent | has_convoy)) | (fleet & arr.adjacent)
+    arr.new[moving] = arr.dest[moving]
+    no_convoy = army & ~arr.adjacent & ~has_convoy
+    arr.outcome[no_convoy] = OUTCOME_CODE[OutcomeType.MOVE_NO_CONVOY]
+
+
+def cut_supports_np(arr: ResolutionArrays) -> None:
+    is_move = _is(arr, OrderType.MOVE)
+    attack = (
+        is_move
+        & (arr.new == arr.dest)
+        & (arr.outcome != OUTCOME_CODE[OutcomeType.MOVE_NO_CONVOY])
+    )
+    attacks_on = np.bincount(arr.dest[attack], minlength=len(arr.territories))
+    supports = np.flatnonzero(
+        _is(arr, OrderType.SUPPORT_MOVE, OrderType.SUPPORT_HOLD)
+    )
+    supporter = arr.orig[supports]
+    target_unit = arr.unit_at[arr.support_dest[supports]]
+    from_target = (
+        (target_unit >= 0)
+        & attack[target_unit]
+        & (arr.dest[target_unit] == supporter)
+    )
+    arr.support_cut.fill(False)
+    arr.support_cut[supports] = attacks_on[supporter] - from_target > 0
+
+
+def _supported_units(
+    arr: ResolutionArrays, support_type: OrderType, *target_types: OrderType
+) -> np.ndarray:
+    supports = _is(arr, support_type) & ~arr.support_cut
+    by_origin = np.full(len(arr.territories), -1, np.int64)
+    targets = np.flatnonzero(_is(arr, *target_types))
+    by_origin[arr.orig[targets]] = targets
+    supported_origin = arr.support_origin[supports]
+    supported = by_origin[supported_origin]
+    missing = supported < 0
+    if missing.any():
+        raise KeyError(arr.territories[supported_origin[missing][0]])
+    return supported
+
+
+def calculate_strength_np(arr: ResolutionArrays) -> None:
+    arr.strength.fill(1)
+    np.add.at(
+        arr.strength,
+        _supported_units(arr, OrderType.SUPPORT_MOVE, OrderType.MOVE),
+        1,
+    )
+    np.add.at(
+        arr.strength,
+        _supported_units(
+            arr,
+            OrderType.SUPPORT_HOLD,
+            OrderType.HOLD,
+            OrderType.SUPPORT_HOLD,
+        ),
+        1,
+    )
+
+
+def resolve_conflict_np(arr: ResolutionArrays) -> None:
+    k = len(arr.territories)
+    new, orig, strength = arr.new, arr.orig, arr.strength
+
+    best = np.zeros(k, np.int64)
+    np.maximum.at(best, new, strength)
+    at_best = strength == best[new]
+    unique = np.bincount(new[at_best], minlength=k)[new] == 1
+    bounced = np.flatnonzero((new != orig) & ~(at_best & unique))
+    new[bounced] = orig[bounced]
+
+    movers = np.flatnonzero(new != orig)
+    mover_at = np.full(k, -1, np.int64)
+    mover_at[new[movers]] = movers
+    while bounced.size:
+        occupant = mover_at[orig[bounced]]
+        held = occupant >= 0
+        occupant, returned = occupant[held], bounced[held]
+        bounced = occupant[strength[occupant] <= strength[returned]]
+        mover_at[new[bounced]] = -1
+        new[bounced] = orig[bounced]
+
+
+def find_dislodgers_np(arr: ResolutionArrays) -> None:
+    n = len(arr.new)
+    moved = arr.new != arr.orig
+    first = np.full(len(arr.territories), n, np.int64)
+    np.minimum.at(first, arr.new[moved], np.flatnonzero(moved))
+    attacker = first[arr.orig]
+    found = ~moved & (attacker < n)
+    dislodged = found.copy()
+    dislodged[found] = arr.owner[attacker[found]] != arr.owner[found]
+    arr.dislodged[:] = dislodged
+    arr.dislodged_by[:] = np.where(dislodged, attacker, -1)
+
+
+def assign_move_outcomes_np(arr: ResolutionArrays) -> None:
+    pending = arr.outcome == NO_OUTCOME
+    outcome = arr.outcome
+    outcome[pending & arr.dislodged] = OUTCOME_CODE[OutcomeType.DISLODGED]
+    pending &= ~arr.dislodged
+
+    moves = pending & _is(arr, OrderType.MOVE)
+    success = moves & (arr.new == arr.dest)
+    bounced = moves & ~success & (arr.new == arr.orig)
+    inconsistent = np.flatnonzero(moves & ~success & ~bounced)
+    if inconsistent.size:
+        raise ValueError(
+            f"Inconsistent new_territory for MOVE at index {inconsistent[0]}"
+        )
+    outcome[success] = OUTCOME_CODE[OutcomeType.MOVE_SUCCESS]
+    outcome[bounced] = OUTCOME_CODE[OutcomeType.MOVE_BOUNCED]
+
+    supports = pending & _is(
+        arr, OrderType.SUPPORT_HOLD, OrderType.SUPPORT_MOVE
+    )
+    outcome[supports & arr.support_cut] = OUTCOME_CODE[OutcomeType.SUPPORT_CUT]
+    outcome[supports & ~arr.support_cut] = OUTCOME_CODE[
+        OutcomeType.SUPPORT_SUCCESS
+    ]
+    outcome[pending & _is(arr, OrderType.HOLD)] = OUTCOME_CODE[
+        OutcomeType.HOLD_SUCCESS
+    ]
+    outcome[pending & _is(arr, OrderType.CONVOY)] = OUTCOME_CODE[
+        OutcomeType.CONVOY_SUCCESS
+    ]
+
+
+def resolve_move_phase_np(
+    sem_by_unit: dict[str, SemanticResult], state: LoadedState, rules: Rules
+) -> ResolutionSoA:
+    soa = move_phase_soa(state, sem_by_unit)
+    arr = encode_soa(soa, rules)
+    flag_support_convoy_mismatches_np(arr)
+    while True:
+        prev_path_flat = arr.path_flat
+        process_convoys_np(arr, rules)
+        process_moves_np(arr)
+        cut_supports_np(arr)
+        calculate_strength_np(arr)
+        resolve_conflict_np(arr)
+        find_dislodgers_np(arr)
+        if arr.path_flat == prev_path_flat:
+            break
+    assign_move_outcomes_np(arr)
+    decode_into(arr, soa)
+    return soa
@@ -1,5 +1,8 @@
-from collections import deque
+from enum import Enum
+from typing import NamedTuple
 
+from ..convoy import has_sea_route
+from ..fuzzy import suggest_territories
 from ..rules_loader import Rules
 from ..schema import (
     LoadedState,
@@ -10,25 +13,157 @@ from ..schema import (
     SyntaxResult,
     TerritoryToUnit,
     UnitType,
+    ValidationContext,
 )
+from ..territory_index import support_origins
 
 
 class SemanticError(Exception):
     pass
 
 
+class UnknownTerritoryError(SemanticError):
+    def __init__(self, territory: str):
+        self.territory = territory
+        super().__init__(f"{territory} is not a valid territory")
+
+
 class InvalidSyntaxError(Exception):
     pass
 
 
+class SemanticErrorCode(str, Enum):
+    UNKNOWN_TERRITORY = "unknown_territory"
+    NO_UNIT = "no_unit"
+    NOT_OWNER = "not_owner"
+    UNREACHABLE = "unreachable"
+    NO_CONVOY_ROUTE = "no_convoy_route"
+    CONVOY_INCOMPLETE = "convoy_incomplete"
+    NO_FLEET_TO_CONVOY = "no_fleet_to_convoy"
+    NO_ARMY_TO_CONVOY = "no_army_to_convoy"
+    NO_SEA_PATH = "no_sea_path"
+    NOT_HOME_CENTER = "not_home_center"
+    CENTER_NOT_OWNED = "center_not_owned"
+    BUILD_OCCUPIED = "build_occupied"
+    FLEET_INLAND = "fleet_inland"
+    NO_UNIT_OF_TYPE = "no_unit_of_type"
+    NO_RETREAT_DESTINATION = "no_retreat_destination"
+    NOT_DISLODGED = "not_dislodged"
+    OCCUPIED = "occupied"
+
+
+SEMANTIC_MESSAGES = {
+    SemanticErrorCode.UNKNOWN_TERRITORY: "{0} is not a valid territory",
+    SemanticErrorCode.NO_UNIT: "Unit does not exist in {0}",
+    SemanticErrorCode.NOT_OWNER: "Unit in {0} does not belong to {1}",
+    SemanticErrorCode.UNREACHABLE: (
+        "{0} at {1} cannot reach {2} (requires {3}-appropriate edge)"
+    ),
+    SemanticErrorCode.NO_CONVOY_ROUTE: (
+        "Army at {0} cannot reach {1}: no continuous sea route for convoy"
+    ),
+    SemanticErrorCode.CONVOY_INCOMPLETE: (
+        "Convoy must specify both origin and destination"
+    ),
+    SemanticErrorCode.NO_FLEET_TO_CONVOY: "No fleet at {0} to convoy",
+    SemanticErrorCode.NO_ARMY_TO_CONVOY: "No army at {0} to convoy",
+    SemanticErrorCode.NO_SEA_PATH: "No valid sea path between {0} and {1}",
+    SemanticErrorCode.NOT_HOME_CENTER: "{0} is not a home center of {1}",
+    SemanticErrorCode.CENTER_NOT_OWNED: "{0} does not belong to {1}",
+    SemanticErrorCode.BUILD_OCCUPIED: (
+        "Cannot build in {0}: territory is occupied"
+    ),
+    SemanticErrorCode.FLEET_INLAND: "Fleets can only be built on coasts",
+    SemanticErrorCode.NO_UNIT_OF_TYPE: "No {0} at {1}",
+    SemanticErrorCode.NO_RETREAT_DESTINATION: (
+        "Retreat must specify a destination"
+    ),
+    SemanticErrorCode.NOT_DISLODGED: "No dislodged unit at {0}",
+    SemanticErrorCode.OCCUPIED: "{0} is occupied",
+}
+
+
+class SemanticIssue(NamedTuple):
+    code: SemanticErrorCode
+    args: tuple[str, ...] = ()
+
+    @property
+    def message(self) -> str:
+        return SEMANTIC_MESSAGES[self.code].format(*self.args)
+
+
+Issue = SemanticIssue | None
+
+
+def build_validation_context(state: LoadedState) -> ValidationContext:
+    unit_type_by_territory = {}
+    owner_by_territory = {}
+    units = state.game.units
+    for territory, unit_id in state.territory_to_unit.items():
+        unit = units[unit_id]
+        unit_type_by_territory[territory] = UnitType(unit["unit_type"])
+        owner_by_territory[territory] = unit["owner_id"]
+    dislodged_origins = frozenset()
+    if state.pending_move is not None:
+        dislodged_origins = frozenset(
+            result.origin_territory
+            for result in state.pending_move.resolution_results
+            if result.outcome == OutcomeType.DISLODGED
+        )
+    return ValidationContext(
+        unit_type_by_territory=unit_type_by_territory,
+        owner_by_territory=owner_by_territory,
+        dislodged_origins=dislodged_origins,
+    )
+
+
+def _context(
+    state: LoadedState, ctx: ValidationContext | None
+) -> ValidationContext:
+    return ctx if ctx is not None else build_validation_context(state)
+
+
+def _raise(issue: Issue) -> None:
+    if issue is None:
+        return
+    if issue.code == SemanticErrorCode.UNKNOWN_TERRITORY:
+        raise UnknownTerritoryError(issue.args[0])
+    raise SemanticError(issue.message)
+
+
+def _territory_issue(territory_ids: set, *prvs: str) -> Issue:
+    for prv in prvs:
+        if prv not in territory_ids:
+            return SemanticIssue(SemanticErrorCode.UNKNOWN_TERRITORY, (prv,))
+    return None
+
+
+def _unit_issue(territory_to_unit: TerritoryToUnit, *origins: str) -> Issue:
+    for origin in origins:
+        if origin not in territory_to_unit:
+            return SemanticIssue(SemanticErrorCode.NO_UNIT, (origin,))
+    return None
+
+
+def _owner_issue(player_id: str, origin: str, ctx: ValidationContext) -> Issue:
+    if player_id != ctx.owner_by_territory[origin]:
+        return SemanticIssue(SemanticErrorCode.NOT_OWNER, (origin, player_id))
+    return None
+
+
+def _unreachable(unit_type: UnitType, origin: str, target: str) -> Issue:
+    return SemanticIssue(
+        SemanticErrorCode.UNREACHABLE,
+        (unit_type.value.title(), origin, target, unit_type.value),
+    )
+
+
 def _check_territory_exists(prv: str, territory_ids: set) -> None:
-    if prv not in territory_ids:
-        raise SemanticError(f"{prv} is not a valid territory")
+    _raise(_territory_issue(territory_ids, prv))
 
 
 def _check_unit_exists(origin: str, territory_to_unit: TerritoryToUnit) -> None:
-    if origin not in territory_to_unit:
-        raise SemanticError(f"Unit does not exist in {origin}")
+    _raise(_unit_issue(territory_to_unit, origin))
 
 
 def _check_unit_ownership(
@@ -43,213 +178,402 @@ def _check_unit_ownership(
         raise SemanticError(f"Unit in {origin} does not belong to {player_id}")
 
 
-def _check_adjacency(
+def _adjacency_issue(
     origin: str,
     target: str,
-    state: LoadedState,
     rules: Rules,
+    ctx: ValidationContext,
     allow_convoy: bool = False,
-) -> None:
-    _check_territory_exists(origin, rules.territory_ids)
-    _check_territory_exists(target, rules.territory_ids)
-    unit_id = state.territory_to_unit[origin]
-    unit_type = UnitType(state.game.units[unit_id]["unit_type"])
-
-    for a, b, edge_type in rules.edges:
-        if {a, b} == {origin, target}:
-            if unit_type == UnitType.ARMY and edge_type in ("land", "both"):
-                return
-            if unit_type == UnitType.FLEET and edge_type in ("sea", "both"):
-                return
+) -> Issue:
+    issue = _territory_issue(rules.territory_ids, origin, target)
+    if issue:
+        return issue
+    unit_type = ctx.unit_type_by_territory[origin]
+
+    if unit_type == UnitType.ARMY:
+        reachable = rules.army_adjacency.get(origin, frozenset())
+    else:
+        reachable = rules.fleet_adjacency.get(origin, frozenset())
+    if target in reachable:
+        return None
 
     if allow_convoy and unit_type == UnitType.ARMY:
         if _has_sea_path(origin, target, rules):
-            return
-        raise SemanticError(
-            f"Army at {origin} cannot reach {target}: "
-            "no continuous sea route for convoy"
+            return None
+        return SemanticIssue(
+            SemanticErrorCode.NO_CONVOY_ROUTE, (origin, target)
         )
 
-    raise SemanticError(
-        f"{unit_type.value.title()} at {origin} cannot reach {target} "
-        f"(requires {unit_type.value}-appropriate edge)"
-    )
-
+    return _unreachable(unit_type, origin, target)
 
-def _has_sea_path(origin: str, target: str, rules: Rules) -> bool:
-    terr_type = rules.territory_type
-    origin_coasts = rules.parent_to_coast.get(origin, {origin})
-    target_coasts = rules.parent_to_coast.get(target, {target})
-
-    visited = set(origin_coasts)
-    queue = deque(origin_coasts)
 
-    while queue:
-        cur = queue.popleft()
-        if cur in target_coasts:
-            return True
+def _check_adjacency(
+    origin: str,
+    target: str,
+    state: LoadedState,
+    rules: Rules,
+    allow_convoy: bool = False,
+    ctx: ValidationContext | None = None,
+) -> None:
+    _raise(
+        _adjacency_issue(
+            origin, target, rules, _context(state, ctx), allow_convoy
+        )
+    )
 
-        for a, b, mode in rules.edges:
-            if mode not in ("sea", "both"):
-                continue
-            neigh = b if a == cur else a if b == cur else None
-            if not neigh or neigh in visited:
-                continue
 
-            if terr_type.get(neigh) == "land" and neigh not in target_coasts:
+def _support_reach_issue(
+    origin: str, target: str, rules: Rules, ctx: ValidationContext
+) -> Issue:
+    unit_type = ctx.unit_type_by_territory[origin]
+    if origin not in support_origins(rules, unit_type, target):
+        return _unreachable(unit_type, origin, target)
+    return None
+
+
+def potential_supporters(
+    target: str, state: LoadedState, rules: Rules
+) -> list[str]:
+    supporters = []
+    units = state.game.units
+    for unit_type in UnitType:
+        for origin in sorted(support_origins(rules, unit_type, target)):
+            unit_id = state.territory_to_unit.get(origin)
+            if unit_id is None:
                 continue
+            if units[unit_id]["unit_type"] == unit_type.value:
+                supporters.append(unit_id)
+    return supporters
 
-            visited.add(neigh)
-            queue.append(neigh)
 
-    return False
+def _has_sea_path(origin: str, target: str, rules: Rules) -> bool:
+    return has_sea_route(origin, target, rules)
 
 
-def _check_hold(player_id: str, order: Order, state: LoadedState, rules: Rules):
-    _check_territory_exists(order.origin, rules.territory_ids)
-    _check_unit_exists(order.origin, state.territory_to_unit)
-    _check_unit_ownership(
-        player_id, order.origin, state.game.units, state.territory_to_unit
+def _hold_issue(
+    player_id: str,
+    order: Order,
+    state: LoadedState,
+    rules: Rules,
+    ctx: ValidationContext,
+) -> Issue:
+    return (
+        _territory_issue(rules.territory_ids, order.origin)
+        or _unit_issue(state.territory_to_unit, order.origin)
+        or _owner_issue(player_id, order.origin, ctx)
     )
 
 
-def _check_support_hold(
-    player_id: str, order: Order, state: LoadedState, rules: Rules
-):
+def _support_hold_issue(
+    player_id: str,
+    order: Order,
+    state: LoadedState,
+    rules: Rules,
+    ctx: ValidationContext,
+) -> Issue:
     assert order.support_origin is not None
-    _check_territory_exists(order.origin, rules.territory_ids)
-    _check_territory_exists(order.support_origin, rules.territory_ids)
-    _check_unit_exists(order.origin, state.territory_to_unit)
-    _check_unit_exists(order.support_origin, state.territory_to_unit)
-    _check_adjacency(order.origin, order.support_origin, state, rules)
-    _check_unit_ownership(
-        player_id, order.origin, state.game.units, state.territory_to_unit
+    return (
+        _territory_issue(
+            rules.territory_ids, order.origin, order.support_origin
+        )
+        or _unit_issue(
+            state.territory_to_unit, order.origin, order.support_origin
+        )
+        or _support_reach_issue(order.origin, order.support_origin, rules, ctx)
+        or _owner_issue(player_id, order.origin, ctx)
     )
 
 
-def _check_convoy(
-    player_id: str, order: Order, state: LoadedState, rules: Rules
-):
+def _convoy_issue(
+    player_id: str,
+    order: Order,
+    state: LoadedState,
+    rules: Rules,
+    ctx: ValidationContext,
+) -> Issue:
     if not order.convoy_origin or not order.convoy_destination:
-        raise SemanticError("Convoy must specify both origin and destination")
-
-    for terr in (order.origin, order.convoy_origin, order.convoy_destination):
-        _check_territory_exists(terr, rules.territory_ids)
-
-    _check_unit_ownership(
-        player_id, order.origin, state.game.units, state.territory_to_unit
-    )
-    _check_unit_exists(order.origin, state.territory_to_unit)
-    fleet = state.game.units[state.territory_to_unit[order.origin]]
-    if fleet["unit_type"] != UnitType.FLEET.value:
-        raise SemanticError(f"No fleet at {order.origin} to convoy")
+        return SemanticIssue(SemanticErrorCode.CONVOY_INCOMPLETE)
+
+    issue = _territory_issue(
+        rules.territory_ids,
+        order.origin,
+        order.convoy_origin,
+        order.convoy_destination,
+    ) or _owner_issue(player_id, order.origin, ctx)
+    if issue:
+        return issue
+    if issue := _unit_issue(state.territory_to_unit, order.origin):
+        return issue
+    if ctx.unit_type_by_territory[order.origin] != UnitType.FLEET:
+        return SemanticIssue(
+            SemanticErrorCode.NO_FLEET_TO_CONVOY, (order.origin,)
+        )
 
-    _check_unit_exists(order.convoy_origin, state.territory_to_unit)
-    army = state.game.units[state.territory_to_unit[order.convoy_origin]]
-    if army["unit_type"] != UnitType.ARMY.value:
-        raise SemanticError(f"No army at {order.convoy_origin} to convoy")
+    if issue := _unit_issue(state.territory_to_unit, order.convoy_origin):
+        return issue
+    if ctx.unit_type_by_territory[order.convoy_origin] != UnitType.ARMY:
+        return SemanticIssue(
+            SemanticErrorCode.NO_ARMY_TO_CONVOY, (order.convoy_origin,)
+        )
 
     if not _has_sea_path(order.convoy_origin, order.convoy_destination, rules):
-        raise SemanticError(
-            f"No valid sea path between {order.convoy_origin}"
-            f" and {order.convoy_destination}"
+        return SemanticIssue(
+            SemanticErrorCode.NO_SEA_PATH,
+            (order.convoy_origin, order.convoy_destination),
         )
+    return None
 
 
-def _check_move(player_id: str, order: Order, state: LoadedState, rules: Rules):
+def _move_issue(
+    player_id: str,
+    order: Order,
+    state: LoadedState,
+    rules: Rules,
+    ctx: ValidationContext,
+) -> Issue:
     assert order.destination is not None
-    _check_territory_exists(order.origin, rules.territory_ids)
-    _check_territory_exists(order.destination, rules.territory_ids)
-    _check_unit_ownership(
-        player_id, order.origin, state.game.units, state.territory_to_unit
-    )
-    _check_adjacency(
-        order.origin, order.destination, state, rules, allow_convoy=True
+    return (
+        _territory_issue(rules.territory_ids, order.origin, order.destination)
+        or _owner_issue(player_id, order.origin, ctx)
+        or _adjacency_issue(
+            order.origin, order.destination, rules, ctx, allow_convoy=True
+        )
     )
 
 
-def _check_support_move(
-    player_id: str, order: Order, state: LoadedState, rules: Rules
-):
+def _support_move_issue(
+    player_id: str,
+    order: Order,
+    state: LoadedState,
+    rules: Rules,
+    ctx: ValidationContext,
+) -> Issue:
     assert order.support_origin is not None
     assert order.support_destination is not None
-    _check_territory_exists(order.origin, rules.territory_ids)
-    _check_territory_exists(order.support_origin, rules.territory_ids)
-    _check_territory_exists(order.support_destination, rules.territory_ids)
-    _check_unit_exists(order.origin, state.territory_to_unit)
-    _check_unit_exists(order.support_origin, state.territory_to_unit)
-    _check_unit_ownership(
-        player_id, order.origin, state.game.units, state.territory_to_unit
-    )
-    _check_adjacency(order.origin, order.support_destination, state, rules)
-    _check_adjacency(
-        order.support_origin, order.support_destination, state, rules
+    return (
+        _territory_issue(
+            rules.territory_ids,
+            order.origin,
+            order.support_origin,
+            order.support_destination,
+        )
+        or _unit_issue(
+            state.territory_to_unit, order.origin, order.support_origin
+        )
+        or _owner_issue(player_id, order.origin, ctx)
+        or _support_reach_issue(
+            order.origin, order.support_destination, rules, ctx
+        )
+        or _support_reach_issue(
+            order.support_origin, order.support_destination, rules, ctx
+        )
     )
 
 
-def _check_build(
-    player_id: str, order: Order, state: LoadedState, rules: Rules
-) -> None:
-    _check_territory_exists(order.origin, rules.territory_ids)
+def _build_issue(
+    player_id: str,
+    order: Order,
+    state: LoadedState,
+    rules: Rules,
+    ctx: ValidationContext,
+) -> Issue:
+    if issue := _territory_issue(rules.territory_ids, order.origin):
+        return issue
     prv = order.origin
     if prv not in rules.home_centers[player_id]:
-        raise SemanticError(f"{prv} is not a home center of {player_id}")
+        return SemanticIssue(
+            SemanticErrorCode.NOT_HOME_CENTER, (prv, player_id)
+        )
     if state.game.territory_state[prv]["owner_id"] != player_id:
-        raise SemanticError(f"{prv} does not belong to {player_id}")
-    if order.origin in state.territory_to_unit:
-        raise SemanticError(
-            f"Cannot build in {order.origin}: territory is occupied"
+        return SemanticIssue(
+            SemanticErrorCode.CENTER_NOT_OWNED, (prv, player_id)
         )
+    if order.origin in state.territory_to_unit:
+        return SemanticIssue(SemanticErrorCode.BUILD_OCCUPIED, (prv,))
     if (
         order.unit_type == UnitType.FLEET
         and order.origin not in rules.has_coast
     ):
-        raise SemanticError("Fleets can only be built on coasts")
+        return SemanticIssue(SemanticErrorCode.FLEET_INLAND)
+    return None
 
 
-def _check_disband(
-    player_id: str, order: Order, state: LoadedState, rules: Rules
-) -> None:
-    _check_territory_exists(order.origin, rules.territory_ids)
-    _check_unit_exists(order.origin, state.territory_to_unit)
-    assert order.unit_type is not None
-    if (
-        state.game.units[state.territory_to_unit[order.origin]]["unit_type"]
-        != order.unit_type.value
-    ):
-        raise SemanticError(f"No {order.unit_type.value} at {order.origin}")
-    _check_unit_ownership(
-        player_id, order.origin, state.game.units, state.territory_to_unit
+def _disband_issue(
+    player_id: str,
+    order: Order,
+    state: LoadedState,
+    rules: Rules,
+    ctx: ValidationContext,
+) -> Issue:
+    issue = _territory_issue(rules.territory_ids, order.origin) or _unit_issue(
+        state.territory_to_unit, order.origin
     )
+    if issue:
+        return issue
+    assert order.unit_type is not None
+    if ctx.unit_type_by_territory[order.origin] != order.unit_type:
+        return SemanticIssue(
+            SemanticErrorCode.NO_UNIT_OF_TYPE,
+            (order.unit_type.value, order.origin),
+        )
+    return _owner_issue(player_id, order.origin, ctx)
 
 
-def _check_retreat(
-    player_id: str, order: Order, state: LoadedState, rules: Rules
-) -> None:
+def _retreat_issue(
+    player_id: str,
+    order: Order,
+    state: LoadedState,
+    rules: Rules,
+    ctx: ValidationContext,
+) -> Issue:
     if order.destination is None:
-        raise SemanticError("Retreat must specify a destination")
+        return SemanticIssue(SemanticErrorCode.NO_RETREAT_DESTINATION)
 
-    dislodged_units_by_origin = []
     assert state.pending_move is not None
-    for result in state.pending_move.resolution_results:
-        if result.outcome == OutcomeType.DISLODGED:
-            dislodged_units_by_origin.append(result.origin_territory)
-    if order.origin not in dislodged_units_by_origin:
-        raise SemanticError(f"No dislodged unit at {order.origin}")
-    _check_territory_exists(order.origin, rules.territory_ids)
-    _check_unit_exists(order.origin, state.territory_to_unit)
-    _check_unit_ownership(
-        player_id, order.origin, state.game.units, state.territory_to_unit
+    if order.origin not in ctx.dislodged_origins:
+        return SemanticIssue(SemanticErrorCode.NOT_DISLODGED, (order.origin,))
+    issue = (
+        _territory_issue(rules.territory_ids, order.origin)
+        or _unit_issue(state.territory_to_unit, order.origin)
+        or _owner_issue(player_id, order.origin, ctx)
+        or _adjacency_issue(order.origin, order.destination, rules, ctx)
     )
-    _check_territory_exists(order.destination, rules.territory_ids)
-    _check_adjacency(order.origin, order.destination, state, rules)
+    if issue:
+        return issue
 
     if order.destination in state.territory_to_unit:
-        raise SemanticError(f"{order.destination} is occupied")
+        return SemanticIssue(SemanticErrorCode.OCCUPIED, (order.destination,))
+    return None
+
+
+def _check_hold(
+    player_id: str,
+    order: Order,
+    state: LoadedState,
+    rules: Rules,
+    ctx: ValidationContext | None = None,
+) -> None:
+    ctx = _context(state, ctx)
+    _raise(_hold_issue(player_id, order, state, rules, ctx))
+
+
+def _check_support_hold(
+    player_id: str,
+    order: Order,
+    state: LoadedState,
+    rules: Rules,
+    ctx: ValidationContext | None = None,
+) -> None:
+    ctx = _context(state, ctx)
+    _raise(_support_hold_issue(player_id, order, state, rules, ctx))
+
+
+def _check_convoy(
+    player_id: str,
+    order: Order,
+    state: LoadedState,
+    rules: Rules,
+    ctx: ValidationContext | None = None,
+) -> None:
+    ctx = _context(state, ctx)
+    _raise(_convoy_issue(player_id, order, state, rules, ctx))
+
+
+def _check_move(
+    player_id: str,
+    order: Order,
+    state: LoadedState,
+    rules: Rules,
+    ctx: ValidationContext | None = None,
+) -> None:
+    ctx = _context(state, ctx)
+    _raise(_move_issue(player_id, order, state, rules, ctx))
+
+
+def _check_support_move(
+    player_id: str,
+    order: Order,
+    state: LoadedState,
+    rules: Rules,
+    ctx: ValidationContext | None = None,
+) -> None:
+    ctx = _context(state, ctx)
+    _raise(_support_move_issue(player_id, order, state, rules, ctx))
+
+
+def _check_build(
+    player_id: str,
+    order: Order,
+    state: LoadedState,
+    rules: Rules,
+    ctx: ValidationContext | None = None,
+) -> None:
+    ctx = _context(state, ctx)
+    _raise(_build_issue(player_id, order, state, rules, ctx))
+
+
+def _check_disband(
+    player_id: str,
+    order: Order,
+    state: LoadedState,
+    rules: Rules,
+    ctx: ValidationContext | None = None,
+) -> None:
+    ctx = _context(state, ctx)
+    _raise(_disband_issue(player_id, order, state, rules, ctx))
+
+
+def _check_retreat(
+    player_id: str,
+    order: Order,
+    state: LoadedState,
+    rules: Rules,
+    ctx: ValidationContext | None = None,
+) -> None:
+    ctx = _context(state, ctx)
+    _raise(_retreat_issue(player_id, order, state, rules, ctx))
+
+
+CHECKERS = {
+    OrderType.MOVE: _move_issue,
+    OrderType.SUPPORT_MOVE: _support_move_issue,
+    OrderType.SUPPORT_HOLD: _support_hold_issue,
+    OrderType.CONVOY: _convoy_issue,
+    OrderType.BUILD: _build_issue,
+    OrderType.DISBAND: _disband_issue,
+    OrderType.HOLD: _hold_issue,
+    OrderType.RETREAT: _retreat_issue,
+}
+
+
+def check_semantic(
+    player_id: str,
+    order: Order,
+    rules: Rules,
+    state: LoadedState,
+    ctx: ValidationContext | None = None,
+) -> Issue:
+    checker = CHECKERS.get(order.order_type)
+    if checker is None:
+        raise SemanticError(f"Unhandled order type: {order.order_type}")
+    return checker(player_id, order, state, rules, _context(state, ctx))
+
+
+def render_issue(issue: SemanticIssue, rules: Rules) -> list[str]:
+    errors = [issue.message]
+    if issue.code == SemanticErrorCode.UNKNOWN_TERRITORY:
+        suggestions = suggest_territories(rules.fuzzy_index, issue.args[0])
+        if suggestions:
+            errors.append(f"Did you mean: {', '.join(suggestions)}?")
+    return errors
 
 
 def validate_semantic(
-    player_id: str, syntax: SyntaxResult, rules: Rules, state: LoadedState
+    player_id: str,
+    syntax: SyntaxResult,
+    rules: Rules,
+    state: LoadedState,
+    ctx: ValidationContext | None = None,
 ):
     if not syntax.valid or syntax.order is None:
         raise InvalidSyntaxError(
@@ -257,26 +581,8 @@ def validate_semantic(
         )
 
     order = syntax.order
-    errors: list[str] = []
-    checker_map = {
-        OrderType.MOVE: _check_move,
-        OrderType.SUPPORT_MOVE: _check_support_move,
-        OrderType.SUPPORT_HOLD: _check_support_hold,
-        OrderType.CONVOY: _check_convoy,
-        OrderType.BUILD: _check_build,
-        OrderType.DISBAND: _check_disband,
-        OrderType.HOLD: _check_hold,
-        OrderType.RETREAT: _check_retreat,
-    }
-
-    checker = checker_map.get(order.order_type)
-    if checker is None:
-        raise SemanticError(f"Unhandled order type: {order.order_type}")
-
-    try:
-        checker(player_id, order, state, rules)
-    except SemanticError as e:
-        errors.append(str(e))
+    issue = check_semantic(player_id, order, rules, state, ctx)
+    errors = [] if issue is None else render_issue(issue, rules)
 
     return SemanticResult(
         player_id=player_id,
@@ -1,6 +1,7 @@
 import re
+from functools import lru_cache
 
-from ..schema import Order, OrderType, SyntaxResult, UnitType
+from ..schema import AliasTrie, Order, OrderType, SyntaxResult, UnitType
 from ..turn_code import Phase
 
 
@@ -9,193 +10,235 @@ class ParseError(Exception):
         super().__init__(message)
 
 
+DASHES = str.maketrans(dict.fromkeys("‒–—―−", "-"))
+CLEAN_ORDER = re.compile(r"[a-z0-9_]+(?:(?: - | )[a-z0-9_]+)*")
+SLASH = re.compile(r"\s*[/]\s*")
+DISALLOWED = re.compile(r"[^a-z0-9\-_/\s]+")
+WHITESPACE = re.compile(r"\s+")
+DASH = re.compile(r"\s*-\s*")
+
+
 def normalize_order_string(raw: str) -> str:
     raw = raw.lower()
     raw = raw.strip()
-    raw = re.sub(r"[‒–—―−]", "-", raw)
-    raw = re.sub(r"\s*[/]\s*", "_", raw)
-    raw = re.sub(r"[^a-z0-9\-_/\s]+", "", raw)
-    raw = re.sub(r"\s+", " ", raw)
-    raw = re.sub(r"\s*-\s*", " - ", raw)
+    if CLEAN_ORDER.fullmatch(raw):
+        return raw
+    raw = raw.translate(DASHES)
+    raw = SLASH.sub("_", raw)
+    raw = DISALLOWED.sub("", raw)
+    raw = WHITESPACE.sub(" ", raw)
+    raw = DASH.sub(" - ", raw)
     return raw
 
 
-def expect(tokens, tok):
-    if not tokens or tokens.pop(0) != tok:
-        raise ParseError(f"Expected {tok!r}")
-
-
-def take_province(tokens: list[str]) -> str:
-    if not tokens:
-        raise ParseError("Expected province, but got end of input")
-    prov = tokens.pop(0)
-    return prov
-
-
-def take_unit_type(tokens: list[str]) -> UnitType:
-    if not tokens:
+TOKEN = r"[^ ]*"
+REST = r"(?: .*)?"
+
+PHASE_GRAMMARS = {
+    Phase.MOVEMENT: re.compile(
+        rf"(?P<support_move>(?P<sm_origin>{TOKEN}) s "
+        rf"(?P<sm_support_origin>{TOKEN}) - "
+        rf"(?P<sm_destination>{TOKEN}){REST})"
+        rf"|(?P<convoy>(?P<cv_origin>{TOKEN}) c "
+        rf"(?P<cv_convoy_origin>{TOKEN}) - "
+        rf"(?P<cv_destination>{TOKEN}){REST})"
+        rf"|(?P<support_hold>(?P<sh_origin>{TOKEN}) s "
+        rf"(?P<sh_support_origin>{TOKEN}){REST})"
+        rf"|(?P<move>(?P<mv_origin>{TOKEN}) - (?P<mv_destination>{TOKEN}))"
+        rf"|(?P<hold>(?P<hd_origin>{TOKEN}) hold{REST})",
+        re.DOTALL,
+    ),
+    Phase.RETREAT: re.compile(
+        rf"(?P<retreat>(?P<rt_origin>{TOKEN}) - (?P<rt_destination>{TOKEN}))",
+        re.DOTALL,
+    ),
+    Phase.ADJUSTMENT: re.compile(
+        rf"(?P<build>build (?P<bd_unit_type>army|fleet) "
+        rf"(?P<bd_origin>{TOKEN}){REST})"
+        rf"|(?P<disband>disband (?P<db_unit_type>army|fleet) "
+        rf"(?P<db_origin>{TOKEN}){REST})",
+        re.DOTALL,
+    ),
+}
+
+
+def order_from_match(match: re.Match[str]) -> Order:
+    group = match.group
+    match match.lastgroup:
+        case "support_move":
+            return Order(
+                origin=group("sm_origin"),
+                order_type=OrderType.SUPPORT_MOVE,
+                support_destination=group("sm_destination"),
+                support_origin=group("sm_support_origin"),
+            )
+        case "convoy":
+            return Order(
+                origin=group("cv_origin"),
+                order_type=OrderType.CONVOY,
+                convoy_origin=group("cv_convoy_origin"),
+                convoy_destination=group("cv_destination"),
+            )
+        case "support_hold":
+            return Order(
+                origin=group("sh_origin"),
+                order_type=OrderType.SUPPORT_HOLD,
+                support_origin=group("sh_support_origin"),
+            )
+        case "move":
+            return Order(
+                origin=group("mv_origin"),
+                order_type=OrderType.MOVE,
+                destination=group("mv_destination"),
+            )
+        case "hold":
+            return Order(origin=group("hd_origin"), order_type=OrderType.HOLD)
+        case "retreat":
+            return Order(
+                origin=group("rt_origin"),
+                destination=group("rt_destination"),
+                order_type=OrderType.RETREAT,
+            )
+        case "build":
+            return Order(
+                origin=group("bd_origin"),
+                unit_type=UnitType(group("bd_unit_type")),
+                order_type=OrderType.BUILD,
+            )
+        case "disband":
+            return Order(
+                origin=group("db_origin"),
+                unit_type=UnitType(group("db_unit_type")),
+                order_type=OrderType.DISBAND,
+            )
+    raise ParseError(f"Unknown order form: {match.lastgroup}")
+
+
+def compile_order(normalized: str, phase: Phase) -> Order:
+    grammar = PHASE_GRAMMARS.get(phase)
+    if grammar is None:
+        raise ParseError(f"Unknown phase: {phase}")
+    match = grammar.fullmatch(normalized)
+    if match is None:
         raise ParseError(
-            "Expected unit type (‘army’ or ‘fleet’), but got end of input"
+            f"Unrecognized order for {phase.name} phase: {normalized}"
         )
-    tok = tokens.pop(0)
-    if tok == "army":
-        return UnitType.ARMY
-    if tok == "fleet":
-        return UnitType.FLEET
-    raise ParseError(f"Expected unit type ‘army’ or ‘fleet’, but got {tok!r}")
-
-
-def ensure_no_tokens(tokens: list[str]) -> None:
-    if tokens:
-        raise ParseError(f"Extra tokens: {tokens}")
-
-
-def parse_support_move(tokens: list[str]):
-    origin = take_province(tokens)
-    expect(tokens, "s")
-    support_origin = take_province(tokens)
-    expect(tokens, "-")
-    destination = take_province(tokens)
-    return Order(
-        origin=origin,
-        order_type=OrderType.SUPPORT_MOVE,
-        support_destination=destination,
-        support_origin=support_origin,
-    )
-
-
-def parse_convoy(tokens: list[str]):
-    origin = take_province(tokens)
-    expect(tokens, "c")
-    convoy_origin = take_province(tokens)
-    expect(tokens, "-")
-    convoy_destination = take_province(tokens)
-    return Order(
-        origin=origin,
-        order_type=OrderType.CONVOY,
-        convoy_origin=convoy_origin,
-        convoy_destination=convoy_destination,
-    )
-
-
-def parse_support_hold(tokens: list[str]):
-    origin = take_province(tokens)
-    expect(tokens, "s")
-    support_origin = take_province(tokens)
-    return Order(
-        origin=origin,
-        order_type=OrderType.SUPPORT_HOLD,
-        support_origin=support_origin,
-    )
-
-
-def parse_move(tokens: list[str]):
-    origin = take_province(tokens)
-    expect(tokens, "-")
-    destination = take_province(tokens)
-    ensure_no_tokens(tokens)
-    return Order(
-        origin=origin,
-        order_type=OrderType.MOVE,
-        destination=destination,
-    )
-
-
-def parse_hold(tokens: list[str]):
-    origin = take_province(tokens)
-    expect(tokens, "hold")
-    return Order(origin=origin, order_type=OrderType.HOLD)
-
-
-def parse_build(tokens: list[str]):
-    expect(tokens, "build")
-    unit_type = take_unit_type(tokens)
-    origin = take_province(tokens)
-    return Order(
-        origin=origin,
-        unit_type=unit_type,
-        order_type=OrderType.BUILD,
-    )
-
-
-def parse_disband(tokens: list[str]):
-    expect(tokens, "disband")
-    unit_type = take_unit_type(tokens)
-    origin = take_province(tokens)
-    return Order(
-        origin=origin,
-        unit_type=unit_type,
-        order_type=OrderType.DISBAND,
-    )
-
-
-def parse_retreat(tokens: list[str]) -> Order:
-    origin = take_province(tokens)
-    expect(tokens, "-")
-    destination = take_province(tokens)
-    ensure_no_tokens(tokens)
-    return Order(
-        origin=origin,
-        destination=destination,
-        order_type=OrderType.RETREAT,
-    )
-
-
-MOVEMENT_PARSERS = [
-    parse_support_move,
-    parse_convoy,
-    parse_support_hold,
-    parse_move,
-    parse_hold,
-]
-
-RETREAT_PARSERS = [parse_retreat]
-
-ADJUSTMENT_PARSERS = [parse_build, parse_disband]
-
+    return order_from_match(match)
+
+
+MIN_ALIAS_PREFIX = 3
+RESERVED_TOKENS = frozenset(
+    {"s", "c", "-", "hold", "build", "disband", "army", "fleet"}
+)
+
+
+def match_alias(
+    trie: AliasTrie, tokens: list[str], start: int
+) -> tuple[str, int] | None:
+    children = trie.children
+    node: int | None = 0
+    best = None
+    for end in range(start, len(tokens)):
+        token = tokens[end]
+        if end > start:
+            node = children[node].get(" ")
+            if node is None:
+                break
+        for ch in token:
+            node = children[node].get(ch)
+            if node is None:
+                return best
+        tid = trie.terminal[node]
+        if (
+            tid is None
+            and len(token) >= MIN_ALIAS_PREFIX
+            and token not in RESERVED_TOKENS
+        ):
+            tid = trie.unique[node]
+        if tid is not None:
+            best = (tid, end + 1)
+    return best
+
+
+def resolve_aliases(trie: AliasTrie, normalized: str) -> str:
+    tokens = normalized.split(" ")
+    resolved = []
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        found = None
+        if token not in RESERVED_TOKENS:
+            found = match_alias(trie, tokens, i)
+        if found is None:
+            resolved.append(token)
+            i += 1
+        else:
+            resolved.append(found[0])
+            i = found[1]
+    return " ".join(resolved)
+
+
+PARSE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_order_cached(
+    raw: str, phase: Phase, aliases: AliasTrie | None = None
+) -> tuple[str, Order | None, tuple[str, ...]]:
+    normalized = normalize_order_string(raw)
+    if aliases is not None:
+        normalized = resolve_aliases(aliases, normalized)
+    try:
+        return normalized, compile_order(normalized, phase), ()
+    except ParseError as pe:
+        return normalized, None, (str(pe),)
+    except Exception as e:
+        return normalized, None, (f"Internal parse error: {e}",)
 
-def dispatch_parsers(tokens: list[str], phase: Phase):
-    if phase == Phase.MOVEMENT:
-        candidates = MOVEMENT_PARSERS
-    elif phase == Phase.RETREAT:
-        candidates = RETREAT_PARSERS
-    elif phase == Phase.ADJUSTMENT:
-        candidates = ADJUSTMENT_PARSERS
-    else:
-        raise ParseError(f"Unknown phase: {phase}")
 
-    for parser in candidates:
-        try:
-            order = parser(tokens.copy())
-            return order
-        except ParseError:
-            continue
-    raise ParseError(
-        f"Unrecognized order for {phase.name} phase: {' '.join(tokens)}"
-    )
+def parse_cache_info():
+    return parse_order_cached.cache_info()
 
 
-def parse_syntax(player_id: str, raw: str, phase: Phase) -> SyntaxResult:
-    normalized = normalize_order_string(raw)
-    errors: list[str] = []
-    order = None
+def clear_parse_cache() -> None:
+    parse_order_cached.cache_clear()
 
-    try:
-        tokens = normalized.split(" ")
-        order = dispatch_parsers(tokens, phase)
-        valid = True
-    except ParseError as pe:
-        errors.append(str(pe))
-        valid = False
-    except Exception as e:
-        errors.append(f"Internal parse error: {e}")
-        valid = False
 
+def parse_syntax(
+    player_id: str, raw: str, phase: Phase, aliases: AliasTrie | None = None
+) -> SyntaxResult:
+    normalized, order, errors = parse_order_cached(raw, phase, aliases)
     return SyntaxResult(
         player_id=player_id,
         raw=raw,
         normalized=normalized,
-        valid=valid,
-        errors=errors,
+        valid=order is not None,
+        errors=list(errors),
         order=order,
     )
+
+
+def parse_orders_bulk(
+    player_orders: dict[str, list[str]],
+    phase: Phase,
+    aliases: AliasTrie | None = None,
+) -> list[SyntaxResult]:
+    parsed: dict[str, tuple[str, Order | None, tuple[str, ...]]] = {}
+    results = []
+    for player_id, orders in player_orders.items():
+        for raw in orders:
+            entry = parsed.get(raw)
+            if entry is None:
+                entry = parsed[raw] = parse_order_cached(raw, phase, aliases)
+            normalized, order, errors = entry
+            results.append(
+                SyntaxResult(
+                    player_id=player_id,
+                    raw=raw,
+                    normalized=normalized,
+                    valid=order is not None,
+                    errors=list(errors),
+                    order=order,
+                )
+            )
+    return results
@@ -0,0 +1,217 @@
+import hashlib
+import importlib
+import json
+from importlib import resources
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any
+
+from diplomacy_cli.core.paths import DEFAULT_CACHE_DIR
+
+from .rules_cache import artifact_path, read_json_artifact, write_json_artifact
+from .storage import load_variant_bytes
+
+VARIANTS_PACKAGE = "diplomacy_cli.data"
+VALIDATION_VERSION = 1
+VARIANT_FILES = (
+    ("world", "board.schema.json"),
+    ("world", "territories.json"),
+    ("world", "edges.json"),
+    ("world", "nations.json"),
+    ("start", "starting_units.json"),
+    ("start", "starting_ownerships.json"),
+    ("start", "starting_players.json"),
+)
+EDGE_MODES = {"land", "sea", "both"}
+
+_validated: dict[str, str] = {}
+
+
+class InvalidVariantError(Exception):
+    def __init__(self, variant: str, problems: list[str]):
+        self.variant = variant
+        self.problems = problems
+        super().__init__(
+            f"Variant '{variant}' is invalid: " + "; ".join(problems)
+        )
+
+
+def add_variant_root(root: Path) -> None:
+    package = importlib.import_module(VARIANTS_PACKAGE)
+    root_str = str(Path(root).resolve())
+    if root_str not in list(package.__path__):
+        package.__path__.append(root_str)
+
+
+def list_variants() -> list[str]:
+    root = resources.files(VARIANTS_PACKAGE)
+    return sorted(
+        entry.name
+        for entry in root.iterdir()
+        if entry.is_dir() and entry.joinpath("world").is_dir()
+    )
+
+
+def read_variant_files(variant: str) -> dict[str, bytes]:
+    if variant not in list_variants():
+        raise InvalidVariantError(variant, ["variant is not installed"])
+    files = {}
+    for submodule, filename in VARIANT_FILES:
+        try:
+            files[filename] = load_variant_bytes(variant, submodule, filename)
+        except (OSError, ModuleNotFoundError):
+            raise InvalidVariantError(
+                variant, [f"missing {submodule}/{filename}"]
+            ) from None
+    return files
+
+
+def schema_checks_available() -> bool:
+    return find_spec("jsonschema") is not None
+
+
+def validation_digest(files: dict[str, bytes]) -> str:
+    digest = hashlib.sha256(f"validation-{VALIDATION_VERSION}".encode())
+    schema = "schema" if schema_checks_available() else "schema-skipped"
+    digest.update(schema.encode("utf-8"))
+    for filename, data in files.items():
+        digest.update(filename.encode("utf-8"))
+        digest.update(hashlib.sha256(data).digest())
+    return digest.hexdigest()
+
+
+def check_schema(schema: dict, territories: Any) -> list[str]:
+    if not schema_checks_available():
+        return []
+    from jsonschema import Draft202012Validator
+
+    validator = Draft202012Validator(schema)
+    return [
+        f"territories.json{''.join(f'/{p}' for p in err.absolute_path)}: "
+        f"{err.message}"
+        for err in validator.iter_errors(territories)
+    ]
+
+
+def check_world(
+    territories: dict[str, Any], edges: list[dict], nations: list[dict]
+) -> list[str]:
+    problems = []
+    nation_ids = {n["id"] for n in nations}
+    known = set(territories)
+    for tid, data in territories.items():
+        for coast in data.get("coasts", []):
+            known.add(f"{tid}_{coast}")
+        parent = data.get("parent")
+        if parent is not None and parent not in territories:
+            problems.append(f"{tid}: parent '{parent}' does not exist")
+        home = data.get("home_country")
+        if home is not None:
+            if home not in nation_ids:
+                problems.append(f"{tid}: unknown home country '{home}'")
+            if not data.get("is_supply_center"):
+                problems.append(f"{tid}: home center is not a supply center")
+        if data.get("coasts") and data.get("type") == "sea":
+            problems.append(f"{tid}: sea territory cannot have coasts")
+
+    edge_set = set()
+    for e in edges:
+        a, b, mode = e["from"], e["to"], e["mode"]
+        if mode not in EDGE_MODES:
+            problems.append(f"edge {a}-{b}: unknown mode '{mode}'")
+        for end in (a, b):
+            if end not in known:
+                problems.append(f"edge {a}-{b}: unknown territory '{end}'")
+        edge_set.add((a, b, mode))
+    for a, b, mode in sorted(edge_set):
+        if (b, a, mode) not in edge_set:
+            problems.append(f"edge {a}-{b} ({mode}) has no reverse edge")
+    return problems
+
+
+def check_start(
+    territories: dict[str, Any],
+    nations: list[dict],
+    units: list[dict],
+    ownerships: list[dict],
+    players: list[dict],
+) -> list[str]:
+    problems = []
+    nation_ids = {n["id"] for n in nations}
+    known = set(territories)
+    for tid, data in territories.items():
+        for coast in data.get("coasts", []):
+            known.add(f"{tid}_{coast}")
+    for u in units:
+        if u["location_id"] not in known:
+            problems.append(f"unit at unknown territory '{u['location_id']}'")
+        if u["owner_id"] not in nation_ids:
+            problems.append(f"unit owned by unknown nation '{u['owner_id']}'")
+    for o in ownerships:
+        if o["territory_id"] not in territories:
+            problems.append(
+                f"ownership of unknown territory '{o['territory_id']}'"
+            )
+        if o["owner_id"] not in nation_ids:
+            problems.append(f"ownership by unknown nation '{o['owner_id']}'")
+    for p in players:
+        if p["nation_id"] not in nation_ids:
+            problems.append(f"player for unknown nation '{p['nation_id']}'")
+    return problems
+
+
+def check_variant_files(files: dict[str, bytes]) -> list[str]:
+    try:
+        data = {
+            name: json.loads(raw.decode("utf-8")) for name, raw in files.items()
+        }
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+        return [f"unreadable JSON: {e}"]
+    territories = data["territories.json"]
+    problems = check_schema(data["board.schema.json"], territories)
+    if problems:
+        return problems
+    try:
+        return check_world(
+            territories, data["edges.json"], data["nations.json"]
+        ) + check_start(
+            territories,
+            data["nations.json"],
+            data["starting_units.json"],
+            data["starting_ownerships.json"],
+            data["starting_players.json"],
+        )
+    except (KeyError, TypeError, AttributeError) as e:
+        return [f"malformed variant data: {e!r}"]
+
+
+def validate_variant(
+    variant: str, cache_dir: Path | None = DEFAULT_CACHE_DIR
+) -> str:
+    files = read_variant_files(variant)
+    digest = validation_digest(files)
+    if _validated.get(variant) == digest:
+        return digest
+
+    path = None
+    if cache_dir is not None:
+        path = artifact_path(variant, digest, ".valid.json", cache_dir)
+        marker = read_json_artifact(path)
+        if marker is not None and marker.get("digest") == digest:
+            _validated[variant] = digest
+            return digest
+
+    problems = check_variant_files(files)
+    if problems:
+        raise InvalidVariantError(variant, problems)
+    if path is not None:
+        write_json_artifact(
+            {"digest": digest, "schema_checked": schema_checks_available()},
+            path,
+        )
+    _validated[variant] = digest
+    return digest
+
+
+def clear_validation_memo() -> None:
+    _validated.clear()
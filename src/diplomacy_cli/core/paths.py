@@ -4,12 +4,15 @@ from pathlib import Path
 from typing import NamedTuple
 from diplomacy_cli.core.logic.turn_code import format_turn_code, Season, Phase
 
-from platformdirs import user_data_path
+from platformdirs import user_cache_path, user_data_path
 
 DEFAULT_GAMES_DIR = (
     Path(os.getenv("DCLI_GAMES_DIR", user_data_path("diplomacy-cli"))) / "games"
 )
 DEFAULT_GAMES_DIR.mkdir(parents=True, exist_ok=True)
+DEFAULT_CACHE_DIR = Path(
+    os.getenv("DCLI_CACHE_DIR", user_cache_path("diplomacy-cli"))
+)
 
 
 class GamePaths(NamedTuple):
@@ -63,6 +66,10 @@ def territory_state_path(paths: GamePaths) -> Path:
     return game_dir(paths) / "territory_state.json"
 
 
+def compiled_rules_dir(cache_dir: Path = DEFAULT_CACHE_DIR) -> Path:
+    return Path(cache_dir) / "rules"
+
+
 def delete_game(game_id: str) -> None:
     dir_path = DEFAULT_GAMES_DIR / game_id
     if not dir_path.is_dir():
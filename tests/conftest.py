@@ -1,3 +1,9 @@
+import os
+import shutil
+import tempfile
+
+os.environ["DCLI_CACHE_DIR"] = tempfile.mkdtemp(prefix="dcli-test-cache-")
+
 from types import SimpleNamespace
 from typing import cast
 
@@ -19,9 +25,16 @@ from diplomacy_cli.core.logic.state import (
     build_counters,
     build_territory_to_unit,
 )
+from diplomacy_cli.core.logic.territory_index import build_territory_index
 from diplomacy_cli.core.logic.validator.orchestrator import make_semantic_map
 
 
+@pytest.fixture(scope="session", autouse=True)
+def isolated_cache_dir():
+    yield
+    shutil.rmtree(os.environ["DCLI_CACHE_DIR"], ignore_errors=True)
+
+
 @pytest.fixture
 def order_factory():
     def _factory(
@@ -154,6 +167,7 @@ def resolution_soa_factory():
         new_territory: list[str] | None = None,
         strength: list[int] | None = None,
         dislodged: list[bool] | None = None,
+        dislodged_by: list[int] | None = None,
         support_cut: list[bool] | None = None,
         convoy_path_flat: list[str] | None = None,
         convoy_path_start: list[int] | None = None,
@@ -181,6 +195,7 @@ def resolution_soa_factory():
             ),
             strength=default(strength, 1),
             dislodged=default(dislodged, False),
+            dislodged_by=default(dislodged_by, -1),
             support_cut=default(support_cut, False),
             convoy_path_flat=convoy_path_flat
             if convoy_path_flat is not None
@@ -204,11 +219,14 @@ def rules_factory():
         adjacency_map: dict[str, list[tuple[str, str]]],
         territory_ids: list[str] | None = None,
     ):
+        territory_ids = territory_ids or list(parent_to_coast.keys()) + list(
+            adjacency_map.keys()
+        )
         ns = SimpleNamespace(
             parent_to_coast=parent_to_coast,
             adjacency_map=adjacency_map,
-            territory_ids=territory_ids
-            or list(parent_to_coast.keys()) + list(adjacency_map.keys()),
+            territory_ids=territory_ids,
+            index=build_territory_index(territory_ids, adjacency_map),
         )
         return cast(Rules, ns)
 
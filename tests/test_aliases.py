@@ -0,0 +1,78 @@
+import pytest
+
+from diplomacy_cli.core.logic.aliases import (
+    build_alias_trie,
+    territory_aliases,
+)
+from diplomacy_cli.core.logic.schema import OrderType, Phase
+from diplomacy_cli.core.logic.validator.syntax import (
+    normalize_order_string,
+    parse_syntax,
+    resolve_aliases,
+)
+
+
+def test_territory_aliases_include_coast_variants():
+    aliases = territory_aliases(
+        {"bul": "Bulgaria", "bul_sc": "Bulgaria (SC)"},
+        {"bul_sc": "bul"},
+        {"bul": ["blg"]},
+    )
+    assert aliases["bul"] == {"bul", "bulgaria", "blg"}
+    assert aliases["bul_sc"] == {
+        "bul_sc",
+        "bulgaria sc",
+        "bul sc",
+        "bul south coast",
+        "bulgaria south coast",
+    }
+
+
+def test_trie_unique_prefixes_collapse_coasts_to_parent():
+    trie = build_alias_trie(
+        {
+            "spa": ["spa", "spain"],
+            "spa_nc": ["spa_nc", "spain nc"],
+            "spa_sc": ["spa_sc", "spain sc"],
+            "swe": ["swe", "sweden"],
+        },
+        {"spa_nc": "spa", "spa_sc": "spa"},
+    )
+    assert resolve_aliases(trie, "spai - swed") == "spa - swe"
+    assert resolve_aliases(trie, "spain nc hold") == "spa_nc hold"
+    assert resolve_aliases(trie, "spain s swe") == "spa s swe"
+    assert resolve_aliases(trie, "sp - s") == "sp - s"
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("Paris - Burgundy", "par - bur"),
+        ("St. Petersburg (SC) - Gulf of Bothnia", "stp_sc - bot"),
+        ("stp south coast - bot", "stp_sc - bot"),
+        ("bulg s serbia - rumania", "bul s ser - rum"),
+        ("spa s por", "spa s por"),
+        ("Mid-Atlantic Ocean - Brest", "mao - bre"),
+        ("north sea c london - norway", "nth c lon - nor"),
+        ("nwy hold", "nor hold"),
+        ("north - pic", "north - pic"),
+        ("build army paris", "build army par"),
+        ("gol - tyn", "lyo - tys"),
+    ],
+)
+def test_resolve_classic_aliases(classic_rules, raw, expected):
+    normalized = normalize_order_string(raw)
+    assert resolve_aliases(classic_rules.aliases, normalized) == expected
+
+
+def test_parse_syntax_with_aliases(classic_rules):
+    result = parse_syntax(
+        "eng", "London - English Channel", Phase.MOVEMENT, classic_rules.aliases
+    )
+    assert result.valid
+    assert result.normalized == "lon - eng"
+    assert result.order is not None
+    assert result.order.order_type == OrderType.MOVE
+    assert result.order.destination == "eng"
+    plain = parse_syntax("eng", "London - English Channel", Phase.MOVEMENT)
+    assert not plain.valid
@@ -0,0 +1,57 @@
+from diplomacy_cli.core.logic.bitsets import (
+    mask_territories,
+    occupancy_masks,
+    ownership_masks,
+    popcount,
+    territory_mask,
+)
+from diplomacy_cli.core.logic.territory_index import build_territory_index
+
+
+def make_index():
+    return build_territory_index(["A", "B", "C", "D"], {})
+
+
+def test_territory_mask_round_trip():
+    index = make_index()
+    mask = territory_mask(index, ["C", "A", "unknown"])
+    assert mask == 0b101
+    assert mask_territories(index, mask) == ["A", "C"]
+    assert popcount(mask) == 2
+
+
+def test_ownership_masks():
+    index = make_index()
+    territory_state = {
+        "A": {"owner_id": "eng"},
+        "B": {"owner_id": "fra"},
+        "D": {"owner_id": "eng"},
+        "C": {},
+    }
+    masks = ownership_masks(index, territory_state)
+    assert masks == {"eng": 0b1001, "fra": 0b10}
+
+
+def test_occupancy_masks():
+    index = make_index()
+    units = {
+        "u1": {"owner_id": "eng", "territory_id": "B"},
+        "u2": {"owner_id": "eng", "territory_id": "C"},
+        "u3": {"owner_id": "ger", "territory_id": "A"},
+    }
+    masks = occupancy_masks(index, units)
+    assert masks == {"eng": 0b110, "ger": 0b1}
+
+
+def test_classic_masks_match_sets(classic_rules):
+    index = classic_rules.index
+    assert set(mask_territories(index, classic_rules.supply_center_mask)) == (
+        classic_rules.supply_centers
+    )
+    assert set(mask_territories(index, classic_rules.coast_mask)) == (
+        classic_rules.has_coast
+    )
+    for nation, centers in classic_rules.home_centers.items():
+        mask = classic_rules.home_center_masks[nation]
+        assert set(mask_territories(index, mask)) == centers
+        assert mask & ~classic_rules.supply_center_mask == 0
@@ -0,0 +1,61 @@
+import pytest
+
+from diplomacy_cli.core.logic.completion import (
+    build_completion_index,
+    complete_order,
+    complete_token,
+)
+from diplomacy_cli.core.logic.schema import LegalOrderCache, UnitType
+from diplomacy_cli.core.logic.state import load_state, start_game
+
+
+@pytest.fixture
+def index(tmp_path, classic_rules):
+    start_game(game_id="complete", root_dir=tmp_path)
+    state = load_state("complete", root_dir=tmp_path)
+    return build_completion_index(
+        "eng", state, classic_rules, LegalOrderCache()
+    )
+
+
+def test_index_holds_only_player_orders(index):
+    assert index.orders == sorted(index.orders)
+    assert {order.split()[0] for order in index.orders} == {
+        "edi",
+        "lon",
+        "lvp",
+    }
+    assert "lon - nth" in index.orders
+    assert "lvp s edi" in index.orders
+
+
+def test_complete_order(index):
+    assert complete_order(index, "LVP  - y") == ["lvp - yor"]
+    assert complete_order(index, "par") == []
+    assert all(o.startswith("edi s ") for o in complete_order(index, "edi s"))
+
+
+@pytest.mark.parametrize(
+    "prefix, expected",
+    [
+        ("l", ["lon ", "lvp "]),
+        ("lon", ["lon - ", "lon hold", "lon s "]),
+        ("lon ", ["lon - ", "lon hold", "lon s "]),
+        ("lon - n", ["lon - nth"]),
+        ("lvp s edi", ["lvp s edi", "lvp s edi - "]),
+    ],
+)
+def test_complete_token(index, prefix, expected):
+    assert complete_token(index, prefix) == expected
+
+
+def test_adjustment_index_includes_builds(loaded_state_factory, classic_rules):
+    state = loaded_state_factory(
+        [("U1", "fra", UnitType.ARMY, "bur")],
+        territory_state={"par": {"owner_id": "fra"}},
+    )
+    state.game.game_meta["turn_code"] = "1901-F-A"
+    index = build_completion_index("fra", state, classic_rules)
+    assert complete_token(index, "") == ["build ", "disband "]
+    assert complete_order(index, "build") == ["build army par"]
+    assert complete_order(index, "d") == ["disband army bur"]
@@ -0,0 +1,74 @@
+from collections import deque
+
+from diplomacy_cli.core.logic.convoy import (
+    build_convoy_reachability,
+    convoy_reachability_from_dict,
+    convoy_reachability_to_dict,
+    has_sea_route,
+)
+
+
+def bfs_sea_path(origin, target, rules):
+    origin_coasts = rules.parent_to_coast.get(origin, [origin])
+    target_coasts = rules.parent_to_coast.get(target, [target])
+    visited = set(origin_coasts)
+    queue = deque(origin_coasts)
+    while queue:
+        cur = queue.popleft()
+        if cur in target_coasts:
+            return True
+        for neighbor, mode in rules.adjacency_map.get(cur, []):
+            if mode not in ("sea", "both") or neighbor in visited:
+                continue
+            if (
+                rules.territory_type.get(neighbor) == "land"
+                and neighbor not in target_coasts
+            ):
+                continue
+            visited.add(neighbor)
+            queue.append(neighbor)
+    return False
+
+
+def test_build_convoy_reachability_components():
+    territory_type = {
+        "A": "land",
+        "S1": "sea",
+        "S2": "sea",
+        "B": "land",
+        "S3": "sea",
+        "C": "land",
+    }
+    adjacency_map = {
+        "A": [("S1", "sea")],
+        "S1": [("A", "sea"), ("S2", "sea")],
+        "S2": [("S1", "sea"), ("B", "sea")],
+        "B": [("S2", "sea"), ("C", "land")],
+        "C": [("B", "land"), ("S3", "sea")],
+        "S3": [("C", "sea")],
+    }
+    table = build_convoy_reachability(territory_type, adjacency_map)
+
+    assert table.component["S1"] == table.component["S2"]
+    assert table.component["S1"] != table.component["S3"]
+    assert "A" not in table.component
+    assert table.endpoints[table.component["S1"]] == {"A", "B"}
+    assert table.endpoints[table.component["S3"]] == {"C"}
+    assert table.touching["C"] == {table.component["S3"]}
+
+
+def test_has_sea_route_matches_bfs_on_classic(classic_rules):
+    territories = sorted(classic_rules.territory_ids)
+    for origin in territories:
+        for target in territories:
+            assert has_sea_route(origin, target, classic_rules) == (
+                bfs_sea_path(origin, target, classic_rules)
+            ), (origin, target)
+
+
+def test_convoy_reachability_dict_round_trip(classic_rules):
+    table = classic_rules.convoy_reachability
+    assert (
+        convoy_reachability_from_dict(convoy_reachability_to_dict(table))
+        == table
+    )
@@ -0,0 +1,50 @@
+from diplomacy_cli.core.logic.distances import (
+    UNREACHABLE,
+    all_pairs,
+    bfs_row,
+    distances_from,
+    move_distance,
+)
+from diplomacy_cli.core.logic.schema import UnitType
+
+
+def test_bfs_row_chain():
+    adjacent = [[1], [0, 2], [1], []]
+    assert list(bfs_row(adjacent, 0)) == [0, 1, 2, UNREACHABLE]
+    assert list(bfs_row(adjacent, 3)) == [UNREACHABLE] * 3 + [0]
+
+
+def test_all_pairs_is_row_major():
+    adjacent = [[1], [0]]
+    assert list(all_pairs(adjacent)) == [0, 1, 1, 0]
+
+
+def test_move_distance_army(classic_rules):
+    assert move_distance(classic_rules, UnitType.ARMY, "par", "par") == 0
+    assert move_distance(classic_rules, UnitType.ARMY, "par", "bur") == 1
+    assert move_distance(classic_rules, UnitType.ARMY, "par", "mun") == 2
+    assert move_distance(classic_rules, UnitType.ARMY, "lon", "par") is None
+    assert move_distance(classic_rules, UnitType.ARMY, "par", "nth") is None
+
+
+def test_move_distance_army_via_convoy(classic_rules):
+    assert move_distance(classic_rules, UnitType.ARMY, "lon", "bre", True) == 1
+    assert move_distance(classic_rules, UnitType.ARMY, "lon", "par", True) == 2
+    assert move_distance(classic_rules, UnitType.ARMY, "mos", "war", True) == 1
+
+
+def test_move_distance_fleet_is_coast_aware(classic_rules):
+    assert move_distance(classic_rules, UnitType.FLEET, "lon", "eng") == 1
+    assert move_distance(classic_rules, UnitType.FLEET, "mao", "spa") == 1
+    assert move_distance(classic_rules, UnitType.FLEET, "mao", "spa_sc") == 1
+    assert move_distance(classic_rules, UnitType.FLEET, "lon", "par") is None
+
+
+def test_distances_from_matches_move_distance(classic_rules):
+    row = distances_from(classic_rules, UnitType.ARMY, "mun")
+    assert row["mun"] == 0
+    for target, dist in row.items():
+        assert move_distance(classic_rules, UnitType.ARMY, "mun", target) == (
+            dist
+        )
+    assert "nth" not in row
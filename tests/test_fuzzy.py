@@ -0,0 +1,35 @@
+from diplomacy_cli.core.logic.fuzzy import (
+    build_fuzzy_index,
+    levenshtein,
+    suggest_territories,
+    trigrams,
+)
+
+
+def test_trigrams_are_padded():
+    assert trigrams("ab") == {"  a", " ab", "ab "}
+
+
+def test_levenshtein():
+    assert levenshtein("kitten", "sitting") == 3
+    assert levenshtein("", "abc") == 3
+    assert levenshtein("par", "par") == 0
+
+
+def test_suggest_matches_ids_and_display_names():
+    index = build_fuzzy_index(
+        {"par": "Paris", "pic": "Picardy", "bur": "Burgundy", "stp": "St. P"}
+    )
+    assert suggest_territories(index, "pari")[0] == "par"
+    assert suggest_territories(index, "burgandy")[0] == "bur"
+    assert suggest_territories(index, "picardie", k=1) == ["pic"]
+    assert suggest_territories(index, "xyz") == []
+
+
+def test_suggestions_are_distinct(classic_rules):
+    suggestions = suggest_territories(classic_rules.fuzzy_index, "spain")
+    assert suggestions[0] == "spa"
+    assert len(suggestions) == len(set(suggestions)) == 3
+    assert suggest_territories(classic_rules.fuzzy_index, "st petersberg")[
+        0
+    ].startswith("stp")
@@ -0,0 +1,279 @@
+import pytest
+
+from diplomacy_cli.core.logic.legal_orders import (
+    format_order,
+    legal_builds,
+    legal_orders,
+    legal_orders_by_unit,
+)
+from diplomacy_cli.core.logic.schema import (
+    LegalOrderCache,
+    Order,
+    OrderType,
+    OutcomeType,
+    Phase,
+    PhaseResolutionReport,
+    ResolutionResult,
+    Season,
+    SemanticResult,
+    UnitType,
+)
+from diplomacy_cli.core.logic.state import load_state, start_game
+from diplomacy_cli.core.logic.validator.semantic import check_semantic
+from diplomacy_cli.core.logic.validator.syntax import compile_order
+
+
+@pytest.fixture
+def opening(tmp_path):
+    start_game(game_id="legal", root_dir=tmp_path)
+    return load_state("legal", root_dir=tmp_path)
+
+
+def by_type(orders, order_type):
+    return {o for o in orders if o.order_type == order_type}
+
+
+@pytest.mark.parametrize(
+    "order, phase",
+    [
+        (Order(origin="mun", order_type=OrderType.HOLD), Phase.MOVEMENT),
+        (
+            Order(origin="par", order_type=OrderType.MOVE, destination="bur"),
+            Phase.MOVEMENT,
+        ),
+        (
+            Order(
+                origin="bur",
+                order_type=OrderType.SUPPORT_HOLD,
+                support_origin="par",
+            ),
+            Phase.MOVEMENT,
+        ),
+        (
+            Order(
+                origin="bur",
+                order_type=OrderType.SUPPORT_MOVE,
+                support_origin="par",
+                support_destination="pic",
+            ),
+            Phase.MOVEMENT,
+        ),
+        (
+            Order(
+                origin="nth",
+                order_type=OrderType.CONVOY,
+                convoy_origin="lon",
+                convoy_destination="nor",
+            ),
+            Phase.MOVEMENT,
+        ),
+        (
+            Order(
+                origin="bre", order_type=OrderType.RETREAT, destination="gas"
+            ),
+            Phase.RETREAT,
+        ),
+        (
+            Order(
+                origin="par",
+                order_type=OrderType.BUILD,
+                unit_type=UnitType.ARMY,
+            ),
+            Phase.ADJUSTMENT,
+        ),
+        (
+            Order(
+                origin="bal",
+                order_type=OrderType.DISBAND,
+                unit_type=UnitType.FLEET,
+            ),
+            Phase.ADJUSTMENT,
+        ),
+    ],
+)
+def test_format_order_round_trips(order, phase):
+    assert compile_order(format_order(order), phase) == order
+
+
+def test_opening_orders_are_legal(opening, classic_rules):
+    legal = legal_orders_by_unit(
+        opening, classic_rules, cache=LegalOrderCache()
+    )
+    assert set(legal) == set(opening.game.units)
+    for unit_id, orders in legal.items():
+        owner = opening.game.units[unit_id]["owner_id"]
+        assert orders[0].order_type == OrderType.HOLD
+        for order in orders:
+            assert check_semantic(owner, order, classic_rules, opening) is None
+
+
+def test_opening_orders_are_complete(opening, classic_rules):
+    rules = classic_rules
+    legal = legal_orders_by_unit(opening, rules, cache=LegalOrderCache())
+    occupied = opening.territory_to_unit
+    provinces = sorted(rules.territory_ids - set(rules.coast_to_parent))
+    for unit_id, orders in legal.items():
+        unit = opening.game.units[unit_id]
+        origin = unit["territory_id"]
+        owner = unit["owner_id"]
+        army = unit["unit_type"] == UnitType.ARMY
+
+        def ok(order):
+            return check_semantic(owner, order, rules, opening) is None
+
+        moves = {
+            Order(origin=origin, order_type=OrderType.MOVE, destination=d)
+            for d in rules.territory_ids - {origin}
+            if not army or (d in provinces and rules.territory_type[d] != "sea")
+        }
+        assert by_type(orders, OrderType.MOVE) == set(filter(ok, moves))
+
+        holds = {
+            Order(
+                origin=origin,
+                order_type=OrderType.SUPPORT_HOLD,
+                support_origin=s,
+            )
+            for s in occupied
+        }
+        assert by_type(orders, OrderType.SUPPORT_HOLD) == set(filter(ok, holds))
+
+        supports = {
+            Order(
+                origin=origin,
+                order_type=OrderType.SUPPORT_MOVE,
+                support_origin=s,
+                support_destination=d,
+            )
+            for s in occupied
+            for d in provinces
+            if s != origin
+        }
+        assert by_type(orders, OrderType.SUPPORT_MOVE) == set(
+            filter(ok, supports)
+        )
+
+
+def test_convoys_from_sea_fleets(opening, classic_rules):
+    legal = legal_orders_by_unit(
+        opening, classic_rules, cache=LegalOrderCache()
+    )
+    fleet = opening.territory_to_unit["lon"]
+    assert by_type(legal[fleet], OrderType.CONVOY) == set()
+
+    opening.game.units[fleet]["territory_id"] = "nth"
+    opening.territory_to_unit["nth"] = opening.territory_to_unit.pop("lon")
+    orders = legal_orders(fleet, opening, classic_rules, Phase.MOVEMENT)
+    convoys = by_type(orders, OrderType.CONVOY)
+    routes = {(o.convoy_origin, o.convoy_destination) for o in convoys}
+    assert {("mar", "nor"), ("lvp", "nor"), ("lvp", "lon")} <= routes
+    assert not any(origin == "ber" for origin, _ in routes)
+    for order in convoys:
+        assert check_semantic("eng", order, classic_rules, opening) is None
+
+
+def test_cache_reused_until_neighbourhood_changes(opening, classic_rules):
+    cache = LegalOrderCache()
+    unit_id = opening.territory_to_unit["par"]
+    first = legal_orders(unit_id, opening, classic_rules, cache=cache)
+    assert legal_orders(unit_id, opening, classic_rules, cache=cache) is first
+    assert list(cache.orders) == [(Phase.MOVEMENT, UnitType.ARMY, "par")]
+
+    far = opening.territory_to_unit.pop("con")
+    opening.game.units[far]["territory_id"] = "bul"
+    opening.territory_to_unit["bul"] = far
+    assert legal_orders(unit_id, opening, classic_rules, cache=cache) is first
+
+    mover = opening.territory_to_unit.pop("mun")
+    opening.game.units[mover]["territory_id"] = "bur"
+    opening.territory_to_unit["bur"] = mover
+    second = legal_orders(unit_id, opening, classic_rules, cache=cache)
+    assert second is not first
+    assert list(cache.orders) == [(Phase.MOVEMENT, UnitType.ARMY, "par")]
+    assert second == legal_orders(unit_id, opening, classic_rules)
+    support = Order(
+        origin="par", order_type=OrderType.SUPPORT_HOLD, support_origin="bur"
+    )
+    assert support in second and support not in first
+
+
+def test_neighbourhood_change_keeps_other_entries(opening, classic_rules):
+    cache = LegalOrderCache()
+    legal = legal_orders_by_unit(opening, classic_rules, cache=cache)
+    ank = opening.territory_to_unit["ank"]
+
+    mover = opening.territory_to_unit.pop("mun")
+    opening.game.units[mover]["territory_id"] = "bur"
+    opening.territory_to_unit["bur"] = mover
+    again = legal_orders_by_unit(opening, classic_rules, cache=cache)
+    assert again[ank] is legal[ank]
+    assert again == legal_orders_by_unit(opening, classic_rules)
+
+
+def test_cache_invalidated_by_unit_type_change(opening, classic_rules):
+    cache = LegalOrderCache()
+    lon = opening.territory_to_unit["lon"]
+    first = legal_orders(lon, opening, classic_rules, cache=cache)
+
+    lvp = opening.territory_to_unit["lvp"]
+    opening.game.units[lvp]["unit_type"] = UnitType.FLEET
+    second = legal_orders(lon, opening, classic_rules, cache=cache)
+    assert second == legal_orders(
+        lon, opening, classic_rules, cache=LegalOrderCache()
+    )
+    assert second != first
+
+
+def test_retreat_and_adjustment_orders(loaded_state_factory, classic_rules):
+    order = Order(origin="bur", order_type=OrderType.MOVE, destination="mun")
+    semantic = SemanticResult("ger", "", "", order, True, [])
+    dislodged = ResolutionResult(
+        unit_id="U1",
+        owner_id="ger",
+        unit_type=UnitType.ARMY,
+        origin_territory="mun",
+        semantic_result=semantic,
+        outcome=OutcomeType.DISLODGED,
+        resolved_territory="mun",
+        strength=1,
+        duplicate_orders=[],
+    )
+    report = PhaseResolutionReport(
+        Phase.MOVEMENT, Season.SPRING, 1901, [], [], [], [], [dislodged]
+    )
+    state = loaded_state_factory(
+        [
+            ("U1", "ger", UnitType.ARMY, "mun"),
+            ("U2", "fra", UnitType.ARMY, "ber"),
+            ("U3", "fra", UnitType.ARMY, "boh"),
+        ],
+        territory_state={"mar": {"owner_id": "fra"}, "par": {}},
+        pending_move=report,
+    )
+    legal = legal_orders_by_unit(
+        state, classic_rules, Phase.RETREAT, LegalOrderCache()
+    )
+    assert legal["U2"] == ()
+    assert [o.destination for o in legal["U1"]] == [
+        "bur",
+        "kie",
+        "ruh",
+        "sil",
+        "tyr",
+    ]
+    for o in legal["U1"]:
+        assert check_semantic("ger", o, classic_rules, state) is None
+
+    assert legal_orders("U3", state, classic_rules, Phase.ADJUSTMENT) == (
+        Order(
+            origin="boh",
+            order_type=OrderType.DISBAND,
+            unit_type=UnitType.ARMY,
+        ),
+    )
+    assert [
+        format_order(o) for o in legal_builds("fra", state, classic_rules)
+    ] == [
+        "build army mar",
+        "build fleet mar",
+    ]
@@ -0,0 +1,128 @@
+import importlib
+import json
+import sys
+
+import pytest
+
+from diplomacy_cli.core.logic import distances
+from diplomacy_cli.core.logic.distances import move_distance
+from diplomacy_cli.core.logic.map_generator import (
+    generate_variant,
+    territory_code,
+    write_variant,
+)
+from diplomacy_cli.core.logic.rules_loader import (
+    clear_rules_memo,
+    compile_rules,
+    load_rules,
+)
+from diplomacy_cli.core.logic.schema import UnitType
+from diplomacy_cli.core.logic.variants import (
+    VARIANTS_PACKAGE,
+    add_variant_root,
+    check_variant_files,
+    list_variants,
+)
+
+
+def encode(files):
+    return {
+        name.split("/")[1]: json.dumps(data).encode("utf-8")
+        for name, data in files.items()
+    }
+
+
+def test_territory_code():
+    assert territory_code(0) == "aaa"
+    assert territory_code(27) == "abb"
+    assert territory_code(26**3 - 1) == "zzz"
+
+
+@pytest.mark.parametrize("coast_density", [0.0, 0.5, 1.0])
+def test_generated_variants_are_valid(coast_density):
+    files = generate_variant(
+        300, nations=5, coast_density=coast_density, sea_regions=3, seed=7
+    )
+    assert check_variant_files(encode(files)) == []
+    territories = files["world/territories.json"]
+    assert len(territories) == 300
+    homes = [t for t in territories.values() if "home_country" in t]
+    assert len(homes) == 15
+
+
+def test_generation_is_deterministic():
+    assert generate_variant(200, seed=3) == generate_variant(200, seed=3)
+    assert generate_variant(200, seed=3) != generate_variant(200, seed=4)
+
+
+def test_too_many_nations():
+    with pytest.raises(ValueError):
+        generate_variant(20, nations=10)
+
+
+@pytest.fixture
+def variant_root(tmp_path, monkeypatch):
+    package = importlib.import_module(VARIANTS_PACKAGE)
+    monkeypatch.setattr(package.__path__, "_path", list(package.__path__))
+    add_variant_root(tmp_path)
+    yield tmp_path
+    for name in list(sys.modules):
+        if name.startswith(f"{VARIANTS_PACKAGE}.generated_"):
+            del sys.modules[name]
+    clear_rules_memo()
+
+
+def test_generated_variant_loads(variant_root):
+    files = generate_variant(150, nations=4, coast_density=0.5, seed=1)
+    write_variant(files, variant_root, "generated_150")
+    assert "generated_150" in list_variants()
+    rules = load_rules("generated_150", cache_dir=None)
+    assert len(rules.home_centers) == 4
+    assert rules.coast_to_parent
+
+
+@pytest.fixture
+def untabled_rules(monkeypatch):
+    monkeypatch.setattr(distances, "DISTANCE_TABLE_LIMIT", 0)
+    rules = compile_rules("classic", "untabled", cache_dir=None)
+    assert rules.distances.size == 0
+    return rules
+
+
+def test_move_distance_without_tables(untabled_rules, classic_rules):
+    names = classic_rules.index.names
+    for origin in names:
+        for target in names:
+            for unit_type, via_convoy in [
+                (UnitType.ARMY, False),
+                (UnitType.ARMY, True),
+                (UnitType.FLEET, False),
+            ]:
+                expected = move_distance(
+                    classic_rules, unit_type, origin, target, via_convoy
+                )
+                assert expected == move_distance(
+                    untabled_rules, unit_type, origin, target, via_convoy
+                )
+
+
+def test_untabled_row_cache_is_bounded(untabled_rules, monkeypatch):
+    distances.clear_distance_cache()
+    monkeypatch.setattr(distances, "FALLBACK_ROW_LIMIT", 2)
+    for origin in ["par", "mun", "ber", "vie"]:
+        move_distance(untabled_rules, UnitType.ARMY, origin, "mos")
+    (cache,) = distances._fallback.values()
+    assert cache.rules is untabled_rules
+    assert len(cache.rows) == 2
+    distances.clear_distance_cache()
+
+
+def test_untabled_rows_are_cached(untabled_rules, monkeypatch):
+    assert move_distance(untabled_rules, UnitType.ARMY, "par", "mun") == 2
+
+    def fail(*args):
+        raise AssertionError("adjacency and rows should be cached")
+
+    monkeypatch.setattr(distances, "bfs_row", fail)
+    monkeypatch.setattr(distances, "unit_adjacent", fail)
+    assert move_distance(untabled_rules, UnitType.ARMY, "par", "ber") == 3
@@ -1,3 +1,9 @@
+import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
 from diplomacy_cli.core.logic.schema import (
     OrderType,
     OutcomeType,
@@ -5,10 +11,16 @@ from diplomacy_cli.core.logic.schema import (
     Season,
     UnitType,
 )
+from diplomacy_cli.core.logic.serialization import (
+    phase_resolution_report_to_dict,
+)
+from diplomacy_cli.core.logic.state import load_state, start_game
 from diplomacy_cli.core.logic.validator.orchestrator import (
     make_adjustment_semantic_map,
     make_semantic_map,
     process_phase,
+    shard_player_orders,
+    validation_executor,
 )
 
 
@@ -218,6 +230,24 @@ def test_process_move_phase_invalid_semantic(
     assert len(report.resolution_results) == 1
 
 
+def test_move_phase_records_dislodger(loaded_state_factory, classic_rules):
+    loaded_state = loaded_state_factory(
+        [
+            ("U1", "P2", UnitType.ARMY, "par"),
+            ("U2", "P1", UnitType.ARMY, "bur"),
+            ("U3", "P1", UnitType.ARMY, "pic"),
+        ],
+        game_meta={"turn_code": "1901-S-M"},
+        raw_orders={"P1": ["bur - par", "pic s bur - par"]},
+    )
+    report = process_phase(loaded_state, classic_rules)
+
+    results = {r.unit_id: r for r in report.resolution_results}
+    assert results["U1"].outcome == OutcomeType.DISLODGED
+    assert results["U1"].dislodged_by_id == "U2"
+    assert results["U2"].dislodged_by_id is None
+
+
 def test_retreat_phase_bounce(loaded_state_factory, classic_rules):
     unit_specs = [
         ("U1", "P1", UnitType.ARMY, "bel"),
@@ -326,3 +356,69 @@ def test_adjustment_phase_duplicate_build(loaded_state_factory, classic_rules):
         OutcomeType.BUILD_NO_CENTER,
     }
     assert len(result.duplicate_orders) == 1
+
+
+def test_shard_player_orders_keeps_player_order():
+    orders = {f"p{i}": ["x"] * (i + 1) for i in range(6)}
+    shards = shard_player_orders(orders, 3)
+    assert len(shards) == 3
+    assert [p for shard in shards for p in shard] == list(orders)
+    assert shard_player_orders({}, 4) == [{}]
+
+
+@pytest.mark.parametrize(
+    "make_executor",
+    [
+        lambda rules: ThreadPoolExecutor(max_workers=3),
+        lambda rules: validation_executor(rules, max_workers=3),
+    ],
+    ids=["thread", "process"],
+)
+def test_parallel_validation_matches_serial(
+    tmp_path, classic_rules, make_executor
+):
+    start_game(game_id="parallel", root_dir=tmp_path)
+    state = load_state("parallel", root_dir=tmp_path)
+    state.game.raw_orders.update(
+        {
+            "eng": ["lon - nth", "edi - nwg", "lvp - yor", "lon hold"],
+            "fra": ["par - bur", "mar s par - bur", "bre - fun"],
+            "ger": ["kie - den", "ber - kie", "mun - ruh", "gibberish"],
+            "ita": ["ven - tri", "rom - ven", "nap - ion"],
+            "aus": ["vie - gal", "bud - ser", "tri - alb"],
+            "rus": ["mos - ukr", "war - gal", "stp_sc - bot", "sev - bla"],
+            "tur": ["con - bul", "ank - bla", "smy - arm"],
+        }
+    )
+    serial = process_phase(state, classic_rules)
+    with make_executor(classic_rules) as executor:
+        parallel = process_phase(state, classic_rules, executor, shards=3)
+    assert json.dumps(phase_resolution_report_to_dict(parallel)) == json.dumps(
+        phase_resolution_report_to_dict(serial)
+    )
+    assert parallel == serial
+
+
+def test_process_workers_use_caller_rules(tmp_path, classic_rules):
+    start_game(game_id="spawned", root_dir=tmp_path)
+    state = load_state("spawned", root_dir=tmp_path)
+    state.game.game_meta["variant"] = "not_installed"
+    state.game.raw_orders.update(
+        {"eng": ["lon - nth"], "fra": ["par - bur"], "ger": ["kie - den"]}
+    )
+    serial = process_phase(state, classic_rules)
+    context = multiprocessing.get_context("spawn")
+    with validation_executor(
+        classic_rules, max_workers=2, mp_context=context
+    ) as executor:
+        parallel = process_phase(state, classic_rules, executor, shards=2)
+    assert parallel == serial
+
+
+def test_process_pool_requires_validation_executor(tmp_path, classic_rules):
+    start_game(game_id="unbound", root_dir=tmp_path)
+    state = load_state("unbound", root_dir=tmp_path)
+    state.game.raw_orders.update({"eng": ["lon - nth"]})
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        with pytest.raises(ValueError, match="validation_executor"):
+            process_phase(state, classic_rules, executor)
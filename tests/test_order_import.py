@@ -0,0 +1,157 @@
+import io
+import json
+
+import pytest
+
+from diplomacy_cli.core.logic import order_import
+from diplomacy_cli.core.logic.order_import import (
+    import_orders,
+    parse_order_line,
+)
+from diplomacy_cli.core.logic.state import load_state, start_game
+from diplomacy_cli.core.logic.storage import load
+
+
+@pytest.fixture
+def game(tmp_path):
+    start_game(game_id="import_test", root_dir=tmp_path)
+    return tmp_path, load_state("import_test", root_dir=tmp_path)
+
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        ("eng: lon - nth", ("eng", ["lon - nth"])),
+        ('{"player": "fra", "order": "par hold"}', ("fra", ["par hold"])),
+        (
+            '{"player": "ger", "orders": ["kie - den", "ber - kie"]}',
+            ("ger", ["kie - den", "ber - kie"]),
+        ),
+    ],
+)
+def test_parse_order_line(line, expected):
+    assert parse_order_line(line) == expected
+
+
+def test_parse_order_line_default_player():
+    assert parse_order_line("lon - nth", "eng") == ("eng", ["lon - nth"])
+    with pytest.raises(ValueError):
+        parse_order_line("lon - nth")
+    with pytest.raises(ValueError):
+        parse_order_line('{"player": "eng"}')
+    with pytest.raises(ValueError):
+        parse_order_line('{"player": "eng", "orders": [1]')
+
+
+def test_import_orders_streams_and_validates(game, classic_rules):
+    root, state = game
+    source = io.StringIO(
+        "\n".join(
+            [
+                "# spring orders",
+                "eng: lon - nth",
+                json.dumps({"player": "fra", "orders": ["par - bur", "x"]}),
+                "eng: lon - mos",
+                "zzz: par hold",
+                "{not json",
+                "",
+                "eng: edi - nwg",
+            ]
+        )
+    )
+    report = import_orders(source, "import_test", state, classic_rules, root)
+    assert report.accepted == 3
+    assert report.rejected == 4
+    assert [line_no for line_no, _ in report.errors] == [3, 4, 5, 6]
+    assert report.errors[2] == (5, "No such player: zzz")
+
+    saved = load(root / "import_test" / "orders.json")
+    assert saved["eng"] == ["lon - nth", "edi - nwg"]
+    assert saved["fra"] == ["par - bur"]
+
+
+def test_import_orders_flushes_in_batches(game, classic_rules, monkeypatch):
+    root, state = game
+    writes = []
+    merges = []
+    spool = order_import.spool_player_orders
+    merge = order_import.merge_spooled_orders
+
+    def record_spool(spool_dir, orders_by_player):
+        writes.append(sum(len(o) for o in orders_by_player.values()))
+        spool(spool_dir, orders_by_player)
+
+    def record_merge(game_id, spool_dir, root_dir):
+        merges.append(game_id)
+        merge(game_id, spool_dir, root_dir)
+
+    monkeypatch.setattr(order_import, "spool_player_orders", record_spool)
+    monkeypatch.setattr(order_import, "merge_spooled_orders", record_merge)
+    lines = [
+        "eng: lon hold",
+        "fra: par hold",
+        "ger: ber hold",
+        "ita: rom hold",
+        "aus: vie hold",
+        "eng: edi hold",
+    ]
+    report = import_orders(
+        lines, "import_test", state, classic_rules, root, batch_size=2
+    )
+    assert report.accepted == 6
+    assert writes == [2, 2, 2]
+    assert merges == ["import_test"]
+    saved = load(root / "import_test" / "orders.json")
+    assert saved["aus"] == ["vie hold"]
+    assert saved["eng"] == ["lon hold", "edi hold"]
+    assert not list((root / "import_test").glob("import-*"))
+
+
+def test_merged_orders_keep_existing_and_json_layout(game, classic_rules):
+    root, state = game
+    path = root / "import_test" / "orders.json"
+    path.write_text(json.dumps({"eng": ["lon hold"], "fra": []}, indent=2))
+    import_orders(
+        ["eng: edi hold", "ger: ber hold"],
+        "import_test",
+        state,
+        classic_rules,
+        root,
+    )
+    expected = {"eng": ["lon hold", "edi hold"], "fra": [], "ger": ["ber hold"]}
+    assert path.read_text() == json.dumps(expected, indent=2)
+
+
+def test_failed_import_leaves_orders_untouched(game, classic_rules):
+    root, state = game
+    path = root / "import_test" / "orders.json"
+    before = path.read_bytes() if path.exists() else None
+
+    def lines():
+        yield "eng: lon hold"
+        raise UnicodeDecodeError("utf-8", b"\xff", 0, 1, "invalid start byte")
+
+    with pytest.raises(UnicodeDecodeError):
+        import_orders(
+            lines(), "import_test", state, classic_rules, root, batch_size=1
+        )
+    assert (path.read_bytes() if path.exists() else None) == before
+    assert not list((root / "import_test").glob("import-*"))
+
+
+def test_import_orders_from_file_without_validation(game, classic_rules):
+    root, state = game
+    path = root / "orders.txt"
+    path.write_text("lon - mos\nlon hold\n", encoding="utf-8")
+    report = import_orders(
+        path,
+        "import_test",
+        state,
+        classic_rules,
+        root,
+        default_player="eng",
+        validate=False,
+    )
+    assert report.accepted == 2
+    saved = load(root / "import_test" / "orders.json")
+    assert saved["eng"] == ["lon - mos", "lon hold"]
@@ -1,3 +1,6 @@
+import random
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from types import SimpleNamespace
 from typing import cast
 
@@ -7,16 +10,20 @@ from diplomacy_cli.core.logic.rules_loader import load_rules
 from diplomacy_cli.core.logic.schema import (
     OrderType,
     OutcomeType,
+    ResolutionBackend,
     ResolutionSoA,
     UnitType,
 )
+from diplomacy_cli.core.logic.validator import resolution
 from diplomacy_cli.core.logic.validator.resolution import (
     ResolutionMaps,
+    ResolutionScratch,
     assign_move_outcomes,
     calculate_strength,
     cut_supports,
     detect_dislodged,
     find_convoy_path,
+    find_dislodgers,
     flag_support_convoy_mismatches,
     get_convoy_path,
     make_resolution_maps,
@@ -55,6 +62,7 @@ def test_make_resolution_maps_single_move(resolution_soa_factory):
     assert not maps.convoys_by_army_origin
     assert not maps.convoys_by_army_dest
     assert not maps.hold_by_origin
+    assert not maps.support_idxs
 
 
 def test_make_resolution_maps_mixed_orders_ignore_none(resolution_soa_factory):
@@ -113,6 +121,7 @@ def test_make_resolution_maps_no_orders(resolution_soa_factory):
     assert not maps.convoys_by_army_origin
     assert not maps.convoys_by_army_dest
     assert not maps.hold_by_origin
+    assert not maps.support_idxs
 
 
 def test_move_phase_soa_basic(loaded_state_factory, semantic_map_factory):
@@ -538,8 +547,7 @@ def test_cut_support_success_support_hold_attacked_by_third_party(
         new_territory=["A", "A", "C"],
         outcome=[None, OutcomeType.MOVE_SUCCESS, None],
     )
-    move_by_origin = {"B": 1}
-    result = cut_supports(soa, move_by_origin)
+    result = cut_supports(soa, make_resolution_maps(soa))
     assert result == [True, False, False]
 
 
@@ -560,8 +568,7 @@ def test_support_hold_not_cut_if_supporting_unit_attacks_supporter(
         new_territory=["B", "B"],
         outcome=[None, OutcomeType.MOVE_SUCCESS],
     )
-    move_by_origin = {"A": 1}
-    result = cut_supports(soa, move_by_origin)
+    result = cut_supports(soa, make_resolution_maps(soa))
     assert result == [False, False]
 
 
@@ -580,8 +587,7 @@ def test_cut_support_fails_wrong_destination(resolution_soa_factory):
         new_territory=["B", "C"],
         outcome=[None, OutcomeType.MOVE_SUCCESS],
     )
-    move_by_origin = {"A": 1}
-    result = cut_supports(soa, move_by_origin)
+    result = cut_supports(soa, make_resolution_maps(soa))
     assert result == [False, False]
 
 
@@ -600,8 +606,7 @@ def test_cut_support_fails_move_no_convoy(resolution_soa_factory):
         new_territory=["B", "B"],
         outcome=[None, OutcomeType.MOVE_NO_CONVOY],
     )
-    move_by_origin = {"A": 1}
-    result = cut_supports(soa, move_by_origin)
+    result = cut_supports(soa, make_resolution_maps(soa))
     assert result == [False, False]
 
 
@@ -620,11 +625,37 @@ def test_cut_support_fails_from_supported_unit(resolution_soa_factory):
         new_territory=["B", "B"],
         outcome=[None, OutcomeType.MOVE_SUCCESS],
     )
-    move_by_origin = {"A": 1}
-    result = cut_supports(soa, move_by_origin)
+    result = cut_supports(soa, make_resolution_maps(soa))
     assert result == [False, False]
 
 
+def test_cut_support_checks_every_attack_on_supporter(
+    resolution_soa_factory,
+):
+    soa = resolution_soa_factory(
+        unit_id=["u1", "u2", "u3", "u4"],
+        owner_id=["p1", "p2", "p3", "p1"],
+        unit_type=[UnitType.ARMY] * 4,
+        orig_territory=["B", "A", "C", "D"],
+        order_type=[
+            OrderType.SUPPORT_MOVE,
+            OrderType.MOVE,
+            OrderType.MOVE,
+            OrderType.SUPPORT_HOLD,
+        ],
+        move_destination=[None, "B", "B", None],
+        support_origin=["D", None, None, "B"],
+        support_destination=["A", None, None, None],
+        convoy_origin=[None] * 4,
+        convoy_destination=[None] * 4,
+        new_territory=["B", "B", "B", "D"],
+        outcome=[None, OutcomeType.MOVE_SUCCESS, None, None],
+    )
+    maps = make_resolution_maps(soa)
+    assert maps.support_idxs == [0, 3]
+    assert cut_supports(soa, maps) == [True, False, False, False]
+
+
 def test_non_support_order_ignored(resolution_soa_factory):
     soa = resolution_soa_factory(
         unit_id=["u1", "u2"],
@@ -640,8 +671,7 @@ def test_non_support_order_ignored(resolution_soa_factory):
         new_territory=["C", "B"],
         outcome=[OutcomeType.MOVE_SUCCESS, OutcomeType.MOVE_SUCCESS],
     )
-    move_by_origin = {"A": 1}
-    result = cut_supports(soa, move_by_origin)
+    result = cut_supports(soa, make_resolution_maps(soa))
     assert result == [False, False]
 
 
@@ -924,6 +954,74 @@ def test_resolve_cascading_tie(resolution_soa_factory):
     assert result == ["A", "C", "D"]
 
 
+def legacy_resolve_conflict(soa):
+    new_territory = soa.new_territory.copy()
+    changed = True
+    while changed:
+        changed = False
+        contested = defaultdict(list)
+        for i, dest in enumerate(new_territory):
+            contested[dest].append(i)
+        for indices in contested.values():
+            if len(indices) == 1:
+                continue
+            max_s = max(soa.strength[i] for i in indices)
+            winners = [i for i in indices if soa.strength[i] == max_s]
+            for i in indices:
+                if len(winners) == 1 and i == winners[0]:
+                    continue
+                if new_territory[i] != soa.orig_territory[i]:
+                    new_territory[i] = soa.orig_territory[i]
+                    changed = True
+    return new_territory
+
+
+def test_resolve_long_bounce_chain(resolution_soa_factory):
+    n = 500
+    territories = [f"T{i}" for i in range(n + 1)]
+    soa = resolution_soa_factory(
+        unit_id=[f"u{i}" for i in range(n + 1)],
+        owner_id=["p1"] * (n + 1),
+        unit_type=[UnitType.ARMY] * (n + 1),
+        orig_territory=territories[1:] + ["X"],
+        order_type=[OrderType.MOVE] * (n + 1),
+        move_destination=territories[:n] + ["T0"],
+        new_territory=territories[:n] + ["T0"],
+        support_origin=[None] * (n + 1),
+        support_destination=[None] * (n + 1),
+        convoy_origin=[None] * (n + 1),
+        convoy_destination=[None] * (n + 1),
+    )
+    assert resolve_conflict(soa) == territories[1:] + ["X"]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_resolve_conflict_matches_legacy(resolution_soa_factory, seed):
+    rng = random.Random(seed)
+    for _ in range(50):
+        n = rng.randint(1, 30)
+        territories = [f"T{i}" for i in range(rng.randint(n, n + 10))]
+        orig = rng.sample(territories, n)
+        new = [
+            rng.choice(territories) if rng.random() < 0.7 else o for o in orig
+        ]
+        soa = resolution_soa_factory(
+            unit_id=[f"u{i}" for i in range(n)],
+            owner_id=[f"p{i % 3}" for i in range(n)],
+            unit_type=[UnitType.ARMY] * n,
+            orig_territory=orig,
+            order_type=[OrderType.MOVE] * n,
+            move_destination=new,
+            new_territory=new,
+            support_origin=[None] * n,
+            support_destination=[None] * n,
+            convoy_origin=[None] * n,
+            convoy_destination=[None] * n,
+            strength=[rng.randint(1, 3) for _ in range(n)],
+        )
+        assert resolve_conflict(soa) == legacy_resolve_conflict(soa)
+
+
 @pytest.mark.parametrize(
     "description, soa_kwargs, expected",
     [
@@ -1005,6 +1103,31 @@ def test_detect_dislodged(
     assert result == expected, f"Failed: {description}"
 
 
+def test_find_dislodgers_records_attacker(resolution_soa_factory):
+    soa = resolution_soa_factory(
+        unit_id=["u1", "u2", "u3", "u4"],
+        owner_id=["p1", "p2", "p2", "p1"],
+        unit_type=[UnitType.ARMY] * 4,
+        orig_territory=["A", "B", "C", "D"],
+        order_type=[
+            OrderType.HOLD,
+            OrderType.MOVE,
+            OrderType.MOVE,
+            OrderType.HOLD,
+        ],
+        move_destination=[None, "A", "D", None],
+        support_origin=[None] * 4,
+        support_destination=[None] * 4,
+        convoy_origin=[None] * 4,
+        convoy_destination=[None] * 4,
+        new_territory=["A", "A", "C", "D"],
+    )
+    assert find_dislodgers(soa) == (
+        [True, False, False, False],
+        [1, -1, -1, -1],
+    )
+
+
 def test_assign_move_success(resolution_soa_factory):
     soa = resolution_soa_factory(
         unit_id=["u1"],
@@ -1304,6 +1427,7 @@ def test_supported_move_dislodges_unit(resolution_soa_factory, rules_factory):
 
     assert resolved.new_territory[0] == "B"
     assert resolved.dislodged[2] is True
+    assert resolved.dislodged_by == [-1, -1, 0]
 
 
 def test_convoyed_move_cuts_support(resolution_soa_factory, rules_factory):
@@ -1419,3 +1543,158 @@ def test_resolve_move_phase_fixed_point_convoy_invalidation(
 
     idx_a3 = soa.unit_id.index("u_a3")
     assert soa.outcome[idx_a3] == OutcomeType.SUPPORT_SUCCESS
+
+
+def test_move_resolution_pass_leaves_input_untouched(
+    resolution_soa_factory, rules_factory
+):
+    soa = resolution_soa_factory(
+        unit_id=["u1", "u2"],
+        owner_id=["p1", "p2"],
+        unit_type=[UnitType.ARMY, UnitType.ARMY],
+        orig_territory=["A", "B"],
+        order_type=[OrderType.MOVE, OrderType.HOLD],
+        move_destination=["B", None],
+        support_origin=[None, None],
+        support_destination=[None, None],
+        convoy_origin=[None, None],
+        convoy_destination=[None, None],
+    )
+    rules = rules_factory(
+        parent_to_coast={"A": {"A"}, "B": {"B"}},
+        adjacency_map={"A": [("B", "land")], "B": [("A", "land")]},
+    )
+    resolved = move_resolution_pass(soa, make_resolution_maps(soa), rules)
+
+    assert resolved.new_territory == ["A", "B"]
+    assert soa.new_territory == ["A", "B"]
+    assert resolved.strength is not soa.strength
+
+
+BOUNCE = (
+    [("U1", 1, UnitType.ARMY, "par"), ("U2", 2, UnitType.ARMY, "mun")],
+    [
+        {
+            "player_id": 1,
+            "origin": "par",
+            "order_type": OrderType.MOVE,
+            "destination": "bur",
+        },
+        {
+            "player_id": 2,
+            "origin": "mun",
+            "order_type": OrderType.MOVE,
+            "destination": "bur",
+        },
+    ],
+)
+DISLODGE = (
+    [
+        ("U1", 1, UnitType.ARMY, "bur"),
+        ("U2", 1, UnitType.ARMY, "pic"),
+        ("U3", 2, UnitType.ARMY, "par"),
+    ],
+    [
+        {
+            "player_id": 1,
+            "origin": "bur",
+            "order_type": OrderType.MOVE,
+            "destination": "par",
+        },
+        {
+            "player_id": 1,
+            "origin": "pic",
+            "order_type": OrderType.SUPPORT_MOVE,
+            "support_origin": "bur",
+            "support_destination": "par",
+        },
+    ],
+)
+
+
+def test_resolve_move_phase_reuses_scratch(
+    semantic_map_factory, loaded_state_factory, classic_rules
+):
+    def resolve(specs, orders, scratch):
+        ls = loaded_state_factory(specs)
+        sem_by_unit, _ = semantic_map_factory(ls, orders)
+        soa = resolve_move_phase(sem_by_unit, ls, classic_rules, scratch)
+        return soa.new_territory, soa.outcome, soa.dislodged_by
+
+    scratch = ResolutionScratch()
+    for specs, orders in (BOUNCE, DISLODGE, BOUNCE):
+        assert resolve(specs, orders, scratch) == resolve(
+            specs, orders, ResolutionScratch()
+        )
+    new_territory, outcome, dislodged_by = resolve(*DISLODGE, scratch)
+    assert new_territory == ["par", "pic", "par"]
+    assert outcome[2] == OutcomeType.DISLODGED
+    assert dislodged_by == [-1, -1, 0]
+
+
+def test_scratch_does_not_retain_stale_territories(
+    semantic_map_factory, loaded_state_factory, classic_rules
+):
+    scratch = ResolutionScratch()
+    for specs, orders in (BOUNCE, DISLODGE):
+        ls = loaded_state_factory(specs)
+        sem_by_unit, _ = semantic_map_factory(ls, orders)
+        resolve_move_phase(sem_by_unit, ls, classic_rules, scratch)
+        seen = {spec[3] for spec in specs}
+        seen.update(
+            order["destination"] for order in orders if "destination" in order
+        )
+        assert set(scratch.occupants) <= seen
+    assert "mun" not in scratch.occupants
+
+
+def test_default_scratch_is_per_thread(
+    semantic_map_factory, loaded_state_factory, classic_rules
+):
+    cases = []
+    for specs, orders in (BOUNCE, DISLODGE):
+        ls = loaded_state_factory(specs)
+        sem_by_unit, _ = semantic_map_factory(ls, orders)
+        expected = resolve_move_phase(
+            sem_by_unit, ls, classic_rules, ResolutionScratch()
+        )
+        cases.append((sem_by_unit, ls, expected))
+
+    main_scratch = resolution.default_scratch()
+
+    def resolve(i):
+        sem_by_unit, ls, expected = cases[i % len(cases)]
+        soa = resolve_move_phase(sem_by_unit, ls, classic_rules)
+        return soa == expected, id(resolution.default_scratch())
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(resolve, range(200)))
+    assert all(ok for ok, _ in results)
+    scratches = {scratch for _, scratch in results}
+    assert id(main_scratch) not in scratches
+    assert resolution.default_scratch() is main_scratch
+
+
+def test_numpy_backend_falls_back_without_numpy(
+    monkeypatch, semantic_map_factory, loaded_state_factory, classic_rules
+):
+    ls = loaded_state_factory(
+        [("U1", 1, UnitType.ARMY, "par"), ("U2", 2, UnitType.ARMY, "mun")]
+    )
+    sem_by_unit, _ = semantic_map_factory(
+        ls,
+        [
+            {
+                "player_id": 1,
+                "origin": "par",
+                "order_type": OrderType.MOVE,
+                "destination": "bur",
+            },
+        ],
+    )
+    monkeypatch.setattr(resolution, "find_spec", lambda name: None)
+    soa = resolve_move_phase(
+        sem_by_unit, ls, classic_rules, backend=ResolutionBackend.NUMPY
+    )
+    assert soa == resolve_move_phase(sem_by_unit, ls, classic_rules)
+    assert soa.new_territory == ["bur", "mun"]
@@ -0,0 +1,105 @@
+import random
+
+import pytest
+
+from diplomacy_cli.core.logic.legal_orders import legal_orders_by_unit
+from diplomacy_cli.core.logic.schema import (
+    LegalOrderCache,
+    OrderType,
+    Phase,
+    ResolutionBackend,
+    SemanticResult,
+    UnitType,
+)
+from diplomacy_cli.core.logic.validator.resolution import (
+    resolve_conflict,
+    resolve_move_phase,
+)
+
+pytest.importorskip("numpy")
+
+from diplomacy_cli.core.logic.validator.resolution_np import (  # noqa: E402
+    encode_soa,
+    resolve_conflict_np,
+)
+
+
+@pytest.fixture
+def crowded_board(loaded_state_factory, classic_rules):
+    rules = classic_rules
+    owners = sorted(rules.nation_display_names)
+    specs = []
+    for i, tid in enumerate(sorted(rules.supply_centers)):
+        fleet = tid in rules.fleet_adjacency and i % 2
+        unit_type = UnitType.FLEET if fleet else UnitType.ARMY
+        specs.append((f"U{i}", owners[i % 7], unit_type, tid))
+    seas = sorted(
+        tid for tid, kind in rules.territory_type.items() if kind == "sea"
+    )
+    for i, tid in enumerate(seas):
+        specs.append((f"S{i}", owners[i % 7], UnitType.FLEET, tid))
+    return loaded_state_factory(specs)
+
+
+def random_orders(state, legal, rng):
+    orders = {uid: rng.choice(orders) for uid, orders in legal.items()}
+    by_origin = {order.origin: order for order in orders.values()}
+    for uid, order in orders.items():
+        if order.support_origin is None:
+            continue
+        supported = by_origin[order.support_origin].order_type
+        if order.order_type == OrderType.SUPPORT_MOVE:
+            ok = supported == OrderType.MOVE
+        else:
+            ok = supported in (OrderType.HOLD, OrderType.SUPPORT_HOLD)
+        if not ok:
+            orders[uid] = legal[uid][0]
+    return {
+        uid: SemanticResult(
+            state.game.units[uid]["owner_id"], "", "", order, True, []
+        )
+        for uid, order in orders.items()
+    }
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_numpy_backend_matches_python(crowded_board, classic_rules, seed):
+    rng = random.Random(seed)
+    legal = legal_orders_by_unit(
+        crowded_board, classic_rules, Phase.MOVEMENT, LegalOrderCache()
+    )
+    for _ in range(20):
+        sem_by_unit = random_orders(crowded_board, legal, rng)
+        expected = resolve_move_phase(sem_by_unit, crowded_board, classic_rules)
+        actual = resolve_move_phase(
+            sem_by_unit,
+            crowded_board,
+            classic_rules,
+            backend=ResolutionBackend.NUMPY,
+        )
+        assert actual == expected
+
+
+def test_numpy_conflict_matches_python_on_bounce_chain(
+    resolution_soa_factory, rules_factory
+):
+    n = 200
+    territories = [f"T{i}" for i in range(n + 1)]
+    soa = resolution_soa_factory(
+        unit_id=[f"u{i}" for i in range(n + 1)],
+        owner_id=["p1"] * (n + 1),
+        unit_type=[UnitType.ARMY] * (n + 1),
+        orig_territory=territories[1:] + ["X"],
+        order_type=[OrderType.MOVE] * (n + 1),
+        move_destination=territories[:n] + ["T0"],
+        new_territory=territories[:n] + ["T0"],
+        support_origin=[None] * (n + 1),
+        support_destination=[None] * (n + 1),
+        convoy_origin=[None] * (n + 1),
+        convoy_destination=[None] * (n + 1),
+        strength=[1] * n + [2],
+    )
+    rules = rules_factory(parent_to_coast={}, adjacency_map={})
+    arr = encode_soa(soa, rules)
+    resolve_conflict_np(arr)
+    assert [arr.territories[c] for c in arr.new] == resolve_conflict(soa)
@@ -1,4 +1,10 @@
-from diplomacy_cli.core.logic.rules_loader import Rules, load_rules
+from diplomacy_cli.core.logic import rules_cache, rules_loader
+from diplomacy_cli.core.logic.rules_cache import variant_digest
+from diplomacy_cli.core.logic.rules_loader import (
+    Rules,
+    clear_rules_memo,
+    load_rules,
+)
 
 
 def test_load_rules_smoke():
@@ -80,3 +86,83 @@ def test_home_centers_contents():
         assert isinstance(country, str)
         assert isinstance(centers, set)
         assert all(isinstance(t, str) for t in centers)
+
+
+def test_compiled_rules_cached_on_disk(tmp_path):
+    clear_rules_memo()
+    rules = load_rules("classic", cache_dir=tmp_path)
+    assert len(list((tmp_path / "rules").glob("classic-*.rules.pickle"))) == 1
+    assert len(list((tmp_path / "rules").glob("classic-*.convoy.json"))) == 1
+
+    clear_rules_memo()
+    cached = load_rules("classic", cache_dir=tmp_path)
+    assert cached is not rules
+    assert cached == rules
+
+
+def test_load_rules_memoized_in_process(tmp_path):
+    rules = load_rules("classic", cache_dir=tmp_path)
+    assert load_rules("classic", cache_dir=tmp_path) is rules
+
+
+def test_memo_hit_skips_hashing(tmp_path, monkeypatch):
+    clear_rules_memo()
+    rules = load_rules("classic", cache_dir=tmp_path)
+
+    def fail(variant):
+        raise AssertionError("memo hit should not hash the variant")
+
+    monkeypatch.setattr(rules_loader, "variant_digest", fail)
+    assert load_rules("classic", cache_dir=tmp_path) is rules
+
+
+def test_memo_is_keyed_by_cache_dir(tmp_path):
+    clear_rules_memo()
+    cached = load_rules("classic", cache_dir=tmp_path / "a")
+    uncached = load_rules("classic", cache_dir=None)
+    assert uncached is not cached
+    assert load_rules("classic", cache_dir=tmp_path / "b") is not cached
+    assert list((tmp_path / "b" / "rules").glob("classic-*.rules.pickle"))
+
+
+def test_digest_covers_builder_sources(monkeypatch):
+    digest = variant_digest("classic")
+    monkeypatch.setattr(rules_cache, "builder_digest", lambda: "changed")
+    assert variant_digest("classic") != digest
+
+
+def test_disk_cache_skips_compilation(tmp_path, monkeypatch):
+    clear_rules_memo()
+    load_rules("classic", cache_dir=tmp_path)
+    clear_rules_memo()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("rules should come from the disk cache")
+
+    monkeypatch.setattr(rules_loader, "compile_rules", fail)
+    assert isinstance(load_rules("classic", cache_dir=tmp_path), Rules)
+
+
+def test_changed_variant_files_invalidate_cache(tmp_path, monkeypatch):
+    clear_rules_memo()
+    rules = load_rules("classic", cache_dir=tmp_path)
+    monkeypatch.setattr(rules_loader, "variant_stamp", lambda variant: None)
+    monkeypatch.setattr(
+        rules_loader, "variant_digest", lambda variant: "f" * 64
+    )
+
+    recompiled = load_rules("classic", cache_dir=tmp_path)
+    assert recompiled is not rules
+    assert len(list((tmp_path / "rules").glob("classic-*.rules.pickle"))) == 2
+
+
+def test_corrupt_rules_cache_is_rebuilt(tmp_path):
+    clear_rules_memo()
+    rules = load_rules("classic", cache_dir=tmp_path)
+    for artifact in (tmp_path / "rules").iterdir():
+        artifact.write_text("{not json")
+
+    clear_rules_memo()
+    assert load_rules("classic", cache_dir=tmp_path) == rules
+    clear_rules_memo()
+    assert load_rules("classic", cache_dir=None) == rules
@@ -14,6 +14,8 @@ from diplomacy_cli.core.logic.schema import (
 )
 from diplomacy_cli.core.logic.validator.semantic import (
     SemanticError,
+    SemanticErrorCode,
+    SemanticIssue,
     _check_adjacency,
     _check_build,
     _check_convoy,
@@ -27,6 +29,10 @@ from diplomacy_cli.core.logic.validator.semantic import (
     _check_unit_exists,
     _check_unit_ownership,
     _has_sea_path,
+    build_validation_context,
+    check_semantic,
+    potential_supporters,
+    render_issue,
     validate_semantic,
 )
 
@@ -299,6 +305,60 @@ def test_check_support_hold(loaded_state_factory, classic_rules):
     _check_support_hold("eng", order, state, classic_rules)
 
 
+def test_check_support_into_split_coast(loaded_state_factory, classic_rules):
+    unit_specs = [
+        ("U1", "fra", UnitType.ARMY, "gas"),
+        ("U2", "fra", UnitType.FLEET, "spa_nc"),
+        ("U3", "fra", UnitType.FLEET, "mao"),
+        ("U4", "fra", UnitType.ARMY, "por"),
+    ]
+    state = loaded_state_factory(unit_specs)
+    hold = Order(
+        origin="gas", order_type=OrderType.SUPPORT_HOLD, support_origin="spa_nc"
+    )
+    _check_support_hold("fra", hold, state, classic_rules)
+    move = Order(
+        origin="mao",
+        order_type=OrderType.SUPPORT_MOVE,
+        support_origin="por",
+        support_destination="spa",
+    )
+    _check_support_move("fra", move, state, classic_rules)
+
+
+def test_check_support_move_out_of_reach(loaded_state_factory, classic_rules):
+    unit_specs = [
+        ("U1", "eng", UnitType.FLEET, "nth"),
+        ("U2", "eng", UnitType.ARMY, "lon"),
+    ]
+    state = loaded_state_factory(unit_specs)
+    order = Order(
+        origin="nth",
+        order_type=OrderType.SUPPORT_MOVE,
+        support_origin="lon",
+        support_destination="wal",
+    )
+    with pytest.raises(SemanticError, match="Fleet at nth cannot reach wal"):
+        _check_support_move("eng", order, state, classic_rules)
+
+
+def test_potential_supporters(loaded_state_factory, classic_rules):
+    unit_specs = [
+        ("U1", "fra", UnitType.ARMY, "gas"),
+        ("U2", "fra", UnitType.FLEET, "mao"),
+        ("U3", "fra", UnitType.ARMY, "bre"),
+        ("U4", "fra", UnitType.FLEET, "wes"),
+        ("U5", "fra", UnitType.FLEET, "spa_sc"),
+    ]
+    state = loaded_state_factory(unit_specs)
+    assert potential_supporters("spa", state, classic_rules) == [
+        "U1",
+        "U2",
+        "U4",
+    ]
+    assert potential_supporters("mao", state, classic_rules) == ["U5", "U4"]
+
+
 def test_check_convoy(loaded_state_factory, classic_rules):
     unit_specs = [
         ("U1", "eng", UnitType.FLEET, "eng"),
@@ -619,9 +679,118 @@ def test_validate_semantic_invalid(loaded_state_factory, classic_rules):
         raw="lon - fun",
         normalized="lon-fun",
         valid=False,
-        errors=["fun is not a valid territory"],
+        errors=["fun is not a valid territory", "Did you mean: fin, mun, tun?"],
         order=order,
     )
     validated = validate_semantic(player_id, syntax, classic_rules, state)
 
     assert validated == expected
+
+
+def test_validation_context_shared_across_orders(
+    loaded_state_factory, classic_rules
+):
+    order = Order(origin="lon", order_type=OrderType.MOVE, destination="wal")
+    semantic = SemanticResult("eng", "lon-wal", "lon-wal", order, True, [])
+    resolution = ResolutionResult(
+        unit_id="U1",
+        owner_id="eng",
+        unit_type=UnitType.FLEET,
+        origin_territory="lon",
+        semantic_result=semantic,
+        outcome=OutcomeType.DISLODGED,
+        resolved_territory="lon",
+        strength=1,
+        duplicate_orders=[],
+    )
+    report = PhaseResolutionReport(
+        phase=Phase.MOVEMENT,
+        season=Season.SPRING,
+        year=1901,
+        valid_syntax=[],
+        valid_semantics=[],
+        syntax_errors=[],
+        semantic_errors=[],
+        resolution_results=[resolution],
+    )
+    unit_specs = [
+        ("U1", "eng", UnitType.FLEET, "lon"),
+        ("U2", "fra", UnitType.ARMY, "par"),
+    ]
+    state = loaded_state_factory(unit_specs=unit_specs, pending_move=report)
+    ctx = build_validation_context(state)
+    assert ctx.dislodged_origins == {"lon"}
+    assert ctx.unit_type_by_territory == {
+        "lon": UnitType.FLEET,
+        "par": UnitType.ARMY,
+    }
+    assert ctx.owner_by_territory == {"lon": "eng", "par": "fra"}
+
+    for origin, destination, valid in [
+        ("lon", "wal", True),
+        ("lon", "eng", True),
+        ("par", "bur", False),
+    ]:
+        order = Order(
+            origin=origin,
+            order_type=OrderType.RETREAT,
+            destination=destination,
+        )
+        raw = f"{origin} - {destination}"
+        syntax = SyntaxResult("eng", raw, raw, True, [], order)
+        with_ctx = validate_semantic("eng", syntax, classic_rules, state, ctx)
+        without = validate_semantic("eng", syntax, classic_rules, state)
+        assert with_ctx == without
+        assert with_ctx.valid == valid
+
+
+@pytest.mark.parametrize(
+    "order, expected",
+    [
+        (
+            Order(origin="lon", order_type=OrderType.MOVE, destination="wal"),
+            None,
+        ),
+        (
+            Order(origin="lon", order_type=OrderType.MOVE, destination="mos"),
+            SemanticIssue(SemanticErrorCode.NO_CONVOY_ROUTE, ("lon", "mos")),
+        ),
+        (
+            Order(origin="lon", order_type=OrderType.MOVE, destination="fun"),
+            SemanticIssue(SemanticErrorCode.UNKNOWN_TERRITORY, ("fun",)),
+        ),
+        (
+            Order(
+                origin="lon",
+                order_type=OrderType.SUPPORT_HOLD,
+                support_origin="par",
+            ),
+            SemanticIssue(SemanticErrorCode.NO_UNIT, ("par",)),
+        ),
+        (
+            Order(origin="lon", order_type=OrderType.CONVOY),
+            SemanticIssue(SemanticErrorCode.CONVOY_INCOMPLETE),
+        ),
+    ],
+)
+def test_check_semantic_returns_codes(
+    loaded_state_factory, classic_rules, order, expected
+):
+    state = loaded_state_factory([("U1", "eng", UnitType.ARMY, "lon")])
+    assert check_semantic("eng", order, classic_rules, state) == expected
+
+
+def test_render_issue_matches_raised_messages(
+    loaded_state_factory, classic_rules
+):
+    state = loaded_state_factory([("U1", "eng", UnitType.ARMY, "lon")])
+    order = Order(origin="lon", order_type=OrderType.MOVE, destination="mos")
+    issue = check_semantic("fra", order, classic_rules, state)
+    assert issue is not None
+    with pytest.raises(SemanticError) as excinfo:
+        _check_move("fra", order, state, classic_rules)
+    assert render_issue(issue, classic_rules) == [str(excinfo.value)]
+    assert render_issue(
+        SemanticIssue(SemanticErrorCode.UNKNOWN_TERRITORY, ("fun",)),
+        classic_rules,
+    ) == ["fun is not a valid territory", "Did you mean: fin, mun, tun?"]
@@ -1,3 +1,6 @@
+import random
+import re
+
 import pytest
 
 from diplomacy_cli.core.logic.validator.syntax import (
@@ -5,20 +8,13 @@ from diplomacy_cli.core.logic.validator.syntax import (
     OrderType,
     ParseError,
     Phase,
-    dispatch_parsers,
-    ensure_no_tokens,
-    expect,
+    UnitType,
+    clear_parse_cache,
+    compile_order,
     normalize_order_string,
-    parse_build,
-    parse_convoy,
-    parse_disband,
-    parse_hold,
-    parse_move,
-    parse_support_hold,
-    parse_support_move,
+    parse_cache_info,
+    parse_orders_bulk,
     parse_syntax,
-    take_province,
-    take_unit_type,
 )
 
 
@@ -42,168 +38,142 @@ def test_normalize_various_cases(raw, expected):
     assert normalize_order_string(raw) == expected
 
 
-def test_expect():
-    raw = ["build", "army", "stp"]
-    expected = None
-    assert expect(raw, "build") == expected
-    raw = ["army", "stp"]
-    with pytest.raises(ParseError) as excinfo:
-        expect(raw, "build")
-    assert f"Expected {'build'!r}" in str(excinfo.value)
-
-
-def test_expect_success_and_failure():
-    raw = ["build", "army", "stp"]
-    assert expect(raw, "build") is None
-    assert raw == ["army", "stp"]
-
-    raw = ["army", "stp"]
-    with pytest.raises(ParseError) as excinfo:
-        expect(raw, "build")
-    assert "Expected 'build'" in str(excinfo.value)
-
-
-def test_take_province_success():
-    raw = ["par"]
-    prov = take_province(raw)
-    assert prov == "par"
-    assert raw == []
-
-
-def test_take_province_empty():
-    with pytest.raises(ParseError) as excinfo:
-        take_province([])
-    assert "Expected province, but got end of input" in str(excinfo.value)
-
-
-def test_take_unit_type_success():
-    raw = ["fleet", "lon"]
-    utype = take_unit_type(raw)
-    assert utype == "fleet"
-    assert raw == ["lon"]
-
-
-def test_take_unit_type_invalid_and_empty():
-    with pytest.raises(ParseError) as excinfo:
-        take_unit_type(["boat"])
-    assert "Expected unit type ‘army’ or ‘fleet’, but got 'boat'" in str(
-        excinfo.value
-    )
-
-    with pytest.raises(ParseError) as excinfo2:
-        take_unit_type([])
-    assert (
-        "Expected unit type (‘army’ or ‘fleet’), but got end of input"
-        in str(excinfo2.value)
-    )
-
-
-def test_ensure_no_tokens_success_and_failure():
-    ensure_no_tokens([])
-    with pytest.raises(ParseError) as excinfo:
-        ensure_no_tokens(["x", "y"])
-    assert "Extra tokens: ['x', 'y']" in str(excinfo.value)
-
-
-def test_parse_support_move_success_and_missing_token():
-    raw = ["par", "s", "mar", "-", "bre"]
-    order = parse_support_move(raw.copy())
-    assert isinstance(order, Order)
-    assert order.origin == "par"
-    assert order.order_type == OrderType.SUPPORT_MOVE
-    assert order.support_origin == "mar"
-    assert order.support_destination == "bre"
-
-    with pytest.raises(ParseError):
-        parse_support_move(["par", "x", "mar", "-", "bre"])
-
-
-def test_parse_support_hold_success_and_missing():
-    raw = ["tun", "s", "ven"]
-    order = parse_support_hold(raw.copy())
-    assert order.origin == "tun"
-    assert order.order_type == OrderType.SUPPORT_HOLD
-    assert order.support_origin == "ven"
-
-    with pytest.raises(ParseError):
-        parse_support_hold(["tun"])
-
-
-def test_parse_convoy_success_and_missing():
-    raw = ["ida", "c", "bul", "-", "con"]
-    order = parse_convoy(raw.copy())
-    assert order.origin == "ida"
-    assert order.order_type == OrderType.CONVOY
-    assert order.convoy_origin == "bul"
-    assert order.convoy_destination == "con"
-
-    with pytest.raises(ParseError):
-        parse_convoy(["ida", "c", "bul", "x", "con"])
-
-
-def test_parse_move_success_and_extra_and_missing():
-    raw = ["loe", "-", "fin"]
-    order = parse_move(raw.copy())
-    assert order.origin == "loe"
-    assert order.order_type == OrderType.MOVE
-    assert order.destination == "fin"
-
-    with pytest.raises(ParseError):
-        parse_move(["loe", "-", "fin", "x"])
-
-    with pytest.raises(ParseError):
-        parse_move(["loe", "x", "fin"])
-
-
-def test_parse_hold_success_and_missing():
-    raw = ["ank", "hold"]
-    order = parse_hold(raw.copy())
-    assert order.origin == "ank"
-    assert order.order_type == OrderType.HOLD
-
-    with pytest.raises(ParseError):
-        parse_hold(["ank"])
-
-
-def test_parse_build_success_and_errors():
-    raw = ["build", "army", "ber"]
-    order = parse_build(raw.copy())
-    assert order.origin == "ber"
-    assert order.unit_type == "army"
-    assert order.order_type == OrderType.BUILD
-
-    with pytest.raises(ParseError):
-        parse_build(["bld", "army", "ber"])
-    with pytest.raises(ParseError):
-        parse_build(["build"])
-
-
-def test_parse_disband_success_and_errors():
-    raw = ["disband", "fleet", "sev"]
-    order = parse_disband(raw.copy())
-    assert order.origin == "sev"
-    assert order.unit_type == "fleet"
-    assert order.order_type == OrderType.DISBAND
-
-    with pytest.raises(ParseError):
-        parse_disband(["dband", "fleet", "sev"])
-    with pytest.raises(ParseError):
-        parse_disband(["disband"])
-
-
-def test_dispatch_parsers_success():
-    tokens = ["mar", "-", "ber"]
-    order = dispatch_parsers(tokens, Phase.MOVEMENT)
-    assert order.order_type == OrderType.MOVE
-    assert order.origin == "mar"
-    assert order.destination == "ber"
+@pytest.mark.parametrize(
+    "normalized, phase, expected",
+    [
+        (
+            "par s mar - bre",
+            Phase.MOVEMENT,
+            Order(
+                origin="par",
+                order_type=OrderType.SUPPORT_MOVE,
+                support_origin="mar",
+                support_destination="bre",
+            ),
+        ),
+        (
+            "tun s ven",
+            Phase.MOVEMENT,
+            Order(
+                origin="tun",
+                order_type=OrderType.SUPPORT_HOLD,
+                support_origin="ven",
+            ),
+        ),
+        (
+            "ida c bul - con",
+            Phase.MOVEMENT,
+            Order(
+                origin="ida",
+                order_type=OrderType.CONVOY,
+                convoy_origin="bul",
+                convoy_destination="con",
+            ),
+        ),
+        (
+            "loe - fin",
+            Phase.MOVEMENT,
+            Order(origin="loe", order_type=OrderType.MOVE, destination="fin"),
+        ),
+        (
+            "ank hold",
+            Phase.MOVEMENT,
+            Order(origin="ank", order_type=OrderType.HOLD),
+        ),
+        (
+            "ank hold now",
+            Phase.MOVEMENT,
+            Order(origin="ank", order_type=OrderType.HOLD),
+        ),
+        (
+            "par s mar - bre x",
+            Phase.MOVEMENT,
+            Order(
+                origin="par",
+                order_type=OrderType.SUPPORT_MOVE,
+                support_origin="mar",
+                support_destination="bre",
+            ),
+        ),
+        (
+            "par s mar x",
+            Phase.MOVEMENT,
+            Order(
+                origin="par",
+                order_type=OrderType.SUPPORT_HOLD,
+                support_origin="mar",
+            ),
+        ),
+        (
+            "- - -",
+            Phase.MOVEMENT,
+            Order(origin="-", order_type=OrderType.MOVE, destination="-"),
+        ),
+        (
+            "bur - mar",
+            Phase.RETREAT,
+            Order(
+                origin="bur", order_type=OrderType.RETREAT, destination="mar"
+            ),
+        ),
+        (
+            "build army ber",
+            Phase.ADJUSTMENT,
+            Order(
+                origin="ber",
+                order_type=OrderType.BUILD,
+                unit_type=UnitType.ARMY,
+            ),
+        ),
+        (
+            "disband fleet sev",
+            Phase.ADJUSTMENT,
+            Order(
+                origin="sev",
+                order_type=OrderType.DISBAND,
+                unit_type=UnitType.FLEET,
+            ),
+        ),
+        (
+            "build fleet stp_nc extra",
+            Phase.ADJUSTMENT,
+            Order(
+                origin="stp_nc",
+                order_type=OrderType.BUILD,
+                unit_type=UnitType.FLEET,
+            ),
+        ),
+    ],
+)
+def test_compile_order(normalized, phase, expected):
+    assert compile_order(normalized, phase) == expected
 
 
-def test_dispatch_parsers_failure():
+@pytest.mark.parametrize(
+    "normalized, phase",
+    [
+        ("par x mar - bre", Phase.MOVEMENT),
+        ("tun", Phase.MOVEMENT),
+        ("ida c bul x con", Phase.MOVEMENT),
+        ("loe - fin x", Phase.MOVEMENT),
+        ("loe x fin", Phase.MOVEMENT),
+        ("ank", Phase.MOVEMENT),
+        ("foo bar", Phase.MOVEMENT),
+        ("par hold", Phase.RETREAT),
+        ("bur - mar x", Phase.RETREAT),
+        ("bld army ber", Phase.ADJUSTMENT),
+        ("build", Phase.ADJUSTMENT),
+        ("build boat ber", Phase.ADJUSTMENT),
+        ("dband fleet sev", Phase.ADJUSTMENT),
+        ("disband", Phase.ADJUSTMENT),
+        ("par - bur", Phase.ADJUSTMENT),
+    ],
+)
+def test_compile_order_rejects(normalized, phase):
     with pytest.raises(ParseError) as excinfo:
-        dispatch_parsers(["foo", "bar"], Phase.MOVEMENT)
-    assert "Unrecognized order for MOVEMENT phase: foo bar" in str(
-        excinfo.value
+        compile_order(normalized, phase)
+    assert str(excinfo.value) == (
+        f"Unrecognized order for {phase.name} phase: {normalized}"
     )
 
 
@@ -230,3 +200,63 @@ def test_parse_syntax_invalid():
         "Unrecognized order for MOVEMENT phase: invalid order"
         in result.errors[0]
     )
+
+
+def reference_normalize(raw):
+    raw = raw.lower()
+    raw = raw.strip()
+    raw = re.sub(r"[‒–—―−]", "-", raw)
+    raw = re.sub(r"\s*[/]\s*", "_", raw)
+    raw = re.sub(r"[^a-z0-9\-_/\s]+", "", raw)
+    raw = re.sub(r"\s+", " ", raw)
+    raw = re.sub(r"\s*-\s*", " - ", raw)
+    return raw
+
+
+def test_normalize_matches_reference_on_random_input():
+    rng = random.Random(0)
+    alphabet = "aZ9_ -–/\t.!é s"
+    for _ in range(5000):
+        raw = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+        assert normalize_order_string(raw) == reference_normalize(raw)
+
+
+def test_parse_orders_bulk_preserves_input_order():
+    clear_parse_cache()
+    player_orders = {
+        "eng": ["lon - nth", "edi hold", "bogus"],
+        "fra": ["PAR hold", "lon - nth"],
+    }
+    results = parse_orders_bulk(player_orders, Phase.MOVEMENT)
+    assert [(r.player_id, r.raw) for r in results] == [
+        (player, raw)
+        for player, orders in player_orders.items()
+        for raw in orders
+    ]
+    assert [r.valid for r in results] == [True, True, False, True, True]
+    assert results[3].normalized == "par hold"
+    assert results[0].order == results[4].order
+    assert results[2].errors == ["Unrecognized order for MOVEMENT phase: bogus"]
+    for bulk in results:
+        single = parse_syntax(bulk.player_id, bulk.raw, Phase.MOVEMENT)
+        assert single == bulk
+
+
+def test_parse_cache_counts_hits_and_misses():
+    clear_parse_cache()
+    orders = {"eng": ["lon - nth", "lon - nth", "edi hold"]}
+    parse_orders_bulk(orders, Phase.MOVEMENT)
+    info = parse_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (0, 2, 2)
+    parse_orders_bulk(orders, Phase.MOVEMENT)
+    assert parse_cache_info().hits == 2
+    parse_orders_bulk(orders, Phase.RETREAT)
+    assert parse_cache_info().misses == 4
+
+
+def test_cached_results_do_not_share_errors():
+    clear_parse_cache()
+    first = parse_syntax("eng", "bogus", Phase.MOVEMENT)
+    first.errors.append("mutated")
+    second = parse_syntax("eng", "bogus", Phase.MOVEMENT)
+    assert second.errors == ["Unrecognized order for MOVEMENT phase: bogus"]
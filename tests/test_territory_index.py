@@ -0,0 +1,118 @@
+from diplomacy_cli.core.logic.territory_index import (
+    ARMY_MODES,
+    FLEET_MODES,
+    build_support_reach,
+    build_territory_index,
+    build_unit_adjacency,
+    is_adjacent,
+    neighbors,
+    territory_names,
+)
+
+
+def test_build_territory_index_assigns_dense_ordinals():
+    index = build_territory_index(
+        ["A", "B"],
+        {"A": [("B", "land"), ("C", "sea")], "B": [("A", "land")]},
+    )
+    assert index.names == ["A", "B", "C"]
+    assert index.ordinal == {"A": 0, "B": 1, "C": 2}
+    assert list(index.land.offsets) == [0, 1, 2, 2]
+    assert list(index.land.targets) == [1, 0]
+    assert list(index.sea.offsets) == [0, 1, 1, 1]
+    assert list(index.sea.targets) == [2]
+    assert list(index.both.targets) == []
+
+
+def test_neighbors_filters_by_mode():
+    index = build_territory_index(
+        ["A", "B", "C", "D"],
+        {"A": [("B", "land"), ("C", "sea"), ("D", "both")]},
+    )
+    a = index.ordinal["A"]
+    assert territory_names(index, neighbors(index, a)) == ["B", "C", "D"]
+    assert territory_names(index, neighbors(index, a, ARMY_MODES)) == [
+        "B",
+        "D",
+    ]
+    assert territory_names(index, neighbors(index, a, FLEET_MODES)) == [
+        "C",
+        "D",
+    ]
+
+
+def test_is_adjacent():
+    index = build_territory_index(
+        ["A", "B", "C"], {"A": [("B", "land")], "B": [("A", "land")]}
+    )
+    assert is_adjacent(index, "A", "B")
+    assert is_adjacent(index, "A", "B", ARMY_MODES)
+    assert not is_adjacent(index, "A", "B", FLEET_MODES)
+    assert not is_adjacent(index, "A", "C")
+    assert not is_adjacent(index, "A", "unknown")
+
+
+def test_classic_index_matches_adjacency_map(classic_rules):
+    index = classic_rules.index
+    assert set(index.names) == classic_rules.territory_ids
+    for src, adjacent in classic_rules.adjacency_map.items():
+        got = territory_names(index, neighbors(index, index.ordinal[src]))
+        assert sorted(got) == sorted(dst for dst, _ in adjacent)
+
+
+def test_build_unit_adjacency_splits_by_unit_type():
+    adjacency_map = {
+        "A": [("B", "land"), ("C", "sea"), ("D", "both")],
+        "B": [("A", "land")],
+    }
+    army = build_unit_adjacency(adjacency_map, ARMY_MODES)
+    fleet = build_unit_adjacency(adjacency_map, FLEET_MODES)
+    assert army == {"A": frozenset({"B", "D"}), "B": frozenset({"A"})}
+    assert fleet == {"A": frozenset({"C", "D"}), "B": frozenset()}
+
+
+def test_classic_unit_adjacency_matches_edges(classic_rules):
+    for unit_adjacency, modes in (
+        (classic_rules.army_adjacency, ARMY_MODES),
+        (classic_rules.fleet_adjacency, FLEET_MODES),
+    ):
+        pairs = {
+            (a, b) for a, targets in unit_adjacency.items() for b in targets
+        }
+        expected = {(a, b) for a, b, m in classic_rules.edges if m in modes}
+        assert pairs == expected
+
+
+def test_build_support_reach_is_coast_aware():
+    fleet_adjacency = {
+        "mao": frozenset({"spa_nc", "por"}),
+        "lyo": frozenset({"spa_sc", "mar"}),
+        "spa_sc": frozenset({"lyo", "mar"}),
+    }
+    reach = build_support_reach(
+        fleet_adjacency,
+        {"spa_nc": "spa", "spa_sc": "spa"},
+        {"spa": ["spa_nc", "spa_sc"]},
+    )
+    assert reach["spa"] == {"mao", "lyo"}
+    assert reach["spa_nc"] == reach["spa_sc"] == reach["spa"]
+    assert reach["mar"] == {"lyo", "spa_sc"}
+    assert "bre" not in reach
+
+
+def test_classic_support_reach_matches_adjacency(classic_rules):
+    for adjacency, reach in (
+        (classic_rules.army_adjacency, classic_rules.army_support_reach),
+        (classic_rules.fleet_adjacency, classic_rules.fleet_support_reach),
+    ):
+        for origin, targets in adjacency.items():
+            for target in targets:
+                assert origin in reach[target]
+        for target, origins in reach.items():
+            province = classic_rules.coast_to_parent.get(target, target)
+            positions = {
+                province,
+                *classic_rules.parent_to_coast.get(province, []),
+            }
+            for origin in origins:
+                assert adjacency[origin] & positions
@@ -0,0 +1,105 @@
+import pytest
+
+from diplomacy_cli.core.logic import variants
+from diplomacy_cli.core.logic.variants import (
+    InvalidVariantError,
+    check_start,
+    check_world,
+    clear_validation_memo,
+    list_variants,
+    validate_variant,
+)
+
+
+def test_list_variants():
+    assert "classic" in list_variants()
+
+
+def test_classic_is_valid_and_marked(tmp_path):
+    clear_validation_memo()
+    validate_variant("classic", cache_dir=tmp_path)
+    assert len(list((tmp_path / "rules").glob("classic-*.valid.json"))) == 1
+
+
+def test_validation_is_not_repeated(tmp_path, monkeypatch):
+    clear_validation_memo()
+    validate_variant("classic", cache_dir=tmp_path)
+    clear_validation_memo()
+
+    def fail(files):
+        raise AssertionError("variant re-validated")
+
+    monkeypatch.setattr(variants, "check_variant_files", fail)
+    validate_variant("classic", cache_dir=tmp_path)
+    validate_variant("classic", cache_dir=None)
+
+
+def test_skipped_schema_check_is_not_cached_as_pass(tmp_path, monkeypatch):
+    clear_validation_memo()
+    monkeypatch.setattr(variants, "schema_checks_available", lambda: False)
+    validate_variant("classic", cache_dir=tmp_path)
+    monkeypatch.setattr(variants, "schema_checks_available", lambda: True)
+    checked = []
+    check = variants.check_variant_files
+
+    def record(files):
+        checked.append(True)
+        return check(files)
+
+    monkeypatch.setattr(variants, "check_variant_files", record)
+    validate_variant("classic", cache_dir=tmp_path)
+    assert checked
+    assert len(list((tmp_path / "rules").glob("classic-*.valid.json"))) == 2
+    clear_validation_memo()
+
+
+def test_unknown_variant():
+    with pytest.raises(InvalidVariantError):
+        validate_variant("atlantis", cache_dir=None)
+
+
+def test_invalid_variant_is_not_cached(tmp_path, monkeypatch):
+    clear_validation_memo()
+    monkeypatch.setattr(variants, "check_variant_files", lambda f: ["broken"])
+    with pytest.raises(InvalidVariantError) as exc:
+        validate_variant("classic", cache_dir=tmp_path)
+    assert exc.value.problems == ["broken"]
+    assert not list(tmp_path.glob("**/*.valid.json"))
+    clear_validation_memo()
+
+
+def test_check_world_finds_graph_problems():
+    territories = {
+        "aaa": {"type": "land", "home_country": "eng", "coasts": ["nc"]},
+        "bbb": {"type": "land", "parent": "zzz"},
+        "ccc": {"type": "sea", "coasts": ["sc"]},
+    }
+    edges = [
+        {"from": "aaa", "to": "bbb", "mode": "land"},
+        {"from": "bbb", "to": "aaa", "mode": "land"},
+        {"from": "aaa_nc", "to": "ccc", "mode": "sea"},
+        {"from": "bbb", "to": "ddd", "mode": "fly"},
+    ]
+    problems = check_world(territories, edges, [{"id": "fra"}])
+    assert "aaa: unknown home country 'eng'" in problems
+    assert "aaa: home center is not a supply center" in problems
+    assert "bbb: parent 'zzz' does not exist" in problems
+    assert "ccc: sea territory cannot have coasts" in problems
+    assert "edge bbb-ddd: unknown mode 'fly'" in problems
+    assert "edge bbb-ddd: unknown territory 'ddd'" in problems
+    assert "edge aaa_nc-ccc (sea) has no reverse edge" in problems
+    assert not any("aaa-bbb" in p for p in problems)
+
+
+def test_check_start_finds_unknown_references():
+    problems = check_start(
+        {"aaa": {}},
+        [{"id": "eng"}],
+        [{"location_id": "bbb", "owner_id": "eng"}],
+        [{"territory_id": "aaa", "owner_id": "fra"}],
+        [{"nation_id": "eng"}],
+    )
+    assert problems == [
+        "unit at unknown territory 'bbb'",
+        "ownership by unknown nation 'fra'",
+    ]